@@ -1,5 +1,6 @@
+from functools import partial
 from flask import Flask
-from app.ext import db
+from app.ext import db, event_loop, JSONProvider
 from app.config import ApplicationConfig
 
 
@@ -18,28 +19,65 @@ def generate_tables(app):
         from app.model.m_SavingGoals import SavingGoals
         from app.model.m_SavingTransactions import SavingTransactions
         from app.model.m_Users import Users
+        from app.model.m_MonthlyRollups import MonthlyRollups
+        from app.model.m_ExpensesArchive import ExpensesArchive
+        from app.model.m_IncomeArchive import IncomeArchive
+        from app.model.m_UserShards import UserShards
 
         db.create_all()
 
+        # Shards hold every per-user table; the global ones stay on the primary
+        shard_tables = [t for t in db.metadata.sorted_tables if not t.info.get('global')]
+        for bind in app.config.get('SHARD_BINDS', []):
+            db.metadata.create_all(db.engines[bind], tables=shard_tables)
+
+
+class App(Flask):
+    def async_to_sync(self, func):
+        # Async views share the worker's event loop, and with it the async
+        # engines' connection pools
+        return partial(event_loop.run, func)
+
 
 def create_app():
-    app = Flask(__name__)
+    app = App(__name__)
+    app.json = JSONProvider(app)
     app.config.from_object(ApplicationConfig)
 
     # Register blueprints and extensions lazily
     from app.routes.r_users import users
     from app.routes.r_income import income
     from app.routes.r_expense import expense
+    from app.routes.r_internal import internal
     from flask_migrate import Migrate
-    from flask_session import Session
+    from app.commands import register_commands
+    from app.routes.functions import route_to_user_shard
+    from app.persistence.pool_metrics import use_timed_pool, instrument_engine
+    from app.persistence.sqlite_profile import apply_pragmas
+    from app.persistence.query_cache import init_query_cache
+    from app.persistence.user_cache import init_user_cache
+    from app.persistence.session_store import init_sessions
 
     app.register_blueprint(users)
     app.register_blueprint(income)
     app.register_blueprint(expense)
+    app.register_blueprint(internal)
 
+    use_timed_pool(app)
     db.init_app(app)
-    migrate = Migrate(app, db)
-    session = Session(app)
+    init_query_cache(app)
+    init_user_cache(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            instrument_engine(engine)
+            apply_pragmas(engine, app.config.get('SQLITE_PRAGMAS'))
+        # SQLite cannot ALTER most columns, so autogenerated migrations
+        # must recreate tables (batch mode)
+        render_as_batch = db.engine.dialect.name == 'sqlite'
+    migrate = Migrate(app, db, render_as_batch=render_as_batch)
+    init_sessions(app)
+    register_commands(app)
+    app.before_request(route_to_user_shard)
 
     generate_tables(app)
 
@@ -0,0 +1,389 @@
+"""Flask CLI commands for maintenance tasks (run with `flask <command>`)"""
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+def _databases(uow, user_id=None):
+    """The user's database when given, else every database holding user rows"""
+    if user_id is not None:
+        return [uow.shard_router.shard_for_user(user_id)]
+    return uow.databases()
+
+
+@click.command("rebuild-rollups")
+@click.option("--user-id", type=int, default=None, help="Only rebuild this user's rollups.")
+@with_appcontext
+def rebuild_rollups(user_id):
+    """Recompute monthly_rollups from the income and expense tables."""
+    from app.service import UOW
+
+    written = 0
+    for shard in _databases(UOW, user_id):
+        with UOW.on_shard(shard), UOW.transaction():
+            written += UOW.monthly_rollups.rebuild(user_id)
+
+    click.echo(f"Rebuilt {written} monthly rollup rows")
+
+
+@click.command("reconcile-balances")
+@click.option("--user-id", type=int, default=None, help="Only reconcile this user's balance.")
+@with_appcontext
+def reconcile_balances(user_id):
+    """Recompute users.current_value from the raw transaction rows."""
+    from app.service import UOW
+
+    updated = 0
+    for shard in _databases(UOW, user_id):
+        with UOW.on_shard(shard), UOW.transaction():
+            updated += UOW.users.reconcile_current_value(user_id)
+
+    click.echo(f"Reconciled {updated} user balances")
+
+
+@click.command("archive-transactions")
+@click.option("--horizon-days", type=int, default=None, help="Override ARCHIVE_HORIZON_DAYS.")
+@click.option("--chunk-size", type=int, default=1000, show_default=True, help="Rows moved per transaction.")
+@with_appcontext
+def archive_transactions(horizon_days, chunk_size):
+    """Move income and expenses older than the horizon into the archive tables."""
+    from app.service import UOW
+
+    if horizon_days is None:
+        horizon_days = current_app.config["ARCHIVE_HORIZON_DAYS"]
+    cutoff = date.today() - timedelta(days=horizon_days)
+
+    # One short transaction per chunk keeps row locks and undo small
+    for label, repo in (("income", UOW.incomes), ("expense", UOW.expenses)):
+        total = 0
+        for shard in UOW.databases():
+            with UOW.on_shard(shard):
+                while True:
+                    with UOW.transaction():
+                        moved = repo.archive_before(cutoff, chunk_size)
+                    total += moved
+                    if moved < chunk_size:
+                        break
+        click.echo(f"Archived {total} {label} rows dated before {cutoff}")
+
+
+@click.command("move-user-shard")
+@click.option("--user-id", type=int, required=True, help="User to move.")
+@click.option("--to", "target", required=True, help='Destination bind from SHARD_BINDS, or "primary".')
+@with_appcontext
+def move_user_shard(user_id, target):
+    """Move all of a user's rows to another shard (rebalancing)."""
+    from app.service import UOW
+
+    target = None if target == "primary" else target
+    if target not in UOW.databases():
+        raise click.BadParameter(f"unknown shard {target!r}", param_hint="--to")
+
+    copied = UOW.shard_router.move_user(user_id, target)
+    click.echo(f"Moved user {user_id} to {target or 'primary'} ({copied} rows)")
+
+
+def _percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _bench_user(uow, seed_rows):
+    """Register a throwaway user with one category and ``seed_rows`` expenses"""
+    from app.domain.entities import Category, Expense
+    from app.use_cases.create_user import CreateUserUseCase
+
+    password = uuid.uuid4().hex
+    user = CreateUserUseCase(uow).execute({
+        "firstname": "Bench",
+        "lastname": "Workload",
+        "email": f"bench-{uuid.uuid4().hex[:12]}@example.com",
+        "password_hash": password,
+        "password2": password,
+    })
+    uow.route_to_user(user.id)
+    with uow.transaction():
+        category = uow.categories.save(Category(user_id=user.id, type="expense", name="Bench"))
+    today = date.today()
+    with uow.batch():
+        uow.expenses.save_many([
+            Expense(
+                user_id=user.id,
+                category_id=category.id,
+                amount=(i % 500) + 1,
+                expense_date=today - timedelta(days=i % 365),
+                name=f"Seed {i}",
+                payee="Bench",
+            )
+            for i in range(seed_rows)
+        ])
+        uow.monthly_rollups.rebuild(user.id)
+        uow.users.reconcile_current_value(user.id)
+    return user.id, category.id
+
+
+@click.command("bench-workload")
+@click.option("--readers", type=int, default=8, show_default=True, help="Threads rendering dashboards and list pages.")
+@click.option("--writers", type=int, default=2, show_default=True, help="Threads recording expenses.")
+@click.option("--seconds", type=float, default=10.0, show_default=True, help="How long to run.")
+@click.option("--seed-rows", type=int, default=2000, show_default=True, help="Expenses created before the run.")
+@with_appcontext
+def bench_workload(readers, writers, seconds, seed_rows):
+    """Run a mixed read/write workload against the configured database.
+
+    Use the same options against each deployment profile (e.g. a MySQL
+    DATABASE_URI, then a SQLite file) to compare them. The run creates and
+    finally deletes its own user, so point it at a scratch database.
+    """
+    from app.ext import db
+    from app.persistence import create_unit_of_work
+    from app.use_cases.expense.create_expense import CreateExpenseUseCase
+
+    app = current_app._get_current_object()
+    uow = create_unit_of_work()
+    user_id, category_id = _bench_user(uow, seed_rows)
+
+    latencies = {"read": [], "write": []}
+    errors = {"read": 0, "write": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def run(kind):
+        with app.app_context():
+            worker_uow = create_unit_of_work()
+            worker_uow.route_to_user(user_id)
+            expenses = CreateExpenseUseCase(worker_uow)
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    if kind == "read":
+                        with worker_uow.read_only():
+                            worker_uow.dashboard.get_summary(user_id, date.today())
+                            worker_uow.expenses.get_list_page_by_user_id(user_id, 20)
+                        worker_uow.rollback()
+                    else:
+                        expenses.execute({
+                            "user_id": user_id,
+                            "category_id": category_id,
+                            "name": "Bench",
+                            "payee": "Bench",
+                            "amount": "12.34",
+                            "expense_date": date.today().isoformat(),
+                            "payment_method": "cash",
+                        })
+                except Exception:
+                    worker_uow.rollback()
+                    with lock:
+                        errors[kind] += 1
+                    continue
+                elapsed = time.perf_counter() - start
+                with lock:
+                    latencies[kind].append(elapsed)
+
+    threads = [threading.Thread(target=run, args=("read",)) for _ in range(readers)]
+    threads += [threading.Thread(target=run, args=("write",)) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with uow.transaction():
+        uow.users.delete(user_id)
+
+    click.echo(f"{db.engine.url.get_backend_name()}: {readers} readers, {writers} writers, {seconds:g}s")
+    for kind in ("read", "write"):
+        samples = latencies[kind]
+        click.echo(
+            f"  {kind:5} {len(samples) / seconds:8.1f} ops/s"
+            f"  p50 {_percentile(samples, 0.50) * 1000:7.2f} ms"
+            f"  p95 {_percentile(samples, 0.95) * 1000:7.2f} ms"
+            f"  p99 {_percentile(samples, 0.99) * 1000:7.2f} ms"
+            f"  errors {errors[kind]}"
+        )
+
+
+def _best_of(repeat, fn):
+    """Fastest of ``repeat`` timed runs of fn(), in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _bench_hydration(rows, repeat):
+    """Validating constructor vs from_row for rows as read from the database"""
+    from app.domain.entities import Expense
+    from app.domain.money import Money
+
+    today = date.today()
+    data = [
+        {
+            "id": i + 1,
+            "user_id": 1,
+            "category_id": 1,
+            "amount": Money.of(12.5),
+            "expense_date": today,
+            "name": f"Row {i}",
+            "payee": "Bench",
+            "payment_method": "cash",
+            "remarks": "",
+        }
+        for i in range(rows)
+    ]
+    return [
+        ("Expense(**row)", _best_of(repeat, lambda: [Expense(**row) for row in data])),
+        ("Expense.from_row(**row)", _best_of(repeat, lambda: [Expense.from_row(**row) for row in data])),
+    ]
+
+
+def _bench_projections(user_id, rows, repeat):
+    """Full ORM loads vs the column projections of the list and analytics paths"""
+    from app.ext import db
+    from app.model.m_Expenses import Expenses as ExpenseORM
+    from app.persistence.repositories import ExpenseRepositoryImpl
+
+    # The bare repository, so the query cache does not answer the calls
+    expenses = ExpenseRepositoryImpl()
+
+    def timed(fn):
+        def run():
+            fn()
+            # Start every run from an empty identity map
+            db.session.expunge_all()
+        return _best_of(repeat, run)
+
+    return [
+        ("ExpenseORM.query.filter_by(user_id).all()", timed(lambda: ExpenseORM.query.filter_by(user_id=user_id).all())),
+        ("get_all_by_user_id (ORM + entities)", timed(lambda: expenses.get_all_by_user_id(user_id))),
+        ("get_summaries_by_user_id", timed(lambda: expenses.get_summaries_by_user_id(user_id))),
+        ("get_list_page_by_user_id (all rows)", timed(lambda: expenses.get_list_page_by_user_id(user_id, rows))),
+    ]
+
+
+def _bench_statements(email, lookups, repeat):
+    """A Query rebuilt per call vs the prebuilt select behind get_by_email"""
+    from app.model.m_Users import Users as UserORM
+    from app.persistence.repositories import UserRepositoryImpl
+
+    users = UserRepositoryImpl()
+    rebuilt = _best_of(repeat, lambda: [UserORM.query.filter_by(email=email).first() for _ in range(lookups)])
+    prebuilt = _best_of(repeat, lambda: [users.get_by_email(email) for _ in range(lookups)])
+    return [
+        ("UserORM.query.filter_by(email).first()", rebuilt / lookups),
+        ("get_by_email (prebuilt select)", prebuilt / lookups),
+    ]
+
+
+@click.command("bench-reads")
+@click.option("--rows", type=int, default=25000, show_default=True, help="Rows per measurement.")
+@click.option("--lookups", type=int, default=5000, show_default=True, help="User lookups per statement run.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Runs per measurement; the best is reported.")
+@with_appcontext
+def bench_reads(rows, lookups, repeat):
+    """Time the read-path optimisations against the code they replaced.
+
+    Reports the best of --repeat runs for each variant. The database runs
+    create and finally delete their own user, so point it at a scratch
+    database.
+    """
+    from app.persistence import create_unit_of_work
+
+    click.echo(f"hydration, {rows} expenses")
+    for label, seconds in _bench_hydration(rows, repeat):
+        click.echo(f"  {label:45} {seconds * 1000:9.1f} ms")
+
+    uow = create_unit_of_work()
+    user_id, _ = _bench_user(uow, rows)
+    try:
+        click.echo(f"projections, {rows} expenses")
+        for label, seconds in _bench_projections(user_id, rows, repeat):
+            click.echo(f"  {label:45} {seconds * 1000:9.1f} ms")
+        click.echo(f"statements, {lookups} user lookups by email")
+        email = uow.users.get_by_id(user_id).email
+        for label, seconds in _bench_statements(email, lookups, repeat):
+            click.echo(f"  {label:45} {seconds * 1e6:9.1f} us/call")
+    finally:
+        uow.rollback()
+        with uow.transaction():
+            uow.users.delete(user_id)
+
+
+def _session_request(app, cookie, values):
+    """One request's worth of session work (open, read, save); returns the cookie"""
+    from flask import session
+
+    headers = {"Cookie": f"{app.config['SESSION_COOKIE_NAME']}={cookie}"} if cookie else {}
+    # Pushing the request context opens the session
+    with app.test_request_context("/", headers=headers):
+        session.get("user_id")
+        if values:
+            session.update(values)
+        response = app.response_class()
+        app.session_interface.save_session(app, session._get_current_object(), response)
+    set_cookie = response.headers.get("Set-Cookie")
+    if set_cookie:
+        return set_cookie.split(";", 1)[0].split("=", 1)[1]
+    return cookie
+
+
+@click.command("bench-sessions")
+@click.option("--requests", "count", type=int, default=2000, show_default=True, help="Requests per phase.")
+@with_appcontext
+def bench_sessions(count):
+    """Measure the per-request cost of the configured session backend.
+
+    Times opening and saving a logged-in session, once left unchanged (most
+    page views) and once modified on every request, and counts the queries
+    each request sends. Run it with each SESSION_TYPE to compare backends.
+    """
+    from sqlalchemy import event
+    from app.ext import db
+
+    app = current_app._get_current_object()
+    statements = []
+
+    def count_statement(*args):
+        statements.append(1)
+
+    engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        cookie = _session_request(app, None, {"user_id": 0})
+        click.echo(f"{app.config['SESSION_TYPE']}: {count} requests per phase")
+        for label, modified in (("unchanged", False), ("modified", True)):
+            samples = []
+            statements.clear()
+            for i in range(count):
+                start = time.perf_counter()
+                cookie = _session_request(app, cookie, {"bench": i} if modified else {})
+                samples.append(time.perf_counter() - start)
+            click.echo(
+                f"  {label:9}"
+                f"  p50 {_percentile(samples, 0.50) * 1000:7.3f} ms"
+                f"  p95 {_percentile(samples, 0.95) * 1000:7.3f} ms"
+                f"  p99 {_percentile(samples, 0.99) * 1000:7.3f} ms"
+                f"  {len(statements) / count:5.2f} queries/request"
+            )
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+
+def register_commands(app):
+    """Attach the maintenance commands to the app's CLI"""
+    app.cli.add_command(rebuild_rollups)
+    app.cli.add_command(reconcile_balances)
+    app.cli.add_command(archive_transactions)
+    app.cli.add_command(move_user_shard)
+    app.cli.add_command(bench_workload)
+    app.cli.add_command(bench_reads)
+    app.cli.add_command(bench_sessions)
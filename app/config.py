@@ -5,11 +5,123 @@ from datetime import timedelta
 
 load_dotenv()
 
+# asyncio driver for each backend, used to derive the async URIs
+_ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite', 'mysql': 'mysql+aiomysql'}
+
+
+def to_async_uri(uri):
+    """Swap a database URI's driver for its asyncio counterpart"""
+    if not uri:
+        return uri
+    scheme, sep, rest = uri.partition('://')
+    return f"{_ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}{sep}{rest}"
+
+
+def engine_options(uri):
+    """
+    Connection pool settings from the environment. In-memory SQLite gets
+    none: Flask-SQLAlchemy gives it a StaticPool, which takes no sizes.
+    """
+    if not uri or uri.split('?')[0] in ('sqlite://', 'sqlite:///', 'sqlite:///:memory:'):
+        return {}
+    return {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+        # Seconds to wait for a free connection before raising
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '30')),
+        # Replace connections older than this, below MySQL's wait_timeout
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        # Test connections on checkout so ones dropped by the server are replaced
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    }
+
+
+def sqlite_pragmas():
+    """
+    PRAGMAs run on every new SQLite connection. WAL lets readers run
+    alongside the single writer; synchronous=NORMAL is durable across
+    application crashes under WAL (only an OS crash can lose the last
+    commits). A negative cache_size is in KiB.
+    """
+    return {
+        'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))),
+        'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', '-65536')),
+        # Milliseconds a writer waits for the write lock before "database is locked"
+        'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', '5000')),
+        # Enforce the ON DELETE CASCADE foreign keys, as InnoDB does
+        'foreign_keys': 'ON',
+    }
+
+
+def split_uris(value):
+    """Parse a comma-separated list of database URIs"""
+    return [uri.strip() for uri in (value or '').split(',') if uri.strip()]
+
 class ApplicationConfig:
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URI')
+    # Optional read replica; read-only work is routed to it by the unit of work
+    REPLICA_DATABASE_URI = os.getenv('REPLICA_DATABASE_URI')
+    # Optional user-id shards; the primary keeps the shard directory and sessions
+    SHARD_DATABASE_URIS = split_uris(os.getenv('SHARD_DATABASE_URIS'))
+    SHARD_BINDS = [f'shard_{i}' for i in range(len(SHARD_DATABASE_URIS))]
+    # Optional replica per shard, listed in SHARD_DATABASE_URIS order (the
+    # list may stop early). A shard's reads use its own replica, or else the
+    # shard itself; REPLICA_DATABASE_URI only replicates the primary
+    SHARD_REPLICA_DATABASE_URIS = split_uris(os.getenv('SHARD_REPLICA_DATABASE_URIS'))[:len(SHARD_BINDS)]
+    SHARD_REPLICA_BINDS = [f'{bind}_replica' for bind in SHARD_BINDS[:len(SHARD_REPLICA_DATABASE_URIS)]]
+    # Optional database of its own for the sessions table (SESSION_TYPE=sqlalchemy)
+    SESSION_DATABASE_URI = os.getenv('SESSION_DATABASE_URI')
+    SQLALCHEMY_BINDS = {
+        **({'replica': REPLICA_DATABASE_URI} if REPLICA_DATABASE_URI else {}),
+        **dict(zip(SHARD_BINDS, SHARD_DATABASE_URIS)),
+        **dict(zip(SHARD_REPLICA_BINDS, SHARD_REPLICA_DATABASE_URIS)),
+        **({'sessions': SESSION_DATABASE_URI} if SESSION_DATABASE_URI else {}),
+    }
+    # Applied to every bind (primary, replicas, shards); pools are per worker process
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    # Embedded profile: set on each connection of an on-disk SQLite bind
+    SQLITE_PRAGMAS = sqlite_pragmas()
+    # Shared secret for GET /internal/pool-stats (endpoint is disabled when unset)
+    INTERNAL_STATS_TOKEN = os.getenv('INTERNAL_STATS_TOKEN')
+    # After a commit, keep the user's reads on the primary for this long
+    REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '5'))
+    # Same databases through asyncio drivers, for the async views
+    ASYNC_DATABASE_URI = os.getenv('ASYNC_DATABASE_URI') or to_async_uri(SQLALCHEMY_DATABASE_URI)
+    ASYNC_REPLICA_DATABASE_URI = os.getenv('ASYNC_REPLICA_DATABASE_URI') or to_async_uri(REPLICA_DATABASE_URI)
+    ASYNC_SHARD_DATABASE_URIS = split_uris(os.getenv('ASYNC_SHARD_DATABASE_URIS')) or [
+        to_async_uri(uri) for uri in SHARD_DATABASE_URIS
+    ]
+    ASYNC_SHARD_REPLICA_DATABASE_URIS = split_uris(os.getenv('ASYNC_SHARD_REPLICA_DATABASE_URIS')) or [
+        to_async_uri(uri) for uri in SHARD_REPLICA_DATABASE_URIS
+    ]
+    # Repository query cache: filesystem (shared by the workers of one host,
+    # under QUERY_CACHE_DIR), simple (entries in each worker's memory) or null
+    # (off). Versions are kept under QUERY_CACHE_DIR either way
+    QUERY_CACHE_TYPE = os.getenv('QUERY_CACHE_TYPE', 'filesystem')
+    QUERY_CACHE_DIR = os.getenv('QUERY_CACHE_DIR', '/tmp/finance-query-cache')
+    QUERY_CACHE_THRESHOLD = int(os.getenv('QUERY_CACHE_THRESHOLD', '2000'))
+    QUERY_CACHE_TIMEOUT = int(os.getenv('QUERY_CACHE_TIMEOUT', '300'))
+    # In-process cache of the logged-in user, resolved once per request
+    USER_CACHE_TIMEOUT = int(os.getenv('USER_CACHE_TIMEOUT', '60'))
+    USER_CACHE_THRESHOLD = int(os.getenv('USER_CACHE_THRESHOLD', '1000'))
+    # `flask archive-transactions` moves income/expenses older than this to the archive tables
+    ARCHIVE_HORIZON_DAYS = int(os.getenv('ARCHIVE_HORIZON_DAYS', '730'))
     SECRET_KEY = os.getenv('SECRET_KEY')
-    SESSION_TYPE = os.getenv('SESSION_TYPE')
+    # cookie (signed, nothing stored), cachelib (files under SESSION_FILE_DIR)
+    # or sqlalchemy (the sessions table); see app/persistence/session_store.py
+    SESSION_TYPE = os.getenv('SESSION_TYPE', 'sqlalchemy')
     SESSION_SQLALCHEMY = db
+    SESSION_SQLALCHEMY_BIND_KEY = 'sessions' if SESSION_DATABASE_URI else None
+    SESSION_SERIALIZATION_FORMAT = os.getenv('SESSION_SERIALIZATION_FORMAT', 'msgpack')
+    SESSION_FILE_DIR = os.getenv('SESSION_FILE_DIR', '/tmp/finance-sessions')
+    SESSION_FILE_THRESHOLD = int(os.getenv('SESSION_FILE_THRESHOLD', '10000'))
+    # Unchanged sessions rewrite their row (to slide the expiry) at most this often
+    SESSION_REFRESH_INTERVAL = int(os.getenv('SESSION_REFRESH_INTERVAL', '300'))
+    # Background deletion of expired session rows; 0 leaves it to `flask session_cleanup`
+    SESSION_PURGE_INTERVAL = int(os.getenv('SESSION_PURGE_INTERVAL', '3600'))
+    SESSION_PURGE_CHUNK_SIZE = int(os.getenv('SESSION_PURGE_CHUNK_SIZE', '1000'))
     SESSION_PERMANENT = os.getenv('SESSION_PERMANENT').lower() == 'false'
     SESSION_USE_SIGNER = os.getenv('SESSION_USE_SIGNER').lower() == 'true'
     PERMANENT_SESSION_LIFETIME = timedelta(int(os.getenv('PERMANENT_SESSION_LIFETIME')))
\ No newline at end of file
@@ -9,6 +9,7 @@ from app.domain.entities import (
     SavingGoal,
 )
 from app.domain.exceptions import DomainError
+from app.domain.money import Money
 
 __all__ = [
     "User",
@@ -18,4 +19,5 @@ __all__ = [
     "Expense",
     "SavingGoal",
     "DomainError",
+    "Money",
 ]
@@ -1,6 +1,7 @@
 """Debt Domain Entity"""
 from datetime import date
 from app.domain.exceptions import InvalidDebtError
+from app.domain.money import Money
 
 
 class Debt:
@@ -19,7 +20,7 @@ class Debt:
         self,
         user_id: int,
         lender: str,
-        principal: float,
+        principal: Money,
         interest_rate: float,
         start_date: date,
         due_date: date,
@@ -54,6 +55,39 @@ class Debt:
         self.name = name or f"Debt to {self.lender}"
         self.status = self._validate_status(status)
     
+    @classmethod
+    def from_row(
+        cls,
+        *,
+        user_id: int,
+        lender: str,
+        principal: Money,
+        interest_rate: float,
+        start_date: date,
+        due_date: date,
+        name: str = None,
+        status: str = "active",
+        id: int = None,
+    ) -> "Debt":
+        """
+        Rebuild a Debt from persisted data without re-running validation.
+        
+        Only for values read back from the database. Besides being cheaper,
+        this lets overdue debts load, since the constructor rejects a
+        due_date in the past.
+        """
+        debt = cls.__new__(cls)
+        debt.id = id
+        debt.user_id = user_id
+        debt.lender = lender
+        debt.principal = principal
+        debt.interest_rate = interest_rate
+        debt.start_date = start_date
+        debt.due_date = due_date
+        debt.name = name or f"Debt to {lender}"
+        debt.status = status
+        return debt
+    
     @staticmethod
     def _validate_user_id(user_id: int) -> int:
         """Validate user ID"""
@@ -75,15 +109,15 @@ class Debt:
         return lender
     
     @staticmethod
-    def _validate_principal(principal: float) -> float:
+    def _validate_principal(principal) -> Money:
         """
         Validate principal amount.
         
         Business Rule: Minimum principal is 100 PHP
         """
         try:
-            principal = float(principal)
-        except (TypeError, ValueError):
+            principal = Money.of(principal)
+        except ValueError:
             raise InvalidDebtError("principal must be a number")
         
         if principal < Debt.MIN_PRINCIPAL:
@@ -169,7 +203,7 @@ class Debt:
             raise InvalidDebtError("Debt is already active")
         self.status = "active"
     
-    def update_terms(self, principal: float = None, interest_rate: float = None) -> None:
+    def update_terms(self, principal: Money = None, interest_rate: float = None) -> None:
         """
         Update debt terms with validation.
         
@@ -186,9 +220,9 @@ class Debt:
         if interest_rate is not None:
             self.interest_rate = self._validate_interest_rate(interest_rate)
     
-    def calculate_interest_amount(self, months: int = 12) -> float:
-        """Calculate interest accrued over a period"""
-        return self.principal * (self.interest_rate / 100) * (months / 12)
+    def calculate_interest_amount(self, months: int = 12) -> Money:
+        """Calculate interest accrued over a period (rounded to the centavo)"""
+        return Money.of(self.principal) * (self.interest_rate / 100 * months / 12)
     
     def __repr__(self) -> str:
         return (
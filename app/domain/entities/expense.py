@@ -1,6 +1,7 @@
 """Expense Domain Entity"""
 from datetime import date, datetime
 from app.domain.exceptions import InvalidExpenseError
+from app.domain.money import Money
 
 
 class Expense:
@@ -16,7 +17,7 @@ class Expense:
         self,
         user_id: int,
         category_id: int,
-        amount: float,
+        amount: Money,
         expense_date: date,
         name: str,
         payee: str,
@@ -53,6 +54,38 @@ class Expense:
         self.payment_method = self._validate_payment_method(payment_method)
         self.remarks = remarks.strip() if isinstance(remarks, str) else ""
     
+    @classmethod
+    def from_row(
+        cls,
+        *,
+        user_id: int,
+        category_id: int,
+        amount: Money,
+        expense_date,
+        name: str,
+        payee: str,
+        payment_method: str,
+        remarks: str = None,
+        id: int = None,
+    ) -> "Expense":
+        """
+        Rebuild an Expense from persisted data without re-running validation.
+        
+        Only for values read back from the database, which were validated
+        on the way in. Use the constructor for anything user supplied.
+        """
+        expense = cls.__new__(cls)
+        expense.id = id
+        expense.user_id = user_id
+        expense.category_id = category_id
+        expense.name = name
+        expense.payee = payee
+        expense.amount = amount
+        expense.expense_date = expense_date.date() if isinstance(expense_date, datetime) else expense_date
+        expense.payment_method = payment_method
+        expense.remarks = remarks or ""
+        return expense
+    
     @staticmethod
     def _validate_user_id(user_id: int) -> int:
         if not isinstance(user_id, int) or user_id <= 0:
@@ -90,10 +123,10 @@ class Expense:
         return payee
     
     @staticmethod
-    def _validate_amount(amount: float) -> float:
+    def _validate_amount(amount) -> Money:
         try:
-            amount = float(amount)
-        except (TypeError, ValueError):
+            amount = Money.of(amount)
+        except ValueError:
             raise InvalidExpenseError("amount must be a number")
         
         if amount <= 0:
@@ -134,7 +167,7 @@ class Expense:
         self,
         name: str = None,
         payee: str = None,
-        amount: float = None,
+        amount: Money = None,
         payment_method: str = None,
         remarks: str = None
     ) -> None:
@@ -1,6 +1,7 @@
 """Income Domain Entity"""
 from datetime import date
 from app.domain.exceptions import InvalidIncomeError
+from app.domain.money import Money
 
 
 class Income:
@@ -16,7 +17,7 @@ class Income:
         self,
         user_id: int,
         category_id: int,
-        amount: float,
+        amount: Money,
         received_date: date,
         name: str,
         source: str,
@@ -53,6 +54,38 @@ class Income:
         self.payment_method = self._validate_payment_method(payment_method)
         self.remarks = remarks.strip() if isinstance(remarks, str) else ""
     
+    @classmethod
+    def from_row(
+        cls,
+        *,
+        user_id: int,
+        category_id: int,
+        amount: Money,
+        received_date: date,
+        name: str,
+        source: str,
+        payment_method: str,
+        remarks: str = None,
+        id: int = None,
+    ) -> "Income":
+        """
+        Rebuild an Income from persisted data without re-running validation.
+        
+        Only for values read back from the database, which were validated
+        on the way in. Use the constructor for anything user supplied.
+        """
+        income = cls.__new__(cls)
+        income.id = id
+        income.user_id = user_id
+        income.category_id = category_id
+        income.name = name
+        income.source = source
+        income.amount = amount
+        income.received_date = received_date
+        income.payment_method = payment_method
+        income.remarks = remarks or ""
+        return income
+    
     @staticmethod
     def _validate_user_id(user_id: int) -> int:
         if not isinstance(user_id, int) or user_id <= 0:
@@ -91,10 +124,10 @@ class Income:
         return source
     
     @staticmethod
-    def _validate_amount(amount: float) -> float:
+    def _validate_amount(amount) -> Money:
         try:
-            amount = float(amount)
-        except (TypeError, ValueError):
+            amount = Money.of(amount)
+        except ValueError:
             raise InvalidIncomeError("amount must be a number")
         
         if amount <= 0:
@@ -130,7 +163,7 @@ class Income:
         self,
         name: str = None,
         source: str = None,
-        amount: float = None,
+        amount: Money = None,
         payment_method: str = None,
         remarks: str = None
     ) -> None:
@@ -1,6 +1,7 @@
 """SavingGoal Domain Entity"""
 from datetime import date
 from app.domain.exceptions import InvalidSavingGoalError
+from app.domain.money import Money
 
 
 class SavingGoal:
@@ -14,7 +15,7 @@ class SavingGoal:
         self,
         user_id: int,
         name: str,
-        target_amount: float,
+        target_amount: Money,
         target_date: date,
         remarks: str = "",
         id: int = None
@@ -39,7 +40,36 @@ class SavingGoal:
         self.target_amount = self._validate_target_amount(target_amount)
         self.target_date = self._validate_target_date(target_date)
         self.remarks = remarks.strip() if isinstance(remarks, str) else ""
-        self.current_amount = 0.0  # Tracked separately
+        self.current_amount = Money()  # Tracked separately
+    
+    @classmethod
+    def from_row(
+        cls,
+        *,
+        user_id: int,
+        name: str,
+        target_amount: Money,
+        target_date: date,
+        remarks: str = None,
+        id: int = None,
+        current_amount: Money = Money(),
+    ) -> "SavingGoal":
+        """
+        Rebuild a SavingGoal from persisted data without re-running validation.
+        
+        Only for values read back from the database. Besides being cheaper,
+        this lets goals past their target_date load, since the constructor
+        rejects dates in the past.
+        """
+        goal = cls.__new__(cls)
+        goal.id = id
+        goal.user_id = user_id
+        goal.name = name
+        goal.target_amount = target_amount
+        goal.target_date = target_date
+        goal.remarks = remarks or ""
+        goal.current_amount = current_amount
+        return goal
     
     @staticmethod
     def _validate_user_id(user_id: int) -> int:
@@ -60,10 +90,10 @@ class SavingGoal:
         return name
     
     @staticmethod
-    def _validate_target_amount(amount: float) -> float:
+    def _validate_target_amount(amount) -> Money:
         try:
-            amount = float(amount)
-        except (TypeError, ValueError):
+            amount = Money.of(amount)
+        except ValueError:
             raise InvalidSavingGoalError("target_amount must be a number")
         
         if amount <= 0:
@@ -84,7 +114,7 @@ class SavingGoal:
     def update(
         self,
         name: str = None,
-        target_amount: float = None,
+        target_amount: Money = None,
         target_date: date = None,
         remarks: str = None
     ) -> None:
@@ -105,7 +135,7 @@ class SavingGoal:
         """Calculate progress towards goal (0-100%)"""
         if self.target_amount <= 0:
             return 0.0
-        return min(100.0, (self.current_amount / self.target_amount) * 100)
+        return min(100.0, (Money.of(self.current_amount) / self.target_amount) * 100)
     
     def is_completed(self) -> bool:
         """Check if goal has been met"""
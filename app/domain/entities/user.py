@@ -1,6 +1,7 @@
 """User Domain Entity - Pure business logic, no database access"""
 import re
 from app.domain.exceptions import InvalidUserError
+from app.domain.money import Money
 
 
 class User:
@@ -31,7 +32,7 @@ class User:
         self.lastname = self._validate_name(lastname, "lastname")
         self.email = self._validate_email(email)
         self.password_hash = password_hash
-        self.current_value = 0.0  # Will be calculated by domain services
+        self.current_value = Money()  # Will be calculated by domain services
     
     @staticmethod
     def _validate_name(name: str, field_name: str) -> str:
@@ -0,0 +1,167 @@
+"""Money Value Object - Amounts held as integer minor units (centavos)"""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import total_ordering
+from numbers import Number
+
+_MINOR_UNITS = 100
+_CENT = Decimal("0.01")
+
+
+def _round_cents(value: Decimal) -> int:
+    return int(value.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+@total_ordering
+class Money:
+    """
+    Money Value Object
+
+    An amount of PHP stored as a whole number of centavos, so sums and
+    differences are exact. Plain numbers (int, float, Decimal, numeric
+    strings) are read as pesos wherever a Money is expected: comparisons,
+    addition and Money.of().
+    """
+
+    __slots__ = ("cents",)
+
+    def __init__(self, cents: int = 0):
+        """
+        Args:
+            cents: Amount in centavos
+
+        Raises:
+            TypeError: If cents is not an integer
+        """
+        if isinstance(cents, bool) or not isinstance(cents, int):
+            raise TypeError(f"Money needs an integer number of cents, got {cents!r}")
+        object.__setattr__(self, "cents", cents)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Money is immutable")
+
+    @classmethod
+    def of(cls, value) -> "Money":
+        """
+        Parse an amount in pesos, rounding half up to the centavo.
+
+        Args:
+            value: Money, int, float, Decimal or numeric string
+
+        Raises:
+            ValueError: If value is not a finite number
+        """
+        if isinstance(value, Money):
+            return value
+        if isinstance(value, bool) or value is None:
+            raise ValueError(f"{value!r} is not an amount")
+        if isinstance(value, int):
+            return cls(value * _MINOR_UNITS)
+        try:
+            # str() keeps floats like 0.1 at their shortest decimal form
+            amount = Decimal(value.strip() if isinstance(value, str) else str(value))
+        except (InvalidOperation, TypeError, ValueError):
+            raise ValueError(f"{value!r} is not an amount")
+        if not amount.is_finite():
+            raise ValueError(f"{value!r} is not an amount")
+        return cls(_round_cents(amount * _MINOR_UNITS))
+
+    @classmethod
+    def from_cents(cls, value) -> "Money":
+        """Build from a stored or aggregated cents value (None counts as zero)"""
+        if isinstance(value, Money):
+            return value
+        return cls(int(value or 0))
+
+    def to_decimal(self) -> Decimal:
+        """Amount in pesos as an exact Decimal with two places"""
+        return (Decimal(self.cents) / _MINOR_UNITS).quantize(_CENT)
+
+    # Arithmetic
+
+    def __add__(self, other) -> "Money":
+        if not isinstance(other, (Money, Number, str)):
+            return NotImplemented
+        return Money(self.cents + Money.of(other).cents)
+
+    def __radd__(self, other) -> "Money":
+        # sum() starts from the int 0
+        return self.__add__(other)
+
+    def __sub__(self, other) -> "Money":
+        if not isinstance(other, (Money, Number, str)):
+            return NotImplemented
+        return Money(self.cents - Money.of(other).cents)
+
+    def __rsub__(self, other) -> "Money":
+        if not isinstance(other, (Number, str)):
+            return NotImplemented
+        return Money(Money.of(other).cents - self.cents)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.cents)
+
+    def __abs__(self) -> "Money":
+        return Money(abs(self.cents))
+
+    def __mul__(self, factor) -> "Money":
+        if isinstance(factor, int) and not isinstance(factor, bool):
+            return Money(self.cents * factor)
+        if isinstance(factor, (float, Decimal)):
+            return Money(_round_cents(Decimal(self.cents) * Decimal(str(factor))))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """Money / Money is a plain ratio; Money / number is a rounded share"""
+        if isinstance(other, Money):
+            return self.cents / other.cents
+        if isinstance(other, (int, float, Decimal)) and not isinstance(other, bool):
+            return Money(_round_cents(Decimal(self.cents) / Decimal(str(other))))
+        return NotImplemented
+
+    def __round__(self, ndigits=None):
+        """round(m) gives whole pesos as an int; round(m, n) stays Money"""
+        if ndigits is None:
+            return _round_cents(self.to_decimal())
+        return Money.of(self.to_decimal().quantize(Decimal(1).scaleb(-ndigits), rounding=ROUND_HALF_UP))
+
+    # Comparison
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Money):
+            return self.cents == other.cents
+        if isinstance(other, Number) and not isinstance(other, bool):
+            return self.to_decimal() == Decimal(str(other))
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, Money):
+            return self.cents < other.cents
+        if isinstance(other, Number) and not isinstance(other, bool):
+            return self.to_decimal() < Decimal(str(other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Equal to the number of pesos it holds, so hash like it
+        return hash(self.to_decimal())
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    # Conversion
+
+    def __float__(self) -> float:
+        return self.cents / _MINOR_UNITS
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+    def __format__(self, spec: str) -> str:
+        return format(self.to_decimal(), spec) if spec else str(self)
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    def __reduce__(self):
+        return (Money, (self.cents,))
@@ -1,6 +1,7 @@
 from abc import ABC
 from app.utils.exceptions.PolicyError import PolicyError
 from app.ext import db
+from app.domain.money import Money
 import re
 from datetime import date, datetime
 
@@ -91,6 +92,30 @@ class BasePolicy(ABC):
 
         return amount
 
+    def validate_money_value(
+        self,
+        value,
+        field_name: str = "Amount",
+        *,
+        allow_zero: bool = False
+    ) -> Money:
+        if value is None or value == "":
+            raise PolicyError(f"{field_name} is required")
+
+        try:
+            amount = Money.of(value)
+        except ValueError:
+            raise PolicyError(f"{field_name} must be a number")
+
+        if allow_zero:
+            if amount < 0:
+                raise PolicyError(f"{field_name} cannot be negative")
+        else:
+            if amount <= 0:
+                raise PolicyError(f"{field_name} must be greater than zero")
+
+        return amount
+
     def validate_id_values(
             self,
             value,
@@ -55,13 +55,15 @@ class CategoryPolicy(BasePolicy):
 
         return clean
     
-    def validate_category_deletion(self, category, current_user_id: int, category_in_use_checker: object):
-        if category_in_use_checker is not None:
-            raise PolicyError(f"Cannot delete category in use '{category.name}'")
+    def validate_category_deletion(self, category, current_user_id: int, usage_stats: dict):
+        """usage_stats is CategoryRepository.usage_stats_by_user() for the current user"""
         if category is None:
             raise PolicyError("No Category instance found")
         if category.user_id != current_user_id:
             raise PolicyError(f"Cannot delete category user don't own '{category.name}'")
+        usage = usage_stats.get(category.id)
+        if usage is not None and usage.count > 0:
+            raise PolicyError(f"Cannot delete category in use '{category.name}'")
         
     def validate_users_category_existence(self, category):
         if category is None:
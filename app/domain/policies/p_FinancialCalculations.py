@@ -14,7 +14,7 @@ class FinancialCalculationsPolicy(BasePolicy):
             allowed=["user_id", "lender", "principal", "interest_rate", "start_date", "due_date"]
         )
         
-        clean["principal"] = self.validate_numeric_values(value=clean["principal"], field_name="Principal", allow_zero=False)
+        clean["principal"] = self.validate_money_value(value=clean["principal"], field_name="Principal", allow_zero=False)
         clean["interest_rate"] = self.validate_numeric_values(clean["interest_rate"], field_name="Interest Rate", allow_zero=False)
         clean["start_date"] = self.validate_date_value(clean["start_date"], "Start Date", allow_future=False, allow_past=True)
         clean["due_date"] = self.validate_date_value(clean["due_date"], "Due Date", allow_future=True, allow_past=False)
@@ -32,7 +32,7 @@ class FinancialCalculationsPolicy(BasePolicy):
             clean["lender"] = self.validate_string(clean["lender"], "Lender", 3)
 
         if "principal" in clean:
-            clean["principal"] = self.validate_numeric_values(value=clean["principal"], field_name="Principal", allow_zero=False)
+            clean["principal"] = self.validate_money_value(value=clean["principal"], field_name="Principal", allow_zero=False)
         if "interest_rate" in clean:
             clean["interest_rate"] = self.validate_numeric_values(clean["interest_rate"], field_name="Interest Rate", allow_zero=False)
 
@@ -15,7 +15,7 @@ class TransactionPolicy(BasePolicy):
         clean["category_id"] = self.validate_id_values(value=clean["category_id"], field_name="Category ID")
         clean["name"] = self.validate_string(clean["name"], "Income Name", min_len=1)
         clean["source"] = self.validate_string(clean["source"], "Income Source", min_len=1)
-        clean["amount"] = self.validate_numeric_values(value=clean["amount"], field_name="Amount", allow_zero=False)
+        clean["amount"] = self.validate_money_value(value=clean["amount"], field_name="Amount", allow_zero=False)
         clean["received_date"] = self.validate_date_value(value=clean["received_date"], field_name="Received Date", allow_future=False, allow_past=True)
         clean["payment_method"] = self.validate_payment_method(clean["payment_method"])
         clean["remarks"] = self.validate_string(clean.get("remarks", ""), "Remarks", min_len=0)
@@ -35,7 +35,7 @@ class TransactionPolicy(BasePolicy):
         if "source" in clean:
             clean["source"] = self.validate_string(clean["source"], "Income Source", min_len=1)
         if "amount" in clean:
-            clean["amount"] = self.validate_numeric_values(clean["amount"], "Amount", allow_zero=False)
+            clean["amount"] = self.validate_money_value(clean["amount"], "Amount", allow_zero=False)
         if "received_date" in clean:
             clean["received_date"] = self.validate_date_value(clean["received_date"], "Received Date", allow_future=False, allow_past=True)
         if "payment_method" in clean:
@@ -65,7 +65,7 @@ class TransactionPolicy(BasePolicy):
         clean["category_id"] = self.validate_id_values(value=clean["category_id"], field_name="Category ID")
         clean["name"] = self.validate_string(clean["name"], "Expense Name", min_len=1)
         clean["payee"] = self.validate_string(clean["payee"], "Expense Payee", min_len=1)
-        clean["amount"] = self.validate_numeric_values(value=clean["amount"], field_name="Amount", allow_zero=False)
+        clean["amount"] = self.validate_money_value(value=clean["amount"], field_name="Amount", allow_zero=False)
         clean["expense_date"] = self.validate_date_value(clean["expense_date"], "Expense Date", allow_future=False, allow_past=True)
         clean["payment_method"] = self.validate_payment_method(clean["payment_method"])
         clean["remarks"] = self.validate_string(clean.get("remarks", ""), "Remarks", min_len=0)
@@ -85,7 +85,7 @@ class TransactionPolicy(BasePolicy):
         if "payee" in clean:
             clean["payee"] = self.validate_string(clean["payee"], "Expense Payee", min_len=1)
         if "amount" in clean:
-            clean["amount"] = self.validate_numeric_values(clean["amount"], "Amount", allow_zero=False)
+            clean["amount"] = self.validate_money_value(clean["amount"], "Amount", allow_zero=False)
         if "payment_method" in clean:
             clean["payment_method"] = self.validate_payment_method(clean["payment_method"])
         if "expense_date" in clean:
@@ -116,6 +116,22 @@ class TransactionPolicy(BasePolicy):
         clean["pymt_type"] = self.validate_payment_type(clean["pymt_type"])
         return clean
 
+    # SAVING TRANSACTIONS
+    def validate_insert_saving_transaction(self, data: dict) -> dict:
+        clean = self.create_resource(
+            data,
+            required=["user_id", "goal_id", "txt_type"],
+            allowed=["user_id", "goal_id", "txt_type", "income_id", "expense_id"]
+        )
+        clean["user_id"] = self.validate_id_values(clean["user_id"], "User ID")
+        clean["goal_id"] = self.validate_id_values(clean["goal_id"], "Goal ID")
+        clean["txt_type"] = self.validate_payment_type(clean["txt_type"])
+        if clean.get("income_id") is not None:
+            clean["income_id"] = self.validate_id_values(clean["income_id"], "Income ID")
+        if clean.get("expense_id") is not None:
+            clean["expense_id"] = self.validate_id_values(clean["expense_id"], "Expense ID")
+        return clean
+
     def validate_payment_method(self, payment_method) -> str:
             payment_method = self.validate_string(payment_method, "Payment Method", min_len=4)
             if payment_method not in ("cash", "gcash", "bank", "card", "other"):
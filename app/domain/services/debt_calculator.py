@@ -2,6 +2,7 @@
 from datetime import date, timedelta
 from app.domain.entities import Debt
 from app.domain.exceptions import InvalidDebtError
+from app.domain.money import Money
 
 
 class DebtCalculator:
@@ -13,10 +14,10 @@ class DebtCalculator:
     
     @staticmethod
     def calculate_interest_accrued(
-        principal: float,
+        principal: Money,
         annual_interest_rate: float,
         months: int = 1,
-    ) -> float:
+    ) -> Money:
         """
         Calculate interest accrued over a period.
         
@@ -28,7 +29,7 @@ class DebtCalculator:
             months: Number of months (default 1)
         
         Returns:
-            Interest amount
+            Interest amount, rounded to the centavo
         
         Example:
             interest = DebtCalculator.calculate_interest_accrued(
@@ -45,14 +46,14 @@ class DebtCalculator:
         if months < 0:
             raise InvalidDebtError("Months cannot be negative")
         
-        return float(principal * (annual_interest_rate / 100) * (months / 12))
+        return Money.of(principal) * (annual_interest_rate / 100 * months / 12)
     
     @staticmethod
     def calculate_total_amount_due(
-        principal: float,
+        principal: Money,
         annual_interest_rate: float,
         months: int = 1,
-    ) -> float:
+    ) -> Money:
         """
         Calculate total amount to pay (principal + interest).
         
@@ -67,14 +68,14 @@ class DebtCalculator:
         interest = DebtCalculator.calculate_interest_accrued(
             principal, annual_interest_rate, months
         )
-        return float(principal + interest)
+        return interest + principal
     
     @staticmethod
     def calculate_monthly_payment(
-        principal: float,
+        principal: Money,
         annual_interest_rate: float,
         months_remaining: int,
-    ) -> float:
+    ) -> Money:
         """
         Calculate approximate monthly payment (simple interest, equal installments).
         
@@ -86,7 +87,7 @@ class DebtCalculator:
             months_remaining: Months until due date
         
         Returns:
-            Approximate monthly payment amount
+            Approximate monthly payment amount, rounded to the centavo
         
         Raises:
             InvalidDebtError: If months_remaining is 0
@@ -97,7 +98,7 @@ class DebtCalculator:
         total_due = DebtCalculator.calculate_total_amount_due(
             principal, annual_interest_rate, months_remaining
         )
-        return float(total_due / months_remaining)
+        return total_due / months_remaining
     
     @staticmethod
     def calculate_months_until_due(due_date: date) -> int:
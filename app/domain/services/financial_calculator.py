@@ -2,6 +2,7 @@
 Domain Service for financial calculations and business rules.
 Pure business logic - NO validation, NO persistence.
 """
+from app.domain.money import Money
 
 
 class FinancialCalculator:
@@ -9,11 +10,11 @@ class FinancialCalculator:
     
     def calculate_current_balance(
             self,
-            total_income: float, 
-            total_expense: float, 
-            total_debt_payments: float,
-            total_saving_deposits: float
-    ) -> float:
+            total_income: Money, 
+            total_expense: Money, 
+            total_debt_payments: Money,
+            total_saving_deposits: Money
+    ) -> Money:
         """
         Calculate user's current balance.
         
@@ -26,10 +27,10 @@ class FinancialCalculator:
             total_saving_deposits: Sum of all savings deposits
             
         Returns:
-            Float: Current balance (can be negative if user spent more than earned)
+            Money: Current balance (can be negative if user spent more than earned)
         """
-        return float(
-            total_income 
+        return (
+            Money.of(total_income)
             - total_expense
             - total_debt_payments
             - total_saving_deposits
@@ -37,12 +38,12 @@ class FinancialCalculator:
     
     def calculate_available_balance(
             self,
-            total_income: float,
-            total_expense: float,
-            total_debt_payments: float,
-            total_saving_deposits: float,
-            minimum_balance: float = 500.0
-    ) -> float:
+            total_income: Money,
+            total_expense: Money,
+            total_debt_payments: Money,
+            total_saving_deposits: Money,
+            minimum_balance: Money = Money.of(500)
+    ) -> Money:
         """
         Calculate available balance (current balance - minimum required buffer).
         
@@ -54,7 +55,7 @@ class FinancialCalculator:
             minimum_balance: Minimum balance to maintain (default: 500php)
             
         Returns:
-            Float: Available balance for spending
+            Money: Available balance for spending
         """
         current_balance = self.calculate_current_balance(
             total_income,
@@ -62,12 +63,12 @@ class FinancialCalculator:
             total_debt_payments,
             total_saving_deposits
         )
-        return max(current_balance - minimum_balance, 0.0)
+        return max(current_balance - minimum_balance, Money())
     
     def calculate_savings_percentage(
             self,
-            total_saving_deposits: float,
-            total_income: float
+            total_saving_deposits: Money,
+            total_income: Money
     ) -> float:
         """
         Calculate what percentage of income is being saved.
@@ -81,12 +82,12 @@ class FinancialCalculator:
         """
         if total_income == 0:
             return 0.0
-        return (total_saving_deposits / total_income) * 100
+        return (Money.of(total_saving_deposits) / Money.of(total_income)) * 100
     
     def calculate_expense_ratio(
             self,
-            total_expense: float,
-            total_income: float
+            total_expense: Money,
+            total_income: Money
     ) -> float:
         """
         Calculate what percentage of income is spent.
@@ -100,4 +101,4 @@ class FinancialCalculator:
         """
         if total_income == 0:
             return 0.0
-        return (total_expense / total_income) * 100
+        return (Money.of(total_expense) / Money.of(total_income)) * 100
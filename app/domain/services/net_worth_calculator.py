@@ -1,6 +1,7 @@
 """Net Worth Calculator - Pure business logic"""
 from typing import List
 from app.domain.entities import Income, Expense, Debt, SavingGoal
+from app.domain.money import Money
 
 
 class NetWorthCalculator:
@@ -15,11 +16,11 @@ class NetWorthCalculator:
     
     @staticmethod
     def calculate_net_worth(
-        total_income: float,
-        total_expenses: float,
-        total_debt_principal: float,
-        total_savings: float = 0.0,
-    ) -> float:
+        total_income: Money,
+        total_expenses: Money,
+        total_debt_principal: Money,
+        total_savings: Money = Money(),
+    ) -> Money:
         """
         Calculate net worth from aggregate amounts.
         
@@ -41,10 +42,10 @@ class NetWorthCalculator:
             )
             # Result: 10000 - 3000 - 2000 + 1500 = 6500
         """
-        return float(total_income - total_expenses - total_debt_principal + total_savings)
+        return Money.of(total_income) - total_expenses - total_debt_principal + total_savings
     
     @staticmethod
-    def calculate_net_value(total_income: float, total_expense:float, total_saving_deposits: float) -> float:
+    def calculate_net_value(total_income: Money, total_expense: Money, total_saving_deposits: Money) -> Money:
         """
         Calculate net value (income - expenses - saving deposits).
         
@@ -64,10 +65,10 @@ class NetWorthCalculator:
             )
             # Result: 10000 - 3000 - 1500 = 5500
         """
-        return float(total_income - total_expense - total_saving_deposits)
+        return Money.of(total_income) - total_expense - total_saving_deposits
 
     @staticmethod
-    def calculate_net_income(total_income: float, total_expenses: float) -> float:
+    def calculate_net_income(total_income: Money, total_expenses: Money) -> Money:
         """
         Calculate net income (income - expenses, excluding debts).
         
@@ -78,10 +79,10 @@ class NetWorthCalculator:
         Returns:
             Net income amount
         """
-        return float(total_income - total_expenses)
+        return Money.of(total_income) - total_expenses
     
     @staticmethod
-    def calculate_savings_rate(total_income: float, total_savings: float) -> float:
+    def calculate_savings_rate(total_income: Money, total_savings: Money) -> float:
         """
         Calculate savings rate as percentage.
         
@@ -94,10 +95,10 @@ class NetWorthCalculator:
         """
         if total_income <= 0:
             return 0.0
-        return min(100.0, (total_savings / total_income) * 100)
+        return min(100.0, (Money.of(total_savings) / Money.of(total_income)) * 100)
     
     @staticmethod
-    def calculate_expense_ratio(total_income: float, total_expenses: float) -> float:
+    def calculate_expense_ratio(total_income: Money, total_expenses: Money) -> float:
         """
         Calculate expense-to-income ratio as percentage.
         
@@ -110,10 +111,10 @@ class NetWorthCalculator:
         """
         if total_income <= 0:
             return 0.0
-        return (total_expenses / total_income) * 100
+        return (Money.of(total_expenses) / Money.of(total_income)) * 100
     
     @staticmethod
-    def calculate_debt_to_income_ratio(total_debt_principal: float, total_income: float) -> float:
+    def calculate_debt_to_income_ratio(total_debt_principal: Money, total_income: Money) -> float:
         """
         Calculate debt-to-income ratio as percentage.
         
@@ -126,4 +127,4 @@ class NetWorthCalculator:
         """
         if total_income <= 0:
             return 0.0
-        return (total_debt_principal / total_income) * 100
+        return (Money.of(total_debt_principal) / Money.of(total_income)) * 100
@@ -2,6 +2,7 @@
 from datetime import date
 from typing import List, Dict
 from app.domain.entities import SavingGoal
+from app.domain.money import Money
 
 
 class SavingGoalAnalyzer:
@@ -12,7 +13,7 @@ class SavingGoalAnalyzer:
     """
     
     @staticmethod
-    def calculate_remaining_amount(goal: SavingGoal) -> float:
+    def calculate_remaining_amount(goal: SavingGoal) -> Money:
         """
         Calculate amount still needed to reach goal.
         
@@ -22,8 +23,8 @@ class SavingGoalAnalyzer:
         Returns:
             Remaining amount (0 if already met)
         """
-        remaining = goal.target_amount - goal.current_amount
-        return max(0.0, float(remaining))
+        remaining = Money.of(goal.target_amount) - goal.current_amount
+        return max(Money(), remaining)
     
     @staticmethod
     def calculate_progress_percentage(goal: SavingGoal) -> float:
@@ -38,10 +39,10 @@ class SavingGoalAnalyzer:
         """
         if goal.target_amount <= 0:
             return 0.0
-        return min(100.0, (goal.current_amount / goal.target_amount) * 100)
+        return min(100.0, (Money.of(goal.current_amount) / Money.of(goal.target_amount)) * 100)
     
     @staticmethod
-    def calculate_months_to_target(goal: SavingGoal, monthly_savings: float = 0) -> int:
+    def calculate_months_to_target(goal: SavingGoal, monthly_savings: Money = Money()) -> int:
         """
         Calculate estimated months to reach goal.
         
@@ -57,7 +58,7 @@ class SavingGoalAnalyzer:
         if monthly_savings <= 0:
             return 0
         
-        return int((remaining / monthly_savings) + 0.5)  # Round to nearest month
+        return int((remaining / Money.of(monthly_savings)) + 0.5)  # Round to nearest month
     
     @staticmethod
     def is_on_track(goal: SavingGoal, months_elapsed: int) -> bool:
@@ -86,7 +87,7 @@ class SavingGoalAnalyzer:
             return True
         
         expected_progress_ratio = days_elapsed / total_days
-        actual_progress_ratio = goal.current_amount / goal.target_amount
+        actual_progress_ratio = Money.of(goal.current_amount) / Money.of(goal.target_amount)
         
         return actual_progress_ratio >= expected_progress_ratio * 0.9  # 90% threshold
     
@@ -2,6 +2,7 @@
 from datetime import date, timedelta
 from typing import List, Dict, Tuple
 from app.domain.entities import Income, Expense
+from app.domain.money import Money
 
 
 class TransactionAnalyzer:
@@ -14,7 +15,7 @@ class TransactionAnalyzer:
     @staticmethod
     def categorize_expenses_by_category(
         expenses: List[Expense],
-    ) -> Dict[int, float]:
+    ) -> Dict[int, Money]:
         """
         Group expenses by category and sum amounts.
         
@@ -26,13 +27,13 @@ class TransactionAnalyzer:
         """
         result = {}
         for expense in expenses:
-            result[expense.category_id] = result.get(expense.category_id, 0) + expense.amount
+            result[expense.category_id] = result.get(expense.category_id, Money()) + expense.amount
         return result
     
     @staticmethod
     def categorize_income_by_category(
         incomes: List[Income],
-    ) -> Dict[int, float]:
+    ) -> Dict[int, Money]:
         """
         Group income by category and sum amounts.
         
@@ -44,7 +45,7 @@ class TransactionAnalyzer:
         """
         result = {}
         for income in incomes:
-            result[income.category_id] = result.get(income.category_id, 0) + income.amount
+            result[income.category_id] = result.get(income.category_id, Money()) + income.amount
         return result
     
     @staticmethod
@@ -104,7 +105,7 @@ class TransactionAnalyzer:
     @staticmethod
     def calculate_average_transaction_amount(
         transactions: List[Income | Expense],
-    ) -> float:
+    ) -> Money:
         """
         Calculate average transaction amount.
         
@@ -112,18 +113,18 @@ class TransactionAnalyzer:
             transactions: List of transactions
         
         Returns:
-            Average amount (0 if no transactions)
+            Average amount, rounded to the centavo (0 if no transactions)
         """
         if not transactions:
-            return 0.0
+            return Money()
         
-        total = sum(t.amount for t in transactions)
-        return float(total / len(transactions))
+        total = sum((t.amount for t in transactions), Money())
+        return total / len(transactions)
     
     @staticmethod
     def get_highest_transaction(
         transactions: List[Income | Expense],
-    ) -> Tuple[Income | Expense, float] | None:
+    ) -> Tuple[Income | Expense, Money] | None:
         """
         Get highest value transaction.
         
@@ -136,12 +137,13 @@ class TransactionAnalyzer:
         if not transactions:
             return None
         
-        return max((t, t.amount) for t in transactions)
+        highest = max(transactions, key=lambda t: t.amount)
+        return highest, highest.amount
     
     @staticmethod
     def get_lowest_transaction(
         transactions: List[Income | Expense],
-    ) -> Tuple[Income | Expense, float] | None:
+    ) -> Tuple[Income | Expense, Money] | None:
         """
         Get lowest value transaction.
         
@@ -154,10 +156,11 @@ class TransactionAnalyzer:
         if not transactions:
             return None
         
-        return min((t, t.amount) for t in transactions)
+        lowest = min(transactions, key=lambda t: t.amount)
+        return lowest, lowest.amount
     
     @staticmethod
-    def calculate_total(transactions: List[Income | Expense]) -> float:
+    def calculate_total(transactions: List[Income | Expense]) -> Money:
         """
         Calculate total of all transactions.
         
@@ -167,13 +170,31 @@ class TransactionAnalyzer:
         Returns:
             Total amount
         """
-        return float(sum(t.amount for t in transactions))
+        return sum((t.amount for t in transactions), Money())
+    
+    @staticmethod
+    def _trend_months(num_months: int) -> List[date]:
+        """Months covered by a spending trend, most recent first"""
+        today = date.today()
+        months = []
+        
+        for i in range(num_months):
+            # Go back i months
+            month_date = today - timedelta(days=today.day)
+            for _ in range(i):
+                if month_date.month == 1:
+                    month_date = date(month_date.year - 1, 12, 1)
+                else:
+                    month_date = date(month_date.year, month_date.month - 1, 1)
+            months.append(month_date)
+        
+        return months
     
     @staticmethod
     def get_spending_trend(
         expenses: List[Expense],
         num_months: int = 3,
-    ) -> List[Tuple[str, float]]:
+    ) -> List[Tuple[str, Money]]:
         """
         Get spending trend by month (last N months).
         
@@ -184,26 +205,52 @@ class TransactionAnalyzer:
         Returns:
             List of (month_label, total_spent) tuples
         """
-        today = date.today()
         months_data = []
         
-        for i in range(num_months):
-            # Go back i months
-            month_date = today - timedelta(days=today.day)
-            for _ in range(i):
-                if month_date.month == 1:
-                    month_date = date(month_date.year - 1, 12, 1)
-                else:
-                    month_date = date(month_date.year, month_date.month - 1, 1)
-            
+        for month_date in TransactionAnalyzer._trend_months(num_months):
             # Sum expenses for this month
             month_label = month_date.strftime("%B %Y")
             month_total = sum(
-                e.amount for e in expenses
-                if e.expense_date.year == month_date.year
-                and e.expense_date.month == month_date.month
+                (
+                    e.amount for e in expenses
+                    if e.expense_date.year == month_date.year
+                    and e.expense_date.month == month_date.month
+                ),
+                Money(),
             )
             
-            months_data.append((month_label, float(month_total)))
+            months_data.append((month_label, month_total))
+        
+        return list(reversed(months_data))
+    
+    @staticmethod
+    def get_spending_trend_from_rollups(
+        rollups: List,
+        num_months: int = 3,
+    ) -> List[Tuple[str, Money]]:
+        """
+        Get spending trend by month from pre-aggregated monthly rollups.
+        
+        Same result as get_spending_trend(), but reads one row per month and
+        category instead of every expense.
+        
+        Args:
+            rollups: Rows with month, kind and total (e.g. MonthlyRollup);
+                non-expense rows are ignored
+            num_months: Number of months to analyze (default 3)
+        
+        Returns:
+            List of (month_label, total_spent) tuples
+        """
+        totals = {}
+        for rollup in rollups:
+            if rollup.kind == "expense":
+                key = (rollup.month.year, rollup.month.month)
+                totals[key] = totals.get(key, Money()) + rollup.total
+        
+        months_data = [
+            (month_date.strftime("%B %Y"), totals.get((month_date.year, month_date.month), Money()))
+            for month_date in TransactionAnalyzer._trend_months(num_months)
+        ]
         
         return list(reversed(months_data))
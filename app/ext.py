@@ -1,5 +1,151 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import sqlalchemy as sa
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from datetime import datetime as dt
+from app.domain.money import Money
 
-db = SQLAlchemy()
 
+def _touches_global_table(mapper, clause) -> bool:
+    """True if the statement reads or writes a table marked ``info={"global": True}``"""
+    if mapper is not None:
+        tables = [sa.inspect(mapper).local_table]
+    elif isinstance(clause, sa.Table):
+        tables = [clause]
+    elif isinstance(clause, sa.UpdateBase):
+        tables = [clause.table]
+    elif clause is not None and hasattr(clause, "get_final_froms"):
+        tables = clause.get_final_froms()
+    else:
+        tables = []
+    return any(getattr(table, "info", {}).get("global") for table in tables)
+
+
+def replica_bind_key(shard=None) -> str:
+    """Bind key of the replica of the primary (shard None) or of a shard"""
+    return "replica" if shard is None else f"{shard}_replica"
+
+
+class RoutingSession(Session):
+    """
+    Session that picks an engine per statement:
+
+    - while ``info["shard"]`` is set (see UnitOfWork.route_to_user()),
+      everything except global tables (shard directory, sessions) goes to
+      that shard's bind;
+    - while ``info["use_replica"]`` is set (see UnitOfWork.read_only()),
+      SELECT statements go to the replica of the database they would
+      otherwise use: ``shard_N_replica`` for a shard, ``replica`` for the
+      primary. A shard without a replica serves its reads itself; they
+      never fall back to the primary's replica.
+
+    Writes, flushes and raw text statements otherwise use the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            shard = self.info.get("shard")
+            if shard is not None and _touches_global_table(mapper, clause):
+                # Global tables only live on the primary
+                shard = None
+            if self.info.get("use_replica") and getattr(clause, "is_select", False):
+                replica = self._db.engines.get(replica_bind_key(shard))
+                if replica is not None:
+                    return replica
+            if shard is not None:
+                return self._db.engines[shard]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class MoneyType(sa.TypeDecorator):
+    """
+    BIGINT column holding an amount in centavos, read back as Money.
+
+    Plain numbers bound to it (filters, deltas) are taken as pesos.
+    """
+
+    impl = sa.BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return Money.of(value).cents
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Money.from_cents(value)
+
+
+class JSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, with Money amounts as plain numbers (pesos)"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, Money):
+            return float(o)
+        return DefaultJSONProvider.default(o)
+
+
+class EventLoopThread:
+    """
+    One long-lived asyncio event loop per worker process, run on a daemon
+    thread. Flask would otherwise start a fresh loop for every async view,
+    and nothing pooled on a loop (async engine connections) could outlive
+    the request.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _running_loop(self) -> asyncio.AbstractEventLoop:
+        if self._pid != os.getpid():
+            with self._lock:
+                # Threads do not survive a fork; each forked worker starts its own
+                if self._pid != os.getpid():
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="event-loop", daemon=True).start()
+                    self._loop, self._pid = loop, os.getpid()
+        return self._loop
+
+    def run(self, func, *args, **kwargs):
+        """
+        Run the coroutine function on the loop and block until it is done.
+
+        The coroutine runs in a copy of the caller's context, so Flask's
+        request and app contexts are available to it.
+        """
+        context = contextvars.copy_context()
+        outcome = concurrent.futures.Future()
+
+        def copy_outcome(task):
+            if task.cancelled():
+                outcome.cancel()
+            elif task.exception() is not None:
+                outcome.set_exception(task.exception())
+            else:
+                outcome.set_result(task.result())
+
+        def start():
+            try:
+                task = loop.create_task(func(*args, **kwargs), context=context)
+            except BaseException as exc:
+                outcome.set_exception(exc)
+                return
+            task.add_done_callback(copy_outcome)
+
+        loop = self._running_loop()
+        loop.call_soon_threadsafe(start)
+        return outcome.result()
+
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+event_loop = EventLoopThread()
@@ -2,9 +2,14 @@ from app.ext import db, dt
 
 class Categories(db.Model):
     __tablename__ = 'categories'
+    __table_args__ = (
+        db.Index('ix_categories_user_id_type', 'user_id', 'type'),
+        db.Index('ix_categories_user_id_name', 'user_id', 'name'),
+        db.UniqueConstraint('user_id', 'type', 'name', name='uq_categories_user_id_type_name'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
-    type = db.Column(db.Enum("income", "expense"), nullable=False)
+    type = db.Column(db.Enum("income", "expense", create_constraint=True), nullable=False)
     name = db.Column(db.String(32), nullable=False)
     description = db.Column(db.String(255), nullable=True)
     created_at = db.Column(db.DateTime, default=dt.now())
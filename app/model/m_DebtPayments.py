@@ -7,7 +7,7 @@ class DebtPayments(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
     income_id = db.Column(db.Integer, db.ForeignKey('income.id', ondelete="CASCADE"), nullable=True)
     expense_id = db.Column(db.Integer, db.ForeignKey('expenses.id', ondelete="CASCADE"), nullable=True)
-    pymt_type = db.Column(db.Enum("deposit", "withdraw"), nullable=False, default='deposit')
+    pymt_type = db.Column(db.Enum("deposit", "withdraw", create_constraint=True), nullable=False, default='deposit')
     
     income = db.relationship("Income", foreign_keys=[income_id], backref=db.backref('debt_payments', lazy=True, cascade='all, delete-orphan'))
     expenses = db.relationship("Expenses", foreign_keys=[expense_id], backref=db.backref('debt_payments', lazy=True, cascade='all, delete-orphan'))
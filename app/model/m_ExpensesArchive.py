@@ -0,0 +1,21 @@
+from app.ext import db, MoneyType
+
+class ExpensesArchive(db.Model):
+    """Cold copy of expenses rows moved out by `flask archive-transactions` (ids are kept)"""
+    __tablename__ = 'expenses_archive'
+    __table_args__ = (
+        db.Index('ix_expenses_archive_user_id_expense_date', 'user_id', 'expense_date'),
+    )
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.id', ondelete="CASCADE"), nullable=False)
+    name = db.Column(db.String(80), nullable=False)
+    payee = db.Column(db.String(32), nullable=False)
+    amount = db.Column(MoneyType, nullable=False)
+    expense_date = db.Column(db.DateTime)
+    payment_method = db.Column(db.Enum("cash", "gcash", "bank", "card", "other", create_constraint=True), nullable=True, default="cash")
+    remarks = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime)
+
+    users = db.relationship("Users", foreign_keys=[user_id], backref=db.backref('expenses_archive', lazy=True, cascade='all, delete-orphan'))
+    categories = db.relationship("Categories", foreign_keys=[category_id], backref=db.backref('expenses_archive', lazy=True, cascade='all, delete-orphan'))
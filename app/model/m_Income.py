@@ -1,15 +1,20 @@
-from app.ext import db, dt
+from app.ext import db, dt, MoneyType
 
 class Income(db.Model):
     __tablename__ = 'income'
+    __table_args__ = (
+        db.Index('ix_income_user_id_received_date', 'user_id', 'received_date'),
+        # Archived rows keep their ids; SQLite must never hand them out again
+        {'sqlite_autoincrement': True},
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
     category_id = db.Column(db.Integer, db.ForeignKey('categories.id', ondelete="CASCADE"), nullable=False)
     name = db.Column(db.String(80), nullable=False)
     source = db.Column(db.String(55), nullable=False)
-    amount = db.Column(db.Float, nullable=False)
+    amount = db.Column(MoneyType, nullable=False)
     received_date = db.Column(db.Date, default=dt.now().date)
-    payment_method = db.Column(db.Enum("cash", "gcash", "bank", "card", "other"), nullable=True, default="cash")
+    payment_method = db.Column(db.Enum("cash", "gcash", "bank", "card", "other", create_constraint=True), nullable=True, default="cash")
     remarks = db.Column(db.String(255))
     created_at = db.Column(db.DateTime, default=dt.now())
 
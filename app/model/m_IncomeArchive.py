@@ -0,0 +1,21 @@
+from app.ext import db, MoneyType
+
+class IncomeArchive(db.Model):
+    """Cold copy of income rows moved out by `flask archive-transactions` (ids are kept)"""
+    __tablename__ = 'income_archive'
+    __table_args__ = (
+        db.Index('ix_income_archive_user_id_received_date', 'user_id', 'received_date'),
+    )
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.id', ondelete="CASCADE"), nullable=False)
+    name = db.Column(db.String(80), nullable=False)
+    source = db.Column(db.String(55), nullable=False)
+    amount = db.Column(MoneyType, nullable=False)
+    received_date = db.Column(db.Date)
+    payment_method = db.Column(db.Enum("cash", "gcash", "bank", "card", "other", create_constraint=True), nullable=True, default="cash")
+    remarks = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime)
+
+    users = db.relationship("Users", foreign_keys=[user_id], backref=db.backref('income_archive', lazy=True, cascade='all, delete-orphan'))
+    categories = db.relationship("Categories", foreign_keys=[category_id], backref=db.backref('income_archive', lazy=True, cascade='all, delete-orphan'))
@@ -0,0 +1,18 @@
+from app.ext import db, dt, MoneyType
+
+class MonthlyRollups(db.Model):
+    __tablename__ = 'monthly_rollups'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'month', 'kind', 'category_id', name='uq_monthly_rollups_user_month_kind_category'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
+    month = db.Column(db.Date, nullable=False)
+    kind = db.Column(db.Enum("income", "expense", create_constraint=True), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.id', ondelete="CASCADE"), nullable=False)
+    total = db.Column(MoneyType, nullable=False, default=0)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=dt.now, onupdate=dt.now)
+
+    users = db.relationship("Users", foreign_keys=[user_id], backref=db.backref('monthly_rollups', lazy=True, cascade='all, delete-orphan'))
+    categories = db.relationship("Categories", foreign_keys=[category_id], backref=db.backref('monthly_rollups', lazy=True, cascade='all, delete-orphan'))
@@ -1,11 +1,11 @@
-from app.ext import db, dt
+from app.ext import db, dt, MoneyType
 
 class SavingGoals(db.Model):
     __tablename__ = 'saving_goals'
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
     name = db.Column(db.String(120), nullable=False, unique=True)
-    target_amount = db.Column(db.Float, nullable=False)
+    target_amount = db.Column(MoneyType, nullable=False)
     target_date = db.Column(db.Date, nullable=False)
     created_at = db.Column(db.DateTime, default=dt.now())
     remarks = db.Column(db.String(255))
@@ -2,10 +2,13 @@ from app.ext import db, dt
 
 class SavingTransactions(db.Model):
     __tablename__ = 'saving_transactions'
+    __table_args__ = (
+        db.Index('ix_saving_transactions_user_id_txt_type', 'user_id', 'txt_type'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     goal_id = db.Column(db.Integer, db.ForeignKey('saving_goals.id', ondelete="CASCADE"), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
-    txt_type = db.Column(db.Enum("deposit", "withdraw"), nullable=False, default='deposit')
+    txt_type = db.Column(db.Enum("deposit", "withdraw", create_constraint=True), nullable=False, default='deposit')
     income_id = db.Column(db.Integer, db.ForeignKey('income.id', ondelete="CASCADE"), nullable=True)
     expense_id = db.Column(db.Integer, db.ForeignKey('expenses.id', ondelete="CASCADE"), nullable=True)
 
@@ -0,0 +1,11 @@
+from app.ext import db, dt
+
+class UserShards(db.Model):
+    """Directory of which shard holds each user's data; always on the primary database"""
+    __tablename__ = 'user_shards'
+    __table_args__ = {'info': {'global': True}}
+    user_id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(100), nullable=False, unique=True)
+    # Bind key from SHARD_BINDS, or NULL for the primary database
+    shard = db.Column(db.String(32), nullable=True)
+    updated_at = db.Column(db.DateTime, default=dt.now, onupdate=dt.now)
@@ -1,4 +1,4 @@
-from app.ext import db, dt
+from app.ext import db, dt, MoneyType
 
 class Users(db.Model):
     __tablename__ = 'users'
@@ -7,7 +7,7 @@ class Users(db.Model):
     lastname = db.Column(db.String(32), nullable=False)
     email = db.Column(db.String(100), nullable=False, unique=True)
     password_hash = db.Column(db.String(255), nullable=False)
-    current_value = db.Column(db.Float, nullable=False, default=0)
+    current_value = db.Column(MoneyType, nullable=False, default=0)
     created_at = db.Column(db.DateTime, default=dt.now())
     updated_at = db.Column(db.DateTime, default=dt.now()) 
 
@@ -1,12 +1,18 @@
 """Persistence Layer - SQLAlchemy implementations and transaction management
 
 This module exposes a factory helper `create_unit_of_work()` which wires
-the concrete repository implementations into an `SQLAlchemyUnitOfWork`.
+the concrete repository implementations into an `SQLAlchemyUnitOfWork`,
+and `create_async_unit_of_work()` for the async views.
 """
 
 from app.persistence.unit_of_work import (
     SQLAlchemyUnitOfWork,
 )
+from app.persistence.async_unit_of_work import (
+    AsyncSQLAlchemyUnitOfWork,
+)
+from app.persistence.sharding import ShardRouter
+from app.persistence.query_cache import CachedRepository
 
 from app.persistence.repositories import (
     UserRepositoryImpl,
@@ -17,8 +23,32 @@ from app.persistence.repositories import (
     SavingGoalRepositoryImpl,
     DebtPaymentsRepositoryImpl,
     SavingTransactionsRepositoryImpl,
+    MonthlyRollupRepositoryImpl,
+    DashboardRepositoryImpl,
+    AsyncUserRepositoryImpl,
+    AsyncCategoryRepositoryImpl,
+    AsyncIncomeRepositoryImpl,
+    AsyncExpenseRepositoryImpl,
+    AsyncMonthlyRollupRepositoryImpl,
+    AsyncDashboardRepositoryImpl,
 )
 
+# Per-user reads served from the query cache (see app/persistence/query_cache.py)
+CACHED_READS = {
+    "users": ("get_current_value",),
+    "debts": ("get_all_by_user_id", "get_active_by_user_id", "calculate_total_principal_by_user_id"),
+    "categories": ("get_all_by_user_id", "get_all_by_user_and_type", "usage_stats_by_user"),
+    "incomes": ("calculate_total_by_user_id", "get_summaries_by_user_id"),
+    "expenses": ("calculate_total_by_user_id", "get_summaries_by_user_id"),
+    "saving_goals": ("get_all_by_user_id", "get_active_by_user_id"),
+    "monthly_rollups": ("get_by_user_id", "get_totals_by_user_id"),
+    "dashboard": ("get_summary",),
+}
+ASYNC_CACHED_READS = {
+    "monthly_rollups": ("get_by_user_id",),
+    "dashboard": ("get_summary",),
+}
+
 
 def create_unit_of_work() -> SQLAlchemyUnitOfWork:
     """Create a SQLAlchemyUnitOfWork pre-wired with repository implementations.
@@ -26,14 +56,17 @@ def create_unit_of_work() -> SQLAlchemyUnitOfWork:
     Returns:
         SQLAlchemyUnitOfWork: ready-to-use unit of work instance
     """
-    user_repo = UserRepositoryImpl()
-    debt_repo = DebtRepositoryImpl()
-    category_repo = CategoryRepositoryImpl()
-    income_repo = IncomeRepositoryImpl()
-    expense_repo = ExpenseRepositoryImpl()
-    saving_goal_repo = SavingGoalRepositoryImpl()
+    user_repo = CachedRepository(UserRepositoryImpl(), CACHED_READS["users"])
+    debt_repo = CachedRepository(DebtRepositoryImpl(), CACHED_READS["debts"])
+    category_repo = CachedRepository(CategoryRepositoryImpl(), CACHED_READS["categories"])
+    income_repo = CachedRepository(IncomeRepositoryImpl(), CACHED_READS["incomes"])
+    expense_repo = CachedRepository(ExpenseRepositoryImpl(), CACHED_READS["expenses"])
+    saving_goal_repo = CachedRepository(SavingGoalRepositoryImpl(), CACHED_READS["saving_goals"])
     debt_payments_repo = DebtPaymentsRepositoryImpl()
     saving_transactions_repo = SavingTransactionsRepositoryImpl()
+    monthly_rollup_repo = CachedRepository(MonthlyRollupRepositoryImpl(), CACHED_READS["monthly_rollups"])
+    dashboard_repo = CachedRepository(DashboardRepositoryImpl(), CACHED_READS["dashboard"])
+    shard_router = ShardRouter()
 
     return SQLAlchemyUnitOfWork(
         user_repo,
@@ -44,9 +77,29 @@ def create_unit_of_work() -> SQLAlchemyUnitOfWork:
         saving_goal_repo,
         debt_payments_repo,
         saving_transactions_repo,
+        monthly_rollup_repo,
+        dashboard_repo,
+        shard_router,
+    )
+
+
+def create_async_unit_of_work() -> AsyncSQLAlchemyUnitOfWork:
+    """Create an AsyncSQLAlchemyUnitOfWork pre-wired with async repository implementations.
+
+    Returns:
+        AsyncSQLAlchemyUnitOfWork: ready-to-use async unit of work instance
+    """
+    return AsyncSQLAlchemyUnitOfWork(
+        AsyncUserRepositoryImpl(),
+        AsyncCategoryRepositoryImpl(),
+        AsyncIncomeRepositoryImpl(),
+        AsyncExpenseRepositoryImpl(),
+        CachedRepository(AsyncMonthlyRollupRepositoryImpl(), ASYNC_CACHED_READS["monthly_rollups"]),
+        CachedRepository(AsyncDashboardRepositoryImpl(), ASYNC_CACHED_READS["dashboard"]),
     )
 
 
 __all__ = [
     "create_unit_of_work",
+    "create_async_unit_of_work",
 ]
@@ -0,0 +1,76 @@
+"""Hot/cold archival helpers shared by the income and expense repositories
+
+Rows older than the archive horizon are moved, ids intact, from the hot
+table into an identically shaped ``*_archive`` table. Reads only touch the
+archive when the user has archived rows inside the requested window.
+"""
+from datetime import date
+from typing import Iterable, Optional
+from sqlalchemy import exists, func, select
+from app.ext import db
+
+
+def archived_through(archive_cls, date_column, user_id: int) -> Optional[date]:
+    """
+    Return the newest archived date for a user, or None if nothing of
+    theirs is archived. Resolved from the (user_id, date) index once per
+    session and kept in ``db.session.info`` next to the identity map.
+    """
+    boundaries = db.session.info.setdefault("archived_through", {})
+    key = (archive_cls.__tablename__, user_id)
+    if key not in boundaries:
+        boundaries[key] = db.session.execute(
+            select(func.max(date_column)).where(archive_cls.user_id == user_id)
+        ).scalar()
+    return boundaries[key]
+
+
+def forget_archived_through() -> None:
+    """Drop the remembered archive boundaries once archived rows change"""
+    db.session.info.pop("archived_through", None)
+
+
+def move_to_archive(
+    hot_cls,
+    archive_cls,
+    date_column_name: str,
+    cutoff: date,
+    chunk_size: int,
+    referenced_by: Iterable = (),
+) -> int:
+    """
+    Move one chunk of rows dated before ``cutoff`` into the archive table.
+
+    Rows still referenced by one of ``referenced_by`` (foreign key columns
+    that would cascade on delete) stay in the hot table.
+
+    Args:
+        hot_cls: Hot table model
+        archive_cls: Archive table model with the same columns
+        date_column_name: Name of the column compared against cutoff
+        cutoff: Rows strictly older than this date are moved
+        chunk_size: Maximum number of rows moved
+        referenced_by: Foreign key columns pointing at the hot table's id
+
+    Returns:
+        Number of rows moved (less than chunk_size once done)
+    """
+    hot = hot_cls.__table__
+    archive = archive_cls.__table__
+
+    stmt = select(hot.c.id).where(hot.c[date_column_name] < cutoff)
+    for fk_column in referenced_by:
+        stmt = stmt.where(~exists().where(fk_column == hot.c.id))
+    ids = db.session.execute(stmt.order_by(hot.c.id).limit(chunk_size)).scalars().all()
+    if not ids:
+        return 0
+
+    columns = [column.name for column in archive.c]
+    db.session.execute(
+        archive.insert().from_select(
+            columns, select(*(hot.c[name] for name in columns)).where(hot.c.id.in_(ids))
+        )
+    )
+    db.session.execute(hot.delete().where(hot.c.id.in_(ids)))
+    forget_archived_through()
+    return len(ids)
@@ -0,0 +1,130 @@
+"""Async Unit of Work - Repository access for async views"""
+import asyncio
+import weakref
+from abc import ABC
+from flask import current_app
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.config import engine_options
+from app.ext import replica_bind_key
+from app.repositories import (
+    AsyncUserRepository,
+    AsyncCategoryRepository,
+    AsyncIncomeRepository,
+    AsyncExpenseRepository,
+    AsyncMonthlyRollupRepository,
+    AsyncDashboardRepository,
+)
+from app.persistence.unit_of_work import is_pinned_to_primary
+from app.persistence.pool_metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+from app.persistence.sharding import current_shard
+from app.persistence.sqlite_profile import apply_pragmas
+
+
+def _create_async_engine(uri: str):
+    # Same pool sizing and metrics as the sync engines
+    options = engine_options(uri)
+    if "pool_size" in options:
+        options["poolclass"] = TimedAsyncAdaptedQueuePool
+    engine = create_async_engine(uri, **options)
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+def _async_engines() -> dict:
+    """
+    Return the running event loop's async engines, keyed like db.engines
+    ({None: primary, "replica": replica, "shard_0": ..., "shard_0_replica": ...}).
+    
+    Pooled asyncio connections cannot move between event loops, so engines
+    are created per loop. Async views all run on the worker's one
+    long-lived loop (see EventLoopThread), so their connections are pooled
+    across requests.
+    """
+    by_loop = current_app.extensions.setdefault("async_engines", weakref.WeakKeyDictionary())
+    loop = asyncio.get_running_loop()
+    engines = by_loop.get(loop)
+    if engines is None:
+        config = current_app.config
+        engines = {None: _create_async_engine(config["ASYNC_DATABASE_URI"])}
+        if config.get("ASYNC_REPLICA_DATABASE_URI"):
+            engines["replica"] = _create_async_engine(config["ASYNC_REPLICA_DATABASE_URI"])
+        for bind, uri in zip(config.get("SHARD_BINDS", []), config.get("ASYNC_SHARD_DATABASE_URIS", [])):
+            engines[bind] = _create_async_engine(uri)
+        for bind, uri in zip(config.get("SHARD_BINDS", []), config.get("ASYNC_SHARD_REPLICA_DATABASE_URIS", [])):
+            engines[replica_bind_key(bind)] = _create_async_engine(uri)
+        for engine in engines.values():
+            apply_pragmas(engine.sync_engine, config.get("SQLITE_PRAGMAS"))
+        by_loop[loop] = engines
+    return engines
+
+
+def async_engines_by_bind() -> dict:
+    """
+    Sync faces of the async engines for pool metrics, keyed like
+    _async_engines(). Async views share one loop per worker, so in
+    practice this is that loop's engines.
+    """
+    engines = {}
+    for loop_engines in list(current_app.extensions.get("async_engines", {}).values()):
+        engines.update({bind: engine.sync_engine for bind, engine in loop_engines.items()})
+    return engines
+
+
+def open_async_session() -> AsyncSession:
+    """
+    Open a short-lived AsyncSession for one repository call.
+    
+    Reads go to the request's shard (or the primary), or to that
+    database's replica under the same rules as UnitOfWork.read_only().
+    """
+    engines = _async_engines()
+    shard = current_shard()
+    replica = engines.get(replica_bind_key(shard))
+    if replica is not None and not is_pinned_to_primary():
+        return AsyncSession(replica, expire_on_commit=False)
+    return AsyncSession(engines[shard], expire_on_commit=False)
+
+
+class AsyncUnitOfWork(ABC):
+    """
+    Async Unit of Work
+    
+    Read-only counterpart of UnitOfWork for `async def` views. Every
+    repository call runs in its own short-lived session, so independent
+    calls can be awaited concurrently.
+    
+    Usage:
+        summary, rollups = await asyncio.gather(
+            async_unit_of_work.dashboard.get_summary(user_id, today),
+            async_unit_of_work.monthly_rollups.get_by_user_id(user_id),
+        )
+    """
+    
+    users: AsyncUserRepository
+    categories: AsyncCategoryRepository
+    incomes: AsyncIncomeRepository
+    expenses: AsyncExpenseRepository
+    monthly_rollups: AsyncMonthlyRollupRepository
+    dashboard: AsyncDashboardRepository
+
+
+class AsyncSQLAlchemyUnitOfWork(AsyncUnitOfWork):
+    """
+    SQLAlchemy asyncio implementation of Async Unit of Work.
+    """
+    
+    def __init__(
+        self,
+        user_repo: AsyncUserRepository,
+        category_repo: AsyncCategoryRepository,
+        income_repo: AsyncIncomeRepository,
+        expense_repo: AsyncExpenseRepository,
+        monthly_rollup_repo: AsyncMonthlyRollupRepository,
+        dashboard_repo: AsyncDashboardRepository,
+    ):
+        self.users = user_repo
+        self.categories = category_repo
+        self.incomes = income_repo
+        self.expenses = expense_repo
+        self.monthly_rollups = monthly_rollup_repo
+        self.dashboard = dashboard_repo
@@ -0,0 +1,72 @@
+"""Bulk write helpers shared by the repository implementations"""
+from typing import List, Optional
+from sqlalchemy import insert, text
+from app.ext import db
+from app.persistence.query_cache import mark_written
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _mysql_id_step(orm_cls) -> Optional[int]:
+    """
+    Spacing of the ids MySQL assigns to the rows of one multi-row INSERT
+    (``auto_increment_increment``), or None when they may not be evenly
+    spaced: ``innodb_autoinc_lock_mode=2`` interleaves the ids of
+    concurrent inserts.
+    """
+    step, lock_mode = db.session.execute(
+        text("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode"),
+        bind_arguments={"mapper": orm_cls},
+    ).one()
+    return None if int(lock_mode) == 2 else int(step)
+
+
+def bulk_insert(orm_cls, rows: List[dict], chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[int]:
+    """
+    Insert rows using multi-row INSERT statements and return their ids.
+
+    Dialects that support RETURNING for batched inserts (SQLite, MariaDB,
+    PostgreSQL) get the ids back from the INSERT itself. On MySQL each chunk
+    is sent as a single multi-row INSERT and the ids are derived from
+    LAST_INSERT_ID(), stepping by ``auto_increment_increment``. Under
+    ``innodb_autoinc_lock_mode=2`` the ids of one statement are not
+    guaranteed to be evenly spaced, so rows are inserted one at a time
+    instead (set the lock mode to 1 to keep the multi-row path).
+
+    Both multi-row paths rely on auto-increment ids being assigned in
+    ascending VALUES order within one statement, which lets ids be matched
+    back to rows without a sentinel column (requesting ordered RETURNING
+    would make SQLAlchemy fall back to one INSERT per row on SQLite).
+
+    Args:
+        orm_cls: SQLAlchemy model class with an integer ``id`` primary key
+        rows: Column values for each row
+        chunk_size: Maximum number of rows per INSERT statement
+
+    Returns:
+        List of new ids, in the same order as ``rows``
+    """
+    table = orm_cls.__table__
+    dialect = db.session.get_bind(mapper=orm_cls).dialect
+    ids = []
+    if not rows:
+        return ids
+    mark_written(*{row["user_id"] for row in rows if row.get("user_id") is not None})
+
+    if dialect.insert_executemany_returning:
+        for start in range(0, len(rows), chunk_size):
+            result = db.session.execute(insert(table).returning(table.c.id), rows[start:start + chunk_size])
+            ids.extend(sorted(result.scalars().all()))
+        return ids
+
+    step = _mysql_id_step(orm_cls)
+    if step is None:
+        for row in rows:
+            ids.append(db.session.execute(insert(table).values(row)).inserted_primary_key[0])
+        return ids
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        first_id = db.session.execute(insert(table).values(chunk)).lastrowid
+        ids.extend(range(first_id, first_id + len(chunk) * step, step))
+    return ids
@@ -0,0 +1,49 @@
+"""Identity Map - Request-scoped cache of loaded domain entities"""
+from typing import Dict, Optional, Tuple
+from app.ext import db
+
+
+class IdentityMap:
+    """
+    Keeps one domain entity per (entity type, id) for the current session.
+
+    Repositories consult it before querying so an entity is loaded at most
+    once per request, and keep it in sync on save/update/delete.
+    """
+
+    def __init__(self):
+        self._entities: Dict[Tuple[type, int], object] = {}
+
+    def get(self, entity_type: type, entity_id: int) -> Optional[object]:
+        """Return the cached entity or None"""
+        return self._entities.get((entity_type, entity_id))
+
+    def add(self, entity) -> None:
+        """Register (or replace) an entity that has an id"""
+        if entity is not None and entity.id is not None:
+            self._entities[(type(entity), entity.id)] = entity
+
+    def remove(self, entity_type: type, entity_id: int) -> None:
+        """Forget a single entity"""
+        self._entities.pop((entity_type, entity_id), None)
+
+    def clear(self) -> None:
+        """Forget everything (e.g. after a rollback)"""
+        self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+def current_identity_map() -> IdentityMap:
+    """
+    Return the identity map bound to the current SQLAlchemy session.
+
+    Flask-SQLAlchemy scopes sessions to the app context, so the map lives
+    exactly as long as the request (or CLI command) that created it.
+    """
+    info = db.session.info
+    identity_map = info.get("identity_map")
+    if identity_map is None:
+        identity_map = info["identity_map"] = IdentityMap()
+    return identity_map
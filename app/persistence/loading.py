@@ -0,0 +1,43 @@
+"""Loader options for the repository loading profiles
+
+Turns a profile name from app.repositories.loading into load_only()/defer()
+options for one ORM class, and reads rows back without touching columns the
+profile left unloaded (which would lazy-load them one row at a time).
+"""
+from typing import Any, Callable, Iterable, List
+from sqlalchemy import inspect
+from sqlalchemy.orm import defer, load_only
+from app.repositories.loading import SUMMARY, LIST, FULL
+
+
+def profile_options(orm_cls, profile: str, summary: Iterable[str], deferred: Iterable[str]) -> List:
+    """
+    Build the loader options for ``profile``.
+
+    Args:
+        orm_cls: Mapped class being queried
+        profile: One of summary, list or full
+        summary: Column names loaded by the summary profile
+        deferred: Column names the list profile leaves out
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile == FULL:
+        return []
+    if profile == SUMMARY:
+        return [load_only(*(getattr(orm_cls, name) for name in summary))]
+    if profile == LIST:
+        return [defer(getattr(orm_cls, name)) for name in deferred]
+    raise ValueError(f"Unknown loading profile {profile!r}")
+
+
+def column_reader(o) -> Callable[[str], Any]:
+    """
+    Getter for the columns of ``o`` that returns None for any column the
+    profile left unloaded instead of lazy-loading it.
+    """
+    unloaded = inspect(o).unloaded
+    if not unloaded:
+        return lambda name: getattr(o, name)
+    return lambda name: None if name in unloaded else getattr(o, name)
@@ -0,0 +1,159 @@
+"""Connection pool metrics - Per-engine counters fed by SQLAlchemy pool events
+
+Numbers are per process: each worker has its own pools, so size them from
+the figures reported by every worker (see GET /internal/pool-stats).
+"""
+import threading
+import time
+from typing import Dict, Optional
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolStats:
+    """Running counters for one engine's pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def record_checkout(self, pool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            if isinstance(pool, QueuePool):
+                self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+                self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool) -> dict:
+        """Counters plus the pool's live gauges, as plain JSON-able values"""
+        with self._lock:
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 3),
+                "wait_ms_avg": round(self.wait_seconds_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+            }
+        data.update(pool_gauges(pool))
+        return data
+
+
+class _TimedPool:
+    """
+    Queue pool mixin that times every checkout (waiting for a free
+    connection or opening a new one) and counts checkout timeouts. The
+    stats object survives Engine.dispose(), which replaces the pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedPool, QueuePool):
+    """QueuePool with checkout timing, for the sync engines"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPool, AsyncAdaptedQueuePool):
+    """The asyncio variant, for the async engines' sync_engine"""
+
+
+def pool_gauges(pool) -> dict:
+    """Live pool state (QueuePool only reports sizes)"""
+    gauges = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        gauges.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    return gauges
+
+
+def use_timed_pool(app) -> None:
+    """Make queue-pooled engines use TimedQueuePool; call before db.init_app()"""
+    options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    if "pool_size" in options:
+        options.setdefault("poolclass", TimedQueuePool)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+
+def instrument_engine(engine) -> None:
+    """Attach the counting listeners to an engine's pool (and its replacements)"""
+    stats = getattr(engine.pool, "stats", None)
+    if stats is None:
+        return
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        stats.increment("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.record_checkout(engine.pool)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        stats.increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("soft_invalidations")
+
+
+def pool_snapshot(engines: Dict[Optional[str], object]) -> Dict[str, dict]:
+    """Stats for every engine, keyed by bind name ("primary" for the default)"""
+    snapshot = {}
+    for bind, engine in engines.items():
+        stats = getattr(engine.pool, "stats", None)
+        name = bind or "primary"
+        snapshot[name] = stats.snapshot(engine.pool) if stats is not None else pool_gauges(engine.pool)
+    return snapshot
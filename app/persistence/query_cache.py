@@ -0,0 +1,292 @@
+"""Repository query-result cache - Per-user reads reused across requests
+
+Listed read methods of a repository go through a cachelib backend, keyed by
+method, arguments and the user's data version. Writes are tracked on the
+session (ORM flushes automatically, Core statements through mark_written())
+and SQLAlchemyUnitOfWork.commit() gives every written user a new version, so
+their old entries are never read again and age out through LRU/TTL eviction.
+
+Versions always live in a FileSystemCache under QUERY_CACHE_DIR, shared by
+every worker of the host, so a commit in one worker invalidates the entries
+of all of them. Entries live in the filesystem backend (shared too) or, with
+``simple``, in each worker's memory. Workers on different hosts share
+neither; run one host per cache directory or turn the cache off.
+"""
+import inspect
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from time import time
+from typing import Iterable, Optional
+from uuid import uuid4
+from cachelib import BaseCache, FileSystemCache, SimpleCache
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from app.ext import db
+
+_WRITTEN_USERS = "query_cache_written_users"
+_WRITTEN_ALL = "query_cache_written_all"
+_GLOBAL_VERSION_KEY = "v:*"
+_MISSING = object()
+
+
+class LRUCache(SimpleCache):
+    """
+    cachelib SimpleCache that evicts the least recently used entries once
+    over threshold (after dropping expired ones), instead of those closest
+    to expiry.
+    """
+
+    def __init__(self, threshold: int = 500, default_timeout: int = 300):
+        super().__init__(threshold, default_timeout)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self) -> None:
+        if self._over_threshold():
+            self._remove_expired(time())
+        while self._over_threshold():
+            self._cache.popitem(last=False)
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._cache.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires != 0 and expires <= time():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        return self.serializer.loads(value)
+
+    def set(self, key: str, value, timeout: Optional[int] = None) -> bool:
+        item = (self._normalize_timeout(timeout), self.serializer.dumps(value))
+        with self._lock:
+            self._cache[key] = item
+            self._cache.move_to_end(key)
+            self._prune()
+        return True
+
+    def add(self, key: str, value, timeout: Optional[int] = None) -> bool:
+        item = (self._normalize_timeout(timeout), self.serializer.dumps(value))
+        with self._lock:
+            if self.has(key):
+                return False
+            self._cache[key] = item
+            self._prune()
+        return True
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class QueryCache:
+    """Versioned read-through cache with hit/miss counters (per process)"""
+
+    def __init__(self, backend: BaseCache, versions: BaseCache, timeout: int):
+        self.backend = backend
+        self.versions = versions
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.invalidations = 0
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def key_for(self, method: str, user_id: int, arguments: tuple) -> str:
+        """Cache key for one call, under the user's (and global) current version"""
+        user_key = f"v:{user_id}"
+        global_version, user_version = self.versions.get_many(_GLOBAL_VERSION_KEY, user_key)
+        # A version lost from the store comes back as a fresh random one,
+        # so entries written under the old one can never be read again
+        if global_version is None:
+            global_version = self._new_version(_GLOBAL_VERSION_KEY)
+        if user_version is None:
+            user_version = self._new_version(user_key)
+        return f"q:{method}:{user_id}:{global_version}:{user_version}:{arguments!r}"
+
+    def _new_version(self, key: str) -> str:
+        version = uuid4().hex
+        if not self.versions.add(key, version, timeout=0):
+            # Another thread or worker created it first
+            version = self.versions.get(key) or version
+        return version
+
+    def lookup(self, key: str):
+        """Cached value for key, or _MISSING"""
+        entry = self.backend.get(key)
+        if entry is None:
+            self.record("misses")
+            return _MISSING
+        self.record("hits")
+        # Stored in a 1-tuple so a cached None is told apart from a miss
+        return entry[0]
+
+    def store(self, key: str, value) -> None:
+        self.backend.set(key, (value,), timeout=self.timeout)
+
+    def bump(self, user_ids: Iterable[int] = (), everyone: bool = False) -> None:
+        """Give users (or, with everyone, all users) a new data version"""
+        keys = [_GLOBAL_VERSION_KEY] if everyone else [f"v:{user_id}" for user_id in user_ids]
+        for key in keys:
+            self.versions.set(key, uuid4().hex, timeout=0)
+            self.record("invalidations")
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            data = {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bypasses": self.bypasses,
+                "invalidations": self.invalidations,
+            }
+        if isinstance(self.backend, LRUCache):
+            data["entries"] = len(self.backend)
+        return data
+
+
+def create_query_cache(config) -> Optional[QueryCache]:
+    """Build the cache from QUERY_CACHE_* settings (None when disabled)"""
+    cache_type = (config.get("QUERY_CACHE_TYPE") or "null").lower()
+    timeout = config.get("QUERY_CACHE_TIMEOUT", 300)
+    threshold = config.get("QUERY_CACHE_THRESHOLD", 2000)
+    cache_dir = config.get("QUERY_CACHE_DIR")
+    if cache_type == "simple":
+        backend = LRUCache(threshold=threshold, default_timeout=timeout)
+    elif cache_type == "filesystem":
+        backend = FileSystemCache(os.path.join(cache_dir, "entries"), threshold=threshold, default_timeout=timeout)
+    elif cache_type == "null":
+        return None
+    else:
+        raise ValueError(f"Unknown QUERY_CACHE_TYPE {cache_type!r}")
+    # One file per user ever written; never pruned, so no version is lost early
+    versions = FileSystemCache(os.path.join(cache_dir, "versions"), threshold=0, default_timeout=0)
+    return QueryCache(backend, versions, timeout)
+
+
+def init_query_cache(app) -> None:
+    app.extensions["query_cache"] = create_query_cache(app.config)
+
+
+def current_query_cache() -> Optional[QueryCache]:
+    return current_app.extensions.get("query_cache") if has_app_context() else None
+
+
+# Write tracking
+
+def mark_written(*user_ids: int) -> None:
+    """Record users whose rows a Core statement changed in this transaction"""
+    db.session.info.setdefault(_WRITTEN_USERS, set()).update(user_ids)
+
+
+def mark_all_written() -> None:
+    """Record a write that may touch any user's rows (bulk maintenance)"""
+    db.session.info[_WRITTEN_ALL] = True
+
+
+def has_pending_writes() -> bool:
+    info = db.session.info
+    session = db.session()
+    return bool(info.get(_WRITTEN_USERS) or info.get(_WRITTEN_ALL) or session.new or session.dirty or session.deleted)
+
+
+def publish_writes() -> None:
+    """After a commit: new versions for every user written in the transaction"""
+    info = db.session.info
+    user_ids = info.pop(_WRITTEN_USERS, set())
+    everyone = info.pop(_WRITTEN_ALL, False)
+    cache = current_query_cache()
+    if cache is not None and (user_ids or everyone):
+        cache.bump(user_ids, everyone=everyone)
+
+
+def discard_writes() -> None:
+    """After a rollback: nothing was written"""
+    db.session.info.pop(_WRITTEN_USERS, None)
+    db.session.info.pop(_WRITTEN_ALL, None)
+
+
+@event.listens_for(db.session, "after_flush")
+def _track_flushed_writes(session, flush_context):
+    user_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) == "users":
+            user_ids.add(obj.id)
+        elif getattr(obj, "user_id", None) is not None:
+            user_ids.add(obj.user_id)
+    if user_ids:
+        session.info.setdefault(_WRITTEN_USERS, set()).update(user_ids)
+
+
+class CachedRepository:
+    """
+    Wraps a repository so the listed read methods (sync or async) go
+    through the query cache. Each must take a ``user_id`` argument; every
+    other attribute is passed through untouched.
+
+    Reads bypass the cache while the session holds uncommitted writes, so a
+    transaction never sees (or caches) data from before its own changes.
+    """
+
+    def __init__(self, repository, cached_methods: Iterable[str]):
+        self._repository = repository
+        self._prefix = type(repository).__name__
+        self._cached_methods = frozenset(cached_methods)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._repository, name)
+        if name in self._cached_methods:
+            attr = self._wrap(name, attr)
+            # Resolved once; later lookups skip __getattr__
+            setattr(self, name, attr)
+        return attr
+
+    def _wrap(self, name: str, method):
+        signature = inspect.signature(method)
+        qualified = f"{self._prefix}.{name}"
+
+        def key_for(cache, args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(bound.arguments.items())
+            return cache.key_for(qualified, bound.arguments["user_id"], arguments)
+
+        if inspect.iscoroutinefunction(method):
+            @wraps(method)
+            async def cached_async_call(*args, **kwargs):
+                # The async unit of work is read-only, so no pending-write check
+                cache = current_query_cache()
+                if cache is None:
+                    return await method(*args, **kwargs)
+                key = key_for(cache, args, kwargs)
+                value = cache.lookup(key)
+                if value is _MISSING:
+                    value = await method(*args, **kwargs)
+                    cache.store(key, value)
+                return value
+            return cached_async_call
+
+        @wraps(method)
+        def cached_call(*args, **kwargs):
+            cache = current_query_cache()
+            if cache is None:
+                return method(*args, **kwargs)
+            if has_pending_writes():
+                cache.record("bypasses")
+                return method(*args, **kwargs)
+            key = key_for(cache, args, kwargs)
+            value = cache.lookup(key)
+            if value is _MISSING:
+                value = method(*args, **kwargs)
+                cache.store(key, value)
+            return value
+        return cached_call
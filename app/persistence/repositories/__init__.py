@@ -6,6 +6,16 @@ from app.persistence.repositories.expense_repository_impl import ExpenseReposito
 from app.persistence.repositories.saving_goal_repository_impl import SavingGoalRepositoryImpl
 from app.persistence.repositories.debt_payment_repository_impl import DebtPaymentsRepositoryImpl
 from app.persistence.repositories.saving_transactions_repository_impl import SavingTransactionsRepositoryImpl
+from app.persistence.repositories.monthly_rollup_repository_impl import MonthlyRollupRepositoryImpl
+from app.persistence.repositories.dashboard_repository_impl import DashboardRepositoryImpl
+from app.persistence.repositories.async_repository_impl import (
+    AsyncUserRepositoryImpl,
+    AsyncCategoryRepositoryImpl,
+    AsyncIncomeRepositoryImpl,
+    AsyncExpenseRepositoryImpl,
+    AsyncMonthlyRollupRepositoryImpl,
+    AsyncDashboardRepositoryImpl,
+)
 
 __all__ = [
     "UserRepositoryImpl",
@@ -16,4 +26,12 @@ __all__ = [
     "SavingGoalRepositoryImpl",
     "DebtPaymentsRepositoryImpl",
     "SavingTransactionsRepositoryImpl",
+    "MonthlyRollupRepositoryImpl",
+    "DashboardRepositoryImpl",
+    "AsyncUserRepositoryImpl",
+    "AsyncCategoryRepositoryImpl",
+    "AsyncIncomeRepositoryImpl",
+    "AsyncExpenseRepositoryImpl",
+    "AsyncMonthlyRollupRepositoryImpl",
+    "AsyncDashboardRepositoryImpl",
 ]
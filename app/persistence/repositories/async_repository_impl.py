@@ -0,0 +1,121 @@
+from typing import List, Optional
+from datetime import date
+from sqlalchemy import bindparam, select
+from app.repositories.async_repositories import (
+    AsyncUserRepository,
+    AsyncCategoryRepository,
+    AsyncIncomeRepository,
+    AsyncExpenseRepository,
+    AsyncMonthlyRollupRepository,
+    AsyncDashboardRepository,
+)
+from app.repositories.read_models import DashboardSummary, MonthlyRollup
+from app.model.m_Users import Users as UserORM
+from app.model.m_Categories import Categories as CategoryORM
+from app.model.m_Income import Income as IncomeORM
+from app.model.m_Expenses import Expenses as ExpenseORM
+from app.model.m_IncomeArchive import IncomeArchive as IncomeArchiveORM
+from app.model.m_ExpensesArchive import ExpensesArchive as ExpenseArchiveORM
+from app.domain.entities import (
+    User as DomainUser,
+    Category as DomainCategory,
+    Income as DomainIncome,
+    Expense as DomainExpense,
+)
+from app.persistence.async_unit_of_work import open_async_session
+from app.persistence.repositories.dashboard_repository_impl import summary_statement, to_summary
+from app.persistence.repositories.expense_repository_impl import to_expense
+from app.persistence.repositories.income_repository_impl import to_income
+from app.persistence.repositories.monthly_rollup_repository_impl import rollups_statement, to_rollup
+
+_GET_USER_BY_EMAIL = select(UserORM).where(UserORM.email == bindparam("email")).limit(1)
+_GET_USER_BY_ID = select(UserORM).where(UserORM.id == bindparam("user_id")).limit(1)
+_GET_CATEGORY_BY_ID = select(CategoryORM).where(CategoryORM.id == bindparam("category_id")).limit(1)
+_GET_INCOME_BY_ID = select(IncomeORM).where(IncomeORM.id == bindparam("income_id")).limit(1)
+_GET_EXPENSE_BY_ID = select(ExpenseORM).where(ExpenseORM.id == bindparam("expense_id")).limit(1)
+_GET_ARCHIVED_INCOME_BY_ID = select(IncomeArchiveORM).where(IncomeArchiveORM.id == bindparam("income_id")).limit(1)
+_GET_ARCHIVED_EXPENSE_BY_ID = select(ExpenseArchiveORM).where(ExpenseArchiveORM.id == bindparam("expense_id")).limit(1)
+
+
+async def _first(stmt, params: dict):
+    async with open_async_session() as session:
+        return (await session.execute(stmt, params)).scalars().first()
+
+
+class AsyncUserRepositoryImpl(AsyncUserRepository):
+    async def get_by_email(self, email: str) -> Optional[DomainUser]:
+        orm = await _first(_GET_USER_BY_EMAIL, {"email": email})
+        if orm is None:
+            return None
+        return DomainUser(
+            firstname=orm.firstname,
+            lastname=orm.lastname,
+            email=orm.email,
+            password_hash=orm.password_hash,
+            id=orm.id,
+        )
+
+    async def get_by_id(self, user_id: int) -> Optional[DomainUser]:
+        orm = await _first(_GET_USER_BY_ID, {"user_id": user_id})
+        if orm is None:
+            return None
+        return DomainUser(
+            firstname=orm.firstname,
+            lastname=orm.lastname,
+            email=orm.email,
+            password_hash=orm.password_hash,
+            id=orm.id,
+        )
+
+
+class AsyncCategoryRepositoryImpl(AsyncCategoryRepository):
+    async def get_by_id(self, category_id: int) -> Optional[DomainCategory]:
+        orm = await _first(_GET_CATEGORY_BY_ID, {"category_id": category_id})
+        if orm is None:
+            return None
+        return DomainCategory(
+            user_id=orm.user_id,
+            type=orm.type,
+            name=orm.name,
+            description=orm.description,
+            id=orm.id,
+        )
+
+
+class AsyncIncomeRepositoryImpl(AsyncIncomeRepository):
+    async def get_by_id(self, income_id: int) -> Optional[DomainIncome]:
+        orm = await _first(_GET_INCOME_BY_ID, {"income_id": income_id})
+        if orm is None:
+            orm = await _first(_GET_ARCHIVED_INCOME_BY_ID, {"income_id": income_id})
+        if orm is None:
+            return None
+        return to_income(orm)
+
+
+class AsyncExpenseRepositoryImpl(AsyncExpenseRepository):
+    async def get_by_id(self, expense_id: int) -> Optional[DomainExpense]:
+        orm = await _first(_GET_EXPENSE_BY_ID, {"expense_id": expense_id})
+        if orm is None:
+            orm = await _first(_GET_ARCHIVED_EXPENSE_BY_ID, {"expense_id": expense_id})
+        if orm is None:
+            return None
+        return to_expense(orm)
+
+
+class AsyncMonthlyRollupRepositoryImpl(AsyncMonthlyRollupRepository):
+    async def get_by_user_id(
+        self,
+        user_id: int,
+        kind: Optional[str] = None,
+        since: Optional[date] = None,
+    ) -> List[MonthlyRollup]:
+        async with open_async_session() as session:
+            result = await session.execute(rollups_statement(user_id, kind, since))
+            return [to_rollup(r) for r in result]
+
+
+class AsyncDashboardRepositoryImpl(AsyncDashboardRepository):
+    async def get_summary(self, user_id: int, today: date, top_n: int = 5) -> Optional[DashboardSummary]:
+        async with open_async_session() as session:
+            result = await session.execute(summary_statement(user_id, today, top_n))
+            return to_summary(result.all())
@@ -1,10 +1,89 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict
+from datetime import datetime
 from app.repositories.category_repository import CategoryRepository
 from app.model.m_Categories import Categories as CategoryORM
+from app.model.m_Income import Income as IncomeORM
+from app.model.m_Expenses import Expenses as ExpenseORM
+from app.model.m_IncomeArchive import IncomeArchive as IncomeArchiveORM
+from app.model.m_ExpensesArchive import ExpensesArchive as ExpenseArchiveORM
 from app.ext import db
+from app.persistence.bulk import bulk_insert
+from app.persistence.identity_map import current_identity_map
+from app.persistence.loading import column_reader, profile_options
+from app.persistence.query_cache import mark_written
 from app.domain.entities import Category as DomainCategory
-from app.repositories.exceptions import EntityNotFoundError
+from app.repositories.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from app.repositories.loading import FULL
+from app.repositories.read_models import CategoryUsage
+from app.domain.money import Money
 from sqlalchemy.sql import exists
+from sqlalchemy import DateTime, bindparam, cast, func, null, select, union_all
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(CategoryORM)
+    .where(CategoryORM.id == bindparam("category_id"), CategoryORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
+_GET_ID_BY_USER_TYPE_AND_NAME = (
+    select(CategoryORM.id)
+    .where(
+        CategoryORM.user_id == bindparam("user_id"),
+        CategoryORM.type == bindparam("type"),
+        CategoryORM.name == bindparam("name"),
+    )
+    .limit(1)
+)
+_UNIQUE_KEY = ("user_id", "type", "name")
+
+# (ORM class, date column, is income) of every table that references a category
+_USAGE_SOURCES = (
+    (IncomeORM, IncomeORM.received_date, True),
+    (ExpenseORM, ExpenseORM.expense_date, False),
+    (IncomeArchiveORM, IncomeArchiveORM.received_date, True),
+    (ExpenseArchiveORM, ExpenseArchiveORM.expense_date, False),
+)
+
+
+def _usage_statement(user_id: int):
+    """
+    One grouped query over every category of the user, left joined to the
+    union of their income and expense rows. Income dates (DATE) and expense
+    dates (DATETIME) go in separate columns so each keeps its own type.
+    """
+    legs = [
+        select(
+            orm_cls.category_id,
+            orm_cls.amount,
+            (date_column if is_income else cast(null(), IncomeORM.received_date.type)).label("income_date"),
+            (cast(null(), DateTime) if is_income else date_column).label("expense_date"),
+        ).where(orm_cls.user_id == user_id)
+        for orm_cls, date_column, is_income in _USAGE_SOURCES
+    ]
+    usage = union_all(*legs).subquery()
+    return (
+        select(
+            CategoryORM.id,
+            func.count(usage.c.category_id),
+            func.sum(usage.c.amount),
+            func.max(usage.c.income_date),
+            func.max(usage.c.expense_date),
+        )
+        .outerjoin(usage, usage.c.category_id == CategoryORM.id)
+        .where(CategoryORM.user_id == user_id)
+        .group_by(CategoryORM.id)
+    )
+
+# Columns per loading profile (see app.repositories.loading)
+_SUMMARY_COLUMNS = ("id", "user_id", "type", "name")
+_DEFERRED_COLUMNS = ("description",)
+
+
+def _query(profile: str):
+    return CategoryORM.query.options(*profile_options(CategoryORM, profile, _SUMMARY_COLUMNS, _DEFERRED_COLUMNS))
 
 
 class CategoryRepositoryImpl(CategoryRepository):
@@ -15,84 +94,138 @@ class CategoryRepositoryImpl(CategoryRepository):
             name=entity.name,
             description=entity.description,
         )
-        db.session.add(orm)
-        db.session.flush()
+        # A savepoint keeps the surrounding unit of work usable after a duplicate
+        try:
+            with db.session.begin_nested():
+                db.session.add(orm)
+        except IntegrityError:
+            raise EntityAlreadyExistsError(f"You already have '{entity.name}' as a category")
         entity.id = orm.id
+        current_identity_map().add(entity)
         return entity
 
+    def save_many(self, entities: List[DomainCategory]) -> List[DomainCategory]:
+        rows = [
+            {
+                "user_id": e.user_id,
+                "type": e.type,
+                "name": e.name,
+                "description": e.description,
+            }
+            for e in entities
+        ]
+        ids = bulk_insert(CategoryORM, rows)
+        identity_map = current_identity_map()
+        for entity, new_id in zip(entities, ids):
+            entity.id = new_id
+            identity_map.add(entity)
+        return entities
+
     def get_by_id(self, category_id: int) -> Optional[DomainCategory]:
+        cached = current_identity_map().get(DomainCategory, category_id)
+        if cached is not None:
+            return cached
         orm = CategoryORM.query.filter_by(id=category_id).first()
         if orm is None:
             return None
-        return DomainCategory(
-            user_id=orm.user_id,
-            type=orm.type,
-            name=orm.name,
-            description=orm.description,
-            id=orm.id,
-        )
+        return self._register(orm)
 
     def get_by_id_and_user_id(self, category_id: int, user_id: int) -> Optional[DomainCategory]:
-        orm = CategoryORM.query.filter_by(id=category_id, user_id=user_id).first()
+        cached = current_identity_map().get(DomainCategory, category_id)
+        if cached is not None:
+            return cached if cached.user_id == user_id else None
+        orm = db.session.execute(
+            _GET_BY_ID_AND_USER_ID, {"category_id": category_id, "user_id": user_id}
+        ).scalars().first()
         if orm is None:
             return None
-        return DomainCategory(
-            user_id=orm.user_id,
-            type=orm.type,
-            name=orm.name,
-            description=orm.description,
-            id=orm.id,
-        )
+        return self._register(orm)
 
     def get_by_name_and_user_id(self, name: str, user_id: int) -> Optional[DomainCategory]:
         orm = CategoryORM.query.filter_by(name=name, user_id=user_id).first()
         if orm is None:
             return None
-        return DomainCategory(
-            user_id=orm.user_id,
-            type=orm.type,
-            name=orm.name,
-            description=orm.description,
-            id=orm.id,
-        )
+        return self._register(orm)
 
-    def get_all_by_user_id(self, user_id: int) -> List[DomainCategory]:
-        orms = CategoryORM.query.filter_by(user_id=user_id).all()
-        return [
-            DomainCategory(
-                user_id=o.user_id,
-                type=o.type,
-                name=o.name,
-                description=o.description,
-                id=o.id,
+    def get_or_create(self, user_id: int, category_type: str, name: str) -> DomainCategory:
+        entity = DomainCategory(user_id=user_id, type=category_type, name=name)
+        table = CategoryORM.__table__
+        row = {"user_id": entity.user_id, "type": entity.type, "name": entity.name}
+        dialect = db.session.get_bind().dialect.name
+        mark_written(entity.user_id)
+
+        # One upsert against uq_categories_user_id_type_name, so concurrent
+        # callers converge on the same row instead of racing a lookup + insert
+        if dialect == "mysql":
+            # LAST_INSERT_ID(id) makes lastrowid report the existing row's id
+            stmt = mysql_insert(table).values(**row)
+            stmt = stmt.on_duplicate_key_update(id=func.last_insert_id(table.c.id))
+            entity.id = db.session.execute(stmt).lastrowid
+        elif dialect == "sqlite":
+            # DO NOTHING would return no row on conflict; a no-op update does
+            stmt = sqlite_insert(table).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c[column] for column in _UNIQUE_KEY],
+                set_={"name": stmt.excluded.name},
             )
-            for o in orms
-        ]
+            entity.id = db.session.execute(stmt.returning(table.c.id)).scalar_one()
+        else:
+            entity.id = db.session.execute(_GET_ID_BY_USER_TYPE_AND_NAME, row).scalar()
+            if entity.id is None:
+                try:
+                    with db.session.begin_nested():
+                        entity.id = db.session.execute(table.insert().values(**row)).inserted_primary_key[0]
+                except IntegrityError:
+                    entity.id = db.session.execute(_GET_ID_BY_USER_TYPE_AND_NAME, row).scalar_one()
 
-    def get_all_by_user_and_type(self, user_id: int, category_type: str) -> List[DomainCategory]:
-        orms = CategoryORM.query.filter_by(user_id=user_id, type=category_type).all()
-        return [
-            DomainCategory(
+        cached = current_identity_map().get(DomainCategory, entity.id)
+        return cached if cached is not None else entity
+
+    def get_all_by_user_id(self, user_id: int, profile: str = FULL) -> List[DomainCategory]:
+        orms = _query(profile).filter_by(user_id=user_id).all()
+        return [self._register(o, profile) for o in orms]
+
+    def iter_all_by_user_id(
+        self, user_id: int, chunk_size: int = 1000, profile: str = FULL
+    ) -> Iterator[DomainCategory]:
+        orms = _query(profile).filter_by(user_id=user_id).yield_per(chunk_size)
+        for o in orms:
+            yield DomainCategory(
                 user_id=o.user_id,
                 type=o.type,
                 name=o.name,
-                description=o.description,
+                description=column_reader(o)("description"),
                 id=o.id,
             )
-            for o in orms
-        ]
+
+    def get_all_by_user_and_type(
+        self, user_id: int, category_type: str, profile: str = FULL
+    ) -> List[DomainCategory]:
+        orms = _query(profile).filter_by(user_id=user_id, type=category_type).all()
+        return [self._register(o, profile) for o in orms]
 
     def exists_with_name_and_user(self, name: str, user_id: int) -> bool:
         return CategoryORM.query.filter_by(name=name, user_id=user_id).first() is not None
 
     def is_in_use(self, category_id: int) -> bool:
-        # Check if any income or expense references this category
-        from app.model.m_Income import Income as IncomeORM
-        from app.model.m_Expenses import Expenses as ExpenseORM
+        # Check if any income or expense, hot or archived, references this category
+        return any(
+            db.session.query(exists().where(orm.category_id == category_id)).scalar()
+            for orm, _, _ in _USAGE_SOURCES
+        )
 
-        income_exists = db.session.query(exists().where(IncomeORM.category_id == category_id)).scalar()
-        expense_exists = db.session.query(exists().where(ExpenseORM.category_id == category_id)).scalar()
-        return bool(income_exists or expense_exists)
+    def usage_stats_by_user(self, user_id: int) -> Dict[int, CategoryUsage]:
+        stats = {}
+        for category_id, count, total, income_date, expense_date in db.session.execute(_usage_statement(user_id)):
+            # DATETIME expense dates are compared as dates
+            dates = [d.date() if isinstance(d, datetime) else d for d in (income_date, expense_date) if d is not None]
+            stats[category_id] = CategoryUsage(
+                category_id=category_id,
+                count=count,
+                total=Money.from_cents(total),
+                last_used=max(dates, default=None),
+            )
+        return stats
 
     def update(self, entity: DomainCategory) -> DomainCategory:
         orm = CategoryORM.query.filter_by(id=entity.id).first()
@@ -101,6 +234,7 @@ class CategoryRepositoryImpl(CategoryRepository):
         orm.name = entity.name
         orm.description = entity.description
         db.session.flush()
+        current_identity_map().add(entity)
         return entity
 
     def delete(self, entity_id: int) -> bool:
@@ -108,6 +242,7 @@ class CategoryRepositoryImpl(CategoryRepository):
         if orm is None:
             return False
         db.session.delete(orm)
+        current_identity_map().remove(DomainCategory, entity_id)
         return True
 
     def create(self, **kwargs) -> DomainCategory:
@@ -125,3 +260,36 @@ class CategoryRepositoryImpl(CategoryRepository):
             )
             for o in orms
         ]
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DomainCategory]:
+        orms = CategoryORM.query.yield_per(chunk_size)
+        for o in orms:
+            yield DomainCategory(
+                user_id=o.user_id,
+                type=o.type,
+                name=o.name,
+                description=o.description,
+                id=o.id,
+            )
+
+    @staticmethod
+    def _register(orm: CategoryORM, profile: str = FULL) -> DomainCategory:
+        """
+        Map a row to a domain category, reusing the request's instance if
+        loaded. Partially loaded categories are never cached, so a later
+        get_by_id() cannot be served one.
+        """
+        identity_map = current_identity_map()
+        cached = identity_map.get(DomainCategory, orm.id)
+        if cached is not None:
+            return cached
+        entity = DomainCategory(
+            user_id=orm.user_id,
+            type=orm.type,
+            name=orm.name,
+            description=column_reader(orm)("description"),
+            id=orm.id,
+        )
+        if profile == FULL:
+            identity_map.add(entity)
+        return entity
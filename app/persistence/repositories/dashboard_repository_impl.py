@@ -0,0 +1,104 @@
+from typing import Optional
+from datetime import date
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.read_models import CategoryTotal, DashboardSummary
+from app.domain.money import Money
+from app.model.m_Users import Users as UserORM
+from app.model.m_MonthlyRollups import MonthlyRollups as MonthlyRollupORM
+from app.model.m_Categories import Categories as CategoryORM
+from app.model.m_Income import Income as IncomeORM
+from app.model.m_SavingTransactions import SavingTransactions as SavingTransactionsORM
+from app.model.m_Debts import Debts as DebtORM
+from app.ext import db
+from sqlalchemy import func, select, true
+
+
+def _rollup_total(user_id: int, kind: str, month: Optional[date] = None):
+    stmt = select(func.coalesce(func.sum(MonthlyRollupORM.total), 0)).where(
+        MonthlyRollupORM.user_id == user_id, MonthlyRollupORM.kind == kind
+    )
+    if month is not None:
+        stmt = stmt.where(MonthlyRollupORM.month == month)
+    return stmt.scalar_subquery()
+
+
+def summary_statement(user_id: int, today: date, top_n: int = 5):
+    """Build the single dashboard SELECT (shared with the async repository)"""
+    month_start = date(today.year, today.month, 1)
+
+    # Income/expense figures come from monthly_rollups, so their cost
+    # depends on the number of months and categories, not on history
+    deposits = (
+        select(func.coalesce(func.sum(IncomeORM.amount), 0))
+        .join(SavingTransactionsORM, SavingTransactionsORM.income_id == IncomeORM.id)
+        .where(SavingTransactionsORM.user_id == user_id, SavingTransactionsORM.txt_type == "deposit")
+        .scalar_subquery()
+    )
+    debt_principal = (
+        select(func.coalesce(func.sum(DebtORM.principal), 0))
+        .where(DebtORM.user_id == user_id, DebtORM.status == "active")
+        .scalar_subquery()
+    )
+    top_categories = (
+        select(
+            MonthlyRollupORM.category_id,
+            CategoryORM.name,
+            func.sum(MonthlyRollupORM.total).label("total"),
+        )
+        .join(CategoryORM, CategoryORM.id == MonthlyRollupORM.category_id)
+        .where(
+            MonthlyRollupORM.user_id == user_id,
+            MonthlyRollupORM.kind == "expense",
+            MonthlyRollupORM.month == month_start,
+        )
+        .group_by(MonthlyRollupORM.category_id, CategoryORM.name)
+        .order_by(func.sum(MonthlyRollupORM.total).desc())
+        .limit(top_n)
+        .subquery()
+    )
+
+    # One row per top category (or a single row when there are none),
+    # each carrying the same scalar totals
+    return (
+        select(
+            _rollup_total(user_id, "income").label("total_income"),
+            _rollup_total(user_id, "expense").label("total_expense"),
+            deposits.label("total_saving_deposits"),
+            debt_principal.label("active_debt_principal"),
+            _rollup_total(user_id, "expense", month_start).label("month_to_date_expense"),
+            UserORM.current_value,
+            top_categories.c.category_id,
+            top_categories.c.name,
+            top_categories.c.total,
+        )
+        .select_from(UserORM)
+        .outerjoin(top_categories, true())
+        .where(UserORM.id == user_id)
+        .order_by(top_categories.c.total.desc())
+    )
+
+
+def to_summary(rows) -> Optional[DashboardSummary]:
+    """Fold the rows of summary_statement() into a DashboardSummary"""
+    if not rows:
+        return None
+
+    first = rows[0]
+    return DashboardSummary(
+        total_income=Money.from_cents(first.total_income),
+        total_expense=Money.from_cents(first.total_expense),
+        total_saving_deposits=Money.from_cents(first.total_saving_deposits),
+        active_debt_principal=Money.from_cents(first.active_debt_principal),
+        month_to_date_expense=Money.from_cents(first.month_to_date_expense),
+        current_value=Money.from_cents(first.current_value),
+        top_categories=[
+            CategoryTotal(category_id=r.category_id, name=r.name, total=Money.from_cents(r.total))
+            for r in rows
+            if r.category_id is not None
+        ],
+    )
+
+
+class DashboardRepositoryImpl(DashboardRepository):
+    def get_summary(self, user_id: int, today: date, top_n: int = 5) -> Optional[DashboardSummary]:
+        return to_summary(db.session.execute(summary_statement(user_id, today, top_n)).all())
@@ -1,6 +1,14 @@
 from app.ext import db
 from app.model.m_DebtPayments import DebtPayments
-from typing import Optional, List
+from typing import Optional, List, Iterator
+from sqlalchemy import bindparam, select
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(DebtPayments)
+    .where(DebtPayments.id == bindparam("entity_id"), DebtPayments.user_id == bindparam("user_id"))
+    .limit(1)
+)
 
 
 class DebtPaymentsRepositoryImpl:
@@ -11,11 +19,26 @@ class DebtPaymentsRepositoryImpl:
         db.session.flush()
         return entity
 
+    def save_many(self, entities: List[DebtPayments]) -> List[DebtPayments]:
+        # The ORM flush batches these into multi-row INSERT .. RETURNING
+        # where the dialect supports it
+        db.session.add_all(entities)
+        db.session.flush()
+        return entities
+
     def get_by_id(self, entity_id: int) -> Optional[DebtPayments]:
         return DebtPayments.query.filter_by(id=entity_id).first()
 
     def get_by_id_and_userid(self, entity_id: int, user_id: int) -> Optional[DebtPayments]:
-        return DebtPayments.query.filter_by(id=entity_id, user_id=user_id).first()
+        return db.session.execute(
+            _GET_BY_ID_AND_USER_ID, {"entity_id": entity_id, "user_id": user_id}
+        ).scalars().first()
+
+    def get_by_expense_id(self, expense_id: int) -> Optional[DebtPayments]:
+        return DebtPayments.query.filter_by(expense_id=expense_id).first()
+
+    def get_by_income_id(self, income_id: int) -> Optional[DebtPayments]:
+        return DebtPayments.query.filter_by(income_id=income_id).first()
 
     def get_all(self) -> List[DebtPayments]:
         return DebtPayments.query.all()
@@ -23,6 +46,12 @@ class DebtPaymentsRepositoryImpl:
     def get_all_by_user(self, user_id: int) -> List[DebtPayments]:
         return DebtPayments.query.filter_by(user_id=user_id).all()
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DebtPayments]:
+        return iter(DebtPayments.query.yield_per(chunk_size))
+
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[DebtPayments]:
+        return iter(DebtPayments.query.filter_by(user_id=user_id).yield_per(chunk_size))
+
     def update(self, entity: DebtPayments) -> DebtPayments:
         db.session.flush()
         return entity
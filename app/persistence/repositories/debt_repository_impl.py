@@ -1,10 +1,19 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from app.repositories.debt_repository import DebtRepository
 from app.model.m_Debts import Debts as DebtORM
 from app.ext import db
+from app.persistence.bulk import bulk_insert
 from app.domain.entities import Debt as DomainDebt
+from app.domain.money import Money
 from app.repositories.exceptions import EntityNotFoundError
-from sqlalchemy import func
+from sqlalchemy import func, bindparam, select
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(DebtORM)
+    .where(DebtORM.id == bindparam("debt_id"), DebtORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
 
 
 class DebtRepositoryImpl(DebtRepository):
@@ -24,11 +33,30 @@ class DebtRepositoryImpl(DebtRepository):
         entity.id = orm.id
         return entity
 
+    def save_many(self, entities: List[DomainDebt]) -> List[DomainDebt]:
+        rows = [
+            {
+                "user_id": e.user_id,
+                "lender": e.lender,
+                "principal": e.principal,
+                "name": e.name,
+                "interest_rate": e.interest_rate,
+                "start_date": e.start_date,
+                "due_date": e.due_date,
+                "status": e.status,
+            }
+            for e in entities
+        ]
+        ids = bulk_insert(DebtORM, rows)
+        for entity, new_id in zip(entities, ids):
+            entity.id = new_id
+        return entities
+
     def get_by_id(self, debt_id: int) -> Optional[DomainDebt]:
         orm = DebtORM.query.filter_by(id=debt_id).first()
         if orm is None:
             return None
-        return DomainDebt(
+        return DomainDebt.from_row(
             user_id=orm.user_id,
             lender=orm.lender,
             principal=orm.principal,
@@ -41,10 +69,12 @@ class DebtRepositoryImpl(DebtRepository):
         )
 
     def get_by_id_and_user_id(self, debt_id: int, user_id: int) -> Optional[DomainDebt]:
-        orm = DebtORM.query.filter_by(id=debt_id, user_id=user_id).first()
+        orm = db.session.execute(
+            _GET_BY_ID_AND_USER_ID, {"debt_id": debt_id, "user_id": user_id}
+        ).scalars().first()
         if orm is None:
             return None
-        return DomainDebt(
+        return DomainDebt.from_row(
             user_id=orm.user_id,
             lender=orm.lender,
             principal=orm.principal,
@@ -59,7 +89,7 @@ class DebtRepositoryImpl(DebtRepository):
     def get_all_by_user_id(self, user_id: int) -> List[DomainDebt]:
         orms = DebtORM.query.filter_by(user_id=user_id).all()
         return [
-            DomainDebt(
+            DomainDebt.from_row(
                 user_id=o.user_id,
                 lender=o.lender,
                 principal=o.principal,
@@ -73,10 +103,25 @@ class DebtRepositoryImpl(DebtRepository):
             for o in orms
         ]
 
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[DomainDebt]:
+        orms = DebtORM.query.filter_by(user_id=user_id).yield_per(chunk_size)
+        for o in orms:
+            yield DomainDebt.from_row(
+                user_id=o.user_id,
+                lender=o.lender,
+                principal=o.principal,
+                interest_rate=o.interest_rate,
+                start_date=o.start_date,
+                due_date=o.due_date,
+                name=o.name,
+                status=o.status,
+                id=o.id,
+            )
+
     def get_active_by_user_id(self, user_id: int) -> List[DomainDebt]:
         orms = DebtORM.query.filter_by(user_id=user_id, status='active').all()
         return [
-            DomainDebt(
+            DomainDebt.from_row(
                 user_id=o.user_id,
                 lender=o.lender,
                 principal=o.principal,
@@ -90,15 +135,15 @@ class DebtRepositoryImpl(DebtRepository):
             for o in orms
         ]
 
-    def calculate_total_principal_by_user_id(self, user_id: int) -> float:
-        total = (
+    def calculate_total_principal_by_user_id(self, user_id: int) -> Money:
+        total = Money.from_cents(
             DebtORM.query
             .with_entities(func.coalesce(func.sum(DebtORM.principal), 0))
             .filter(DebtORM.user_id == user_id)
             .filter(DebtORM.status == 'active')
             .scalar()
         )
-        return float(total)
+        return total
 
     def update(self, entity: DomainDebt) -> DomainDebt:
         orm = DebtORM.query.filter_by(id=entity.id).first()
@@ -127,7 +172,7 @@ class DebtRepositoryImpl(DebtRepository):
     def get_all(self):
         orms = DebtORM.query.all()
         return [
-            DomainDebt(
+            DomainDebt.from_row(
                 user_id=o.user_id,
                 lender=o.lender,
                 principal=o.principal,
@@ -140,3 +185,18 @@ class DebtRepositoryImpl(DebtRepository):
             )
             for o in orms
         ]
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DomainDebt]:
+        orms = DebtORM.query.yield_per(chunk_size)
+        for o in orms:
+            yield DomainDebt.from_row(
+                user_id=o.user_id,
+                lender=o.lender,
+                principal=o.principal,
+                interest_rate=o.interest_rate,
+                start_date=o.start_date,
+                due_date=o.due_date,
+                name=o.name,
+                status=o.status,
+                id=o.id,
+            )
@@ -1,10 +1,91 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple
+from datetime import date, datetime
+from itertools import chain
 from app.repositories.expense_repository import ExpenseRepository
 from app.model.m_Expenses import Expenses as ExpenseORM
+from app.model.m_ExpensesArchive import ExpensesArchive as ExpenseArchiveORM
+from app.model.m_DebtPayments import DebtPayments as DebtPaymentsORM
+from app.model.m_SavingTransactions import SavingTransactions as SavingTransactionsORM
 from app.ext import db
+from app.persistence.archive import archived_through, forget_archived_through, move_to_archive
+from app.persistence.bulk import bulk_insert
+from app.persistence.loading import column_reader, profile_options
+from app.model.m_Categories import Categories as CategoryORM
 from app.domain.entities import Expense as DomainExpense
+from app.domain.money import Money
 from app.repositories.exceptions import EntityNotFoundError
-from sqlalchemy import func
+from app.repositories.loading import FULL
+from app.repositories.read_models import ExpenseListItem, ExpenseSummary
+from sqlalchemy import func, and_, or_, select, bindparam
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(ExpenseORM)
+    .where(ExpenseORM.id == bindparam("expense_id"), ExpenseORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
+_GET_ARCHIVED_BY_ID_AND_USER_ID = (
+    select(ExpenseArchiveORM)
+    .where(ExpenseArchiveORM.id == bindparam("expense_id"), ExpenseArchiveORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
+
+# Columns per loading profile (see app.repositories.loading)
+_SUMMARY_COLUMNS = ("id", "user_id", "category_id", "amount", "expense_date")
+_DEFERRED_COLUMNS = ("remarks",)
+
+
+def _load_options(orm_cls, profile: str):
+    return profile_options(orm_cls, profile, _SUMMARY_COLUMNS, _DEFERRED_COLUMNS)
+
+
+def _query(orm_cls, profile: str):
+    return orm_cls.query.options(*_load_options(orm_cls, profile))
+
+
+def to_expense(o) -> DomainExpense:
+    """Map a hot or archived expense row to the domain entity"""
+    col = column_reader(o)
+    return DomainExpense.from_row(
+        user_id=o.user_id,
+        category_id=o.category_id,
+        name=col("name") or col("payee"),
+        payee=col("payee"),
+        amount=o.amount,
+        expense_date=o.expense_date,
+        payment_method=col("payment_method"),
+        remarks=col("remarks"),
+        id=o.id,
+    )
+
+
+def list_page_statement(orm_cls, user_id: int, after: Optional[Tuple[datetime, int]]):
+    """Keyset-paginated list page query against the hot or archive table"""
+    stmt = (
+        select(
+            orm_cls.id,
+            orm_cls.category_id,
+            CategoryORM.name.label("category_name"),
+            orm_cls.name,
+            orm_cls.payee,
+            orm_cls.amount,
+            orm_cls.expense_date,
+            orm_cls.payment_method,
+            orm_cls.remarks,
+            orm_cls.created_at,
+        )
+        .outerjoin(CategoryORM, CategoryORM.id == orm_cls.category_id)
+        .where(orm_cls.user_id == user_id)
+    )
+    if after is not None:
+        after_date, after_id = after
+        stmt = stmt.where(
+            or_(
+                orm_cls.expense_date < after_date,
+                and_(orm_cls.expense_date == after_date, orm_cls.id < after_id),
+            )
+        )
+    return stmt.order_by(orm_cls.expense_date.desc(), orm_cls.id.desc())
 
 
 class ExpenseRepositoryImpl(ExpenseRepository):
@@ -24,83 +105,151 @@ class ExpenseRepositoryImpl(ExpenseRepository):
         entity.id = orm.id
         return entity
 
+    def save_many(self, entities: List[DomainExpense]) -> List[DomainExpense]:
+        rows = [
+            {
+                "user_id": e.user_id,
+                "category_id": e.category_id,
+                "name": e.name,
+                "payee": e.payee,
+                "amount": e.amount,
+                "expense_date": e.expense_date,
+                "payment_method": e.payment_method,
+                "remarks": e.remarks,
+            }
+            for e in entities
+        ]
+        ids = bulk_insert(ExpenseORM, rows)
+        for entity, new_id in zip(entities, ids):
+            entity.id = new_id
+        return entities
+
     def get_by_id(self, expense_id: int) -> Optional[DomainExpense]:
         orm = ExpenseORM.query.filter_by(id=expense_id).first()
+        if orm is None:
+            orm = ExpenseArchiveORM.query.filter_by(id=expense_id).first()
         if orm is None:
             return None
-        return DomainExpense(
-            user_id=orm.user_id,
-            category_id=orm.category_id,
-            name=orm.name or orm.payee,
-            payee=orm.payee,
-            amount=orm.amount,
-            expense_date=orm.expense_date,
-            payment_method=orm.payment_method,
-            remarks=orm.remarks,
-            id=orm.id,
-        )
+        return to_expense(orm)
 
     def get_by_id_and_user_id(self, expense_id: int, user_id: int) -> Optional[DomainExpense]:
-        orm = ExpenseORM.query.filter_by(id=expense_id, user_id=user_id).first()
+        params = {"expense_id": expense_id, "user_id": user_id}
+        orm = db.session.execute(_GET_BY_ID_AND_USER_ID, params).scalars().first()
+        if orm is None:
+            orm = db.session.execute(_GET_ARCHIVED_BY_ID_AND_USER_ID, params).scalars().first()
         if orm is None:
             return None
-        return DomainExpense(
-            user_id=orm.user_id,
-            category_id=orm.category_id,
-            name=orm.name or orm.payee,
-            payee=orm.payee,
-            amount=orm.amount,
-            expense_date=orm.expense_date,
-            payment_method=orm.payment_method,
-            remarks=orm.remarks,
-            id=orm.id,
-        )
+        return to_expense(orm)
+
+    def get_all_by_user_id(self, user_id: int, profile: str = FULL) -> List[DomainExpense]:
+        orms = _query(ExpenseORM, profile).filter_by(user_id=user_id).all()
+        if self._has_archive(user_id):
+            orms += _query(ExpenseArchiveORM, profile).filter_by(user_id=user_id).all()
+        return [to_expense(o) for o in orms]
+
+    def iter_all_by_user_id(
+        self, user_id: int, chunk_size: int = 1000, profile: str = FULL
+    ) -> Iterator[DomainExpense]:
+        orms = _query(ExpenseORM, profile).filter_by(user_id=user_id).yield_per(chunk_size)
+        if self._has_archive(user_id):
+            orms = chain(orms, _query(ExpenseArchiveORM, profile).filter_by(user_id=user_id).yield_per(chunk_size))
+        for o in orms:
+            yield to_expense(o)
 
-    def get_all_by_user_id(self, user_id: int) -> List[DomainExpense]:
-        orms = ExpenseORM.query.filter_by(user_id=user_id).all()
+    def get_list_page_by_user_id(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[ExpenseListItem], Optional[Tuple[datetime, int]]]:
+        # Fetch one extra row to know whether another page exists
+        rows = db.session.execute(
+            list_page_statement(ExpenseORM, user_id, after).limit(limit + 1)
+        ).all()
+
+        # Only reach into the archive when the page runs past the newest
+        # archived row; recent pages are served from the hot table alone
+        archived_max = self._archived_through(user_id)
+        if archived_max is not None and (len(rows) <= limit or rows[-1].expense_date <= archived_max):
+            rows += db.session.execute(
+                list_page_statement(ExpenseArchiveORM, user_id, after).limit(limit + 1)
+            ).all()
+            rows.sort(key=lambda row: (row.expense_date, row.id), reverse=True)
+            rows = rows[:limit + 1]
+
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (rows[-1].expense_date, rows[-1].id)
+
+        return [ExpenseListItem._make(row) for row in rows], next_after
+
+    def get_summaries_by_user_id(self, user_id: int) -> List[ExpenseSummary]:
+        stmt = select(ExpenseORM.id, ExpenseORM.category_id, ExpenseORM.amount, ExpenseORM.expense_date).where(
+            ExpenseORM.user_id == user_id
+        )
+        if self._has_archive(user_id):
+            stmt = stmt.union_all(
+                select(
+                    ExpenseArchiveORM.id,
+                    ExpenseArchiveORM.category_id,
+                    ExpenseArchiveORM.amount,
+                    ExpenseArchiveORM.expense_date,
+                ).where(ExpenseArchiveORM.user_id == user_id)
+            )
+        rows = db.session.execute(stmt)
         return [
-            DomainExpense(
-                user_id=o.user_id,
-                category_id=o.category_id,
-                name=o.name or o.payee,
-                payee=o.payee,
-                amount=o.amount,
-                expense_date=o.expense_date,
-                payment_method=o.payment_method,
-                remarks=o.remarks,
-                id=o.id,
+            ExpenseSummary(
+                id=row.id,
+                category_id=row.category_id,
+                amount=row.amount,
+                expense_date=row.expense_date.date() if isinstance(row.expense_date, datetime) else row.expense_date,
             )
-            for o in orms
+            for row in rows
         ]
 
-    def calculate_total_by_user_id(self, user_id: int) -> float:
-        total = (
+    def calculate_total_by_user_id(self, user_id: int) -> Money:
+        total = Money.from_cents(
             ExpenseORM.query
             .with_entities(func.coalesce(func.sum(ExpenseORM.amount), 0))
             .filter(ExpenseORM.user_id == user_id)
             .scalar()
         )
-        return float(total)
-
-    def get_by_category_id(self, category_id: int) -> List[DomainExpense]:
-        orms = ExpenseORM.query.filter_by(category_id=category_id).all()
-        return [
-            DomainExpense(
-                user_id=o.user_id,
-                category_id=o.category_id,
-                name=o.name or o.payee,
-                payee=o.payee,
-                amount=o.amount,
-                expense_date=o.expense_date,
-                payment_method=o.payment_method,
-                remarks=o.remarks,
-                id=o.id,
+        if self._has_archive(user_id):
+            total += Money.from_cents(
+                ExpenseArchiveORM.query
+                .with_entities(func.coalesce(func.sum(ExpenseArchiveORM.amount), 0))
+                .filter(ExpenseArchiveORM.user_id == user_id)
+                .scalar()
             )
-            for o in orms
-        ]
+        return total
+
+    def get_by_category_id(self, category_id: int, profile: str = FULL) -> List[DomainExpense]:
+        # Hot table only: the archive is reached through the per-user reads
+        orms = _query(ExpenseORM, profile).filter_by(category_id=category_id).all()
+        return [to_expense(o) for o in orms]
+
+    def archive_before(self, cutoff: date, chunk_size: int = 1000) -> int:
+        return move_to_archive(
+            ExpenseORM,
+            ExpenseArchiveORM,
+            "expense_date",
+            cutoff,
+            chunk_size,
+            referenced_by=(DebtPaymentsORM.expense_id, SavingTransactionsORM.expense_id),
+        )
+
+    def _archived_through(self, user_id: int) -> Optional[datetime]:
+        return archived_through(ExpenseArchiveORM, ExpenseArchiveORM.expense_date, user_id)
+
+    def _has_archive(self, user_id: int) -> bool:
+        return self._archived_through(user_id) is not None
 
     def update(self, entity: DomainExpense) -> DomainExpense:
         orm = ExpenseORM.query.filter_by(id=entity.id).first()
+        if orm is None:
+            orm = ExpenseArchiveORM.query.filter_by(id=entity.id).first()
+            forget_archived_through()
         if orm is None:
             raise EntityNotFoundError('Expense not found')
         orm.name = entity.name
@@ -118,24 +267,19 @@ class ExpenseRepositoryImpl(ExpenseRepository):
 
     def delete(self, entity_id: int) -> bool:
         orm = ExpenseORM.query.filter_by(id=entity_id).first()
+        if orm is None:
+            orm = ExpenseArchiveORM.query.filter_by(id=entity_id).first()
+            forget_archived_through()
         if orm is None:
             return False
         db.session.delete(orm)
         return True
 
     def get_all(self):
-        orms = ExpenseORM.query.all()
-        return [
-            DomainExpense(
-                user_id=o.user_id,
-                category_id=o.category_id,
-                name=o.name or o.payee,
-                payee=o.payee,
-                amount=o.amount,
-                expense_date=o.expense_date,
-                payment_method=o.payment_method,
-                remarks=o.remarks,
-                id=o.id,
-            )
-            for o in orms
-        ]
+        orms = ExpenseORM.query.all() + ExpenseArchiveORM.query.all()
+        return [to_expense(o) for o in orms]
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DomainExpense]:
+        orms = chain(ExpenseORM.query.yield_per(chunk_size), ExpenseArchiveORM.query.yield_per(chunk_size))
+        for o in orms:
+            yield to_expense(o)
@@ -1,10 +1,92 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple
+from datetime import date
+from itertools import chain
 from app.repositories.income_repository import IncomeRepository
 from app.model.m_Income import Income as IncomeORM
+from app.model.m_IncomeArchive import IncomeArchive as IncomeArchiveORM
+from app.model.m_DebtPayments import DebtPayments as DebtPaymentsORM
+from app.model.m_SavingTransactions import SavingTransactions as SavingTransactionsORM
 from app.ext import db
+from app.persistence.archive import archived_through, forget_archived_through, move_to_archive
+from app.persistence.bulk import bulk_insert
+from app.persistence.loading import column_reader, profile_options
+from app.model.m_Categories import Categories as CategoryORM
 from app.domain.entities import Income as DomainIncome
+from app.domain.money import Money
 from app.repositories.exceptions import EntityNotFoundError
-from sqlalchemy import func
+from app.repositories.loading import FULL
+from app.repositories.read_models import IncomeListItem, IncomeSummary
+from sqlalchemy import func, and_, or_, select, bindparam
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(IncomeORM)
+    .where(IncomeORM.id == bindparam("income_id"), IncomeORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
+_GET_ARCHIVED_BY_ID_AND_USER_ID = (
+    select(IncomeArchiveORM)
+    .where(IncomeArchiveORM.id == bindparam("income_id"), IncomeArchiveORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
+
+# Columns per loading profile (see app.repositories.loading)
+_SUMMARY_COLUMNS = ("id", "user_id", "category_id", "amount", "received_date")
+_DEFERRED_COLUMNS = ("remarks",)
+
+
+def _load_options(orm_cls, profile: str):
+    return profile_options(orm_cls, profile, _SUMMARY_COLUMNS, _DEFERRED_COLUMNS)
+
+
+def _query(orm_cls, profile: str):
+    return orm_cls.query.options(*_load_options(orm_cls, profile))
+
+
+def to_income(o, remarks_default: Optional[str] = None) -> DomainIncome:
+    """Map a hot or archived income row to the domain entity"""
+    col = column_reader(o)
+    remarks = col("remarks")
+    return DomainIncome.from_row(
+        user_id=o.user_id,
+        category_id=o.category_id,
+        name=col("name") or col("source"),
+        source=col("source"),
+        amount=o.amount,
+        received_date=o.received_date,
+        payment_method=col("payment_method"),
+        remarks=remarks if remarks is not None else remarks_default,
+        id=o.id,
+    )
+
+
+def list_page_statement(orm_cls, user_id: int, after: Optional[Tuple[date, int]]):
+    """Keyset-paginated list page query against the hot or archive table"""
+    stmt = (
+        select(
+            orm_cls.id,
+            orm_cls.category_id,
+            CategoryORM.name.label("category_name"),
+            orm_cls.name,
+            orm_cls.source,
+            orm_cls.amount,
+            orm_cls.received_date,
+            orm_cls.payment_method,
+            orm_cls.remarks,
+            orm_cls.created_at,
+        )
+        .outerjoin(CategoryORM, CategoryORM.id == orm_cls.category_id)
+        .where(orm_cls.user_id == user_id)
+    )
+    if after is not None:
+        after_date, after_id = after
+        stmt = stmt.where(
+            or_(
+                orm_cls.received_date < after_date,
+                and_(orm_cls.received_date == after_date, orm_cls.id < after_id),
+            )
+        )
+    return stmt.order_by(orm_cls.received_date.desc(), orm_cls.id.desc())
 
 
 class IncomeRepositoryImpl(IncomeRepository):
@@ -24,83 +106,151 @@ class IncomeRepositoryImpl(IncomeRepository):
         entity.id = orm.id
         return entity
 
+    def save_many(self, entities: List[DomainIncome]) -> List[DomainIncome]:
+        rows = [
+            {
+                "user_id": e.user_id,
+                "category_id": e.category_id,
+                "name": e.name,
+                "source": e.source,
+                "amount": e.amount,
+                "received_date": e.received_date,
+                "payment_method": e.payment_method,
+                "remarks": e.remarks,
+            }
+            for e in entities
+        ]
+        ids = bulk_insert(IncomeORM, rows)
+        for entity, new_id in zip(entities, ids):
+            entity.id = new_id
+        return entities
+
     def get_by_id(self, income_id: int) -> Optional[DomainIncome]:
         orm = IncomeORM.query.filter_by(id=income_id).first()
+        if orm is None:
+            orm = IncomeArchiveORM.query.filter_by(id=income_id).first()
         if orm is None:
             return None
-        return DomainIncome(
-            user_id=orm.user_id,
-            category_id=orm.category_id,
-            name=orm.name or orm.source,
-            source=orm.source,
-            amount=orm.amount,
-            received_date=orm.received_date,
-            payment_method=orm.payment_method,
-            remarks=orm.remarks,
-            id=orm.id,
-        )
+        return to_income(orm)
 
     def get_by_id_and_user_id(self, income_id: int, user_id: int) -> Optional[DomainIncome]:
-        orm = IncomeORM.query.filter_by(id=income_id, user_id=user_id).first()
+        params = {"income_id": income_id, "user_id": user_id}
+        orm = db.session.execute(_GET_BY_ID_AND_USER_ID, params).scalars().first()
+        if orm is None:
+            orm = db.session.execute(_GET_ARCHIVED_BY_ID_AND_USER_ID, params).scalars().first()
         if orm is None:
             return None
-        return DomainIncome(
-            user_id=orm.user_id,
-            category_id=orm.category_id,
-            name=orm.name or orm.source,
-            source=orm.source,
-            amount=orm.amount,
-            received_date=orm.received_date,
-            payment_method=orm.payment_method,
-            remarks=orm.remarks,
-            id=orm.id,
-        )
+        return to_income(orm)
+
+    def get_all_by_user_id(self, user_id: int, profile: str = FULL) -> List[DomainIncome]:
+        orms = _query(IncomeORM, profile).filter_by(user_id=user_id).all()
+        if self._has_archive(user_id):
+            orms += _query(IncomeArchiveORM, profile).filter_by(user_id=user_id).all()
+        return [to_income(o, remarks_default="") for o in orms]
+
+    def iter_all_by_user_id(
+        self, user_id: int, chunk_size: int = 1000, profile: str = FULL
+    ) -> Iterator[DomainIncome]:
+        orms = _query(IncomeORM, profile).filter_by(user_id=user_id).yield_per(chunk_size)
+        if self._has_archive(user_id):
+            orms = chain(orms, _query(IncomeArchiveORM, profile).filter_by(user_id=user_id).yield_per(chunk_size))
+        for o in orms:
+            yield to_income(o)
 
-    def get_all_by_user_id(self, user_id: int) -> List[DomainIncome]:
-        orms = IncomeORM.query.filter_by(user_id=user_id).all()
+    def get_list_page_by_user_id(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+    ) -> Tuple[List[IncomeListItem], Optional[Tuple[date, int]]]:
+        # Fetch one extra row to know whether another page exists
+        rows = db.session.execute(
+            list_page_statement(IncomeORM, user_id, after).limit(limit + 1)
+        ).all()
+
+        # Only reach into the archive when the page runs past the newest
+        # archived row; recent pages are served from the hot table alone
+        archived_max = self._archived_through(user_id)
+        if archived_max is not None and (len(rows) <= limit or rows[-1].received_date <= archived_max):
+            rows += db.session.execute(
+                list_page_statement(IncomeArchiveORM, user_id, after).limit(limit + 1)
+            ).all()
+            rows.sort(key=lambda row: (row.received_date, row.id), reverse=True)
+            rows = rows[:limit + 1]
+
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (rows[-1].received_date, rows[-1].id)
+
+        return [IncomeListItem._make(row) for row in rows], next_after
+
+    def get_summaries_by_user_id(self, user_id: int) -> List[IncomeSummary]:
+        stmt = select(IncomeORM.id, IncomeORM.category_id, IncomeORM.amount, IncomeORM.received_date).where(
+            IncomeORM.user_id == user_id
+        )
+        if self._has_archive(user_id):
+            stmt = stmt.union_all(
+                select(
+                    IncomeArchiveORM.id,
+                    IncomeArchiveORM.category_id,
+                    IncomeArchiveORM.amount,
+                    IncomeArchiveORM.received_date,
+                ).where(IncomeArchiveORM.user_id == user_id)
+            )
+        rows = db.session.execute(stmt)
         return [
-            DomainIncome(
-                user_id=o.user_id,
-                category_id=o.category_id,
-                name=o.name or o.source,
-                source=o.source,
-                amount=o.amount,
-                received_date=o.received_date,
-                payment_method=o.payment_method,
-                remarks=o.remarks or "",
-                id=o.id,
+            IncomeSummary(
+                id=row.id,
+                category_id=row.category_id,
+                amount=row.amount,
+                received_date=row.received_date,
             )
-            for o in orms
+            for row in rows
         ]
 
-    def calculate_total_by_user_id(self, user_id: int) -> float:
-        total = (
+    def calculate_total_by_user_id(self, user_id: int) -> Money:
+        total = Money.from_cents(
             IncomeORM.query
             .with_entities(func.coalesce(func.sum(IncomeORM.amount), 0))
             .filter(IncomeORM.user_id == user_id)
             .scalar()
         )
-        return float(total)
-
-    def get_by_category_id(self, category_id: int) -> List[DomainIncome]:
-        orms = IncomeORM.query.filter_by(category_id=category_id).all()
-        return [
-            DomainIncome(
-                user_id=o.user_id,
-                category_id=o.category_id,
-                name=o.name or o.source,
-                source=o.source,
-                amount=o.amount,
-                received_date=o.received_date,
-                payment_method=o.payment_method,
-                remarks=o.remarks,
-                id=o.id,
+        if self._has_archive(user_id):
+            total += Money.from_cents(
+                IncomeArchiveORM.query
+                .with_entities(func.coalesce(func.sum(IncomeArchiveORM.amount), 0))
+                .filter(IncomeArchiveORM.user_id == user_id)
+                .scalar()
             )
-            for o in orms
-        ]
+        return total
+
+    def get_by_category_id(self, category_id: int, profile: str = FULL) -> List[DomainIncome]:
+        # Hot table only: the archive is reached through the per-user reads
+        orms = _query(IncomeORM, profile).filter_by(category_id=category_id).all()
+        return [to_income(o) for o in orms]
+
+    def archive_before(self, cutoff: date, chunk_size: int = 1000) -> int:
+        return move_to_archive(
+            IncomeORM,
+            IncomeArchiveORM,
+            "received_date",
+            cutoff,
+            chunk_size,
+            referenced_by=(DebtPaymentsORM.income_id, SavingTransactionsORM.income_id),
+        )
+
+    def _archived_through(self, user_id: int) -> Optional[date]:
+        return archived_through(IncomeArchiveORM, IncomeArchiveORM.received_date, user_id)
+
+    def _has_archive(self, user_id: int) -> bool:
+        return self._archived_through(user_id) is not None
 
     def update(self, entity: DomainIncome) -> DomainIncome:
         orm = IncomeORM.query.filter_by(id=entity.id).first()
+        if orm is None:
+            orm = IncomeArchiveORM.query.filter_by(id=entity.id).first()
+            forget_archived_through()
         if orm is None:
             raise EntityNotFoundError('Income not found')
         orm.name = entity.name
@@ -118,24 +268,19 @@ class IncomeRepositoryImpl(IncomeRepository):
 
     def delete(self, entity_id: int) -> bool:
         orm = IncomeORM.query.filter_by(id=entity_id).first()
+        if orm is None:
+            orm = IncomeArchiveORM.query.filter_by(id=entity_id).first()
+            forget_archived_through()
         if orm is None:
             return False
         db.session.delete(orm)
         return True
 
     def get_all(self):
-        orms = IncomeORM.query.all()
-        return [
-            DomainIncome(
-                user_id=o.user_id,
-                category_id=o.category_id,
-                name=o.name or o.source,
-                source=o.source,
-                amount=o.amount,
-                received_date=o.received_date,
-                payment_method=o.payment_method,
-                remarks=o.remarks,
-                id=o.id,
-            )
-            for o in orms
-        ]
+        orms = IncomeORM.query.all() + IncomeArchiveORM.query.all()
+        return [to_income(o) for o in orms]
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DomainIncome]:
+        orms = chain(IncomeORM.query.yield_per(chunk_size), IncomeArchiveORM.query.yield_per(chunk_size))
+        for o in orms:
+            yield to_income(o)
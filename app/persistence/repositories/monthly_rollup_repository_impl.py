@@ -0,0 +1,164 @@
+from typing import Dict, List, Optional
+from datetime import date
+from app.repositories.monthly_rollup_repository import MonthlyRollupRepository
+from app.repositories.read_models import MonthlyRollup
+from app.domain.money import Money
+from app.model.m_MonthlyRollups import MonthlyRollups as MonthlyRollupORM
+from app.model.m_Expenses import Expenses as ExpenseORM
+from app.model.m_Income import Income as IncomeORM
+from app.model.m_ExpensesArchive import ExpensesArchive as ExpenseArchiveORM
+from app.model.m_IncomeArchive import IncomeArchive as IncomeArchiveORM
+from app.ext import db, dt
+from app.persistence.bulk import bulk_insert
+from app.persistence.query_cache import mark_all_written, mark_written
+from sqlalchemy import delete, extract, func, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+_BUCKET_KEY = ("user_id", "month", "kind", "category_id")
+
+# (kind, ORM class, date column) of every table that feeds the rollups
+_SOURCES = (
+    ("income", IncomeORM, IncomeORM.received_date),
+    ("expense", ExpenseORM, ExpenseORM.expense_date),
+    ("income", IncomeArchiveORM, IncomeArchiveORM.received_date),
+    ("expense", ExpenseArchiveORM, ExpenseArchiveORM.expense_date),
+)
+
+
+def _month_of(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def rollups_statement(user_id: int, kind: Optional[str] = None, since: Optional[date] = None):
+    """Build the rollup listing SELECT (shared with the async repository)"""
+    stmt = select(
+        MonthlyRollupORM.month,
+        MonthlyRollupORM.kind,
+        MonthlyRollupORM.category_id,
+        MonthlyRollupORM.total,
+        MonthlyRollupORM.count,
+    ).where(MonthlyRollupORM.user_id == user_id)
+    if kind is not None:
+        stmt = stmt.where(MonthlyRollupORM.kind == kind)
+    if since is not None:
+        stmt = stmt.where(MonthlyRollupORM.month >= _month_of(since))
+    return stmt.order_by(MonthlyRollupORM.month, MonthlyRollupORM.kind, MonthlyRollupORM.category_id)
+
+
+def to_rollup(row) -> MonthlyRollup:
+    return MonthlyRollup(month=row.month, kind=row.kind, category_id=row.category_id, total=Money.from_cents(row.total), count=row.count)
+
+
+class MonthlyRollupRepositoryImpl(MonthlyRollupRepository):
+    def apply_delta(
+        self,
+        user_id: int,
+        kind: str,
+        on_date: date,
+        category_id: int,
+        amount_delta: Money,
+        count_delta: int,
+    ) -> None:
+        table = MonthlyRollupORM.__table__
+        row = {
+            "user_id": user_id,
+            "month": _month_of(on_date),
+            "kind": kind,
+            "category_id": category_id,
+            "total": amount_delta,
+            "count": count_delta,
+            "updated_at": dt.now(),
+        }
+        dialect = db.session.get_bind().dialect.name
+        mark_written(user_id)
+
+        # Single-statement upsert so concurrent writers to the same bucket
+        # add up instead of racing on a read-modify-write
+        if dialect == "mysql":
+            stmt = mysql_insert(table).values(**row)
+            stmt = stmt.on_duplicate_key_update(
+                total=table.c.total + stmt.inserted.total,
+                count=table.c["count"] + stmt.inserted["count"],
+                updated_at=stmt.inserted.updated_at,
+            )
+            db.session.execute(stmt)
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(table).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c[name] for name in _BUCKET_KEY],
+                set_={
+                    "total": table.c.total + stmt.excluded.total,
+                    "count": table.c["count"] + stmt.excluded["count"],
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            db.session.execute(stmt)
+        else:
+            result = db.session.execute(
+                update(table)
+                .where(*(table.c[name] == row[name] for name in _BUCKET_KEY))
+                .values(
+                    total=table.c.total + amount_delta,
+                    count=table.c["count"] + count_delta,
+                    updated_at=row["updated_at"],
+                )
+            )
+            if result.rowcount == 0:
+                db.session.execute(table.insert().values(**row))
+
+    def get_by_user_id(
+        self,
+        user_id: int,
+        kind: Optional[str] = None,
+        since: Optional[date] = None,
+    ) -> List[MonthlyRollup]:
+        return [to_rollup(r) for r in db.session.execute(rollups_statement(user_id, kind, since))]
+
+    def get_totals_by_user_id(self, user_id: int) -> Dict[str, Money]:
+        rows = db.session.execute(
+            select(MonthlyRollupORM.kind, func.coalesce(func.sum(MonthlyRollupORM.total), 0))
+            .where(MonthlyRollupORM.user_id == user_id)
+            .group_by(MonthlyRollupORM.kind)
+        ).all()
+        totals = {kind: Money() for kind, _, _ in _SOURCES}
+        totals.update({kind: Money.from_cents(total) for kind, total in rows})
+        return totals
+
+    def rebuild(self, user_id: Optional[int] = None) -> int:
+        clear = delete(MonthlyRollupORM)
+        if user_id is not None:
+            clear = clear.where(MonthlyRollupORM.user_id == user_id)
+            mark_written(user_id)
+        else:
+            mark_all_written()
+        db.session.execute(clear)
+
+        now = dt.now()
+        # Hot and archived rows of one month share a bucket
+        buckets = {}
+        for kind, orm, date_column in _SOURCES:
+            year = extract("year", date_column)
+            month = extract("month", date_column)
+            stmt = select(
+                orm.user_id,
+                year.label("year"),
+                month.label("month"),
+                orm.category_id,
+                func.sum(orm.amount).label("total"),
+                func.count(orm.id).label("count"),
+            ).group_by(orm.user_id, year, month, orm.category_id)
+            if user_id is not None:
+                stmt = stmt.where(orm.user_id == user_id)
+
+            for r in db.session.execute(stmt):
+                key = (r.user_id, date(int(r.year), int(r.month), 1), kind, r.category_id)
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = dict(zip(_BUCKET_KEY, key), total=Money(), count=0, updated_at=now)
+                bucket["total"] += Money.from_cents(r.total)
+                bucket["count"] += r.count
+
+        rows = list(buckets.values())
+        bulk_insert(MonthlyRollupORM, rows)
+        return len(rows)
@@ -1,9 +1,19 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from app.repositories.saving_goal_repository import SavingGoalRepository
 from app.model.m_SavingGoals import SavingGoals as SavingGoalORM
 from app.ext import db
+from app.persistence.bulk import bulk_insert
 from app.domain.entities import SavingGoal as DomainSavingGoal
+from app.domain.money import Money
 from app.repositories.exceptions import EntityNotFoundError
+from sqlalchemy import bindparam, select
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(SavingGoalORM)
+    .where(SavingGoalORM.id == bindparam("goal_id"), SavingGoalORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
 
 
 class SavingGoalRepositoryImpl(SavingGoalRepository):
@@ -20,11 +30,27 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
         entity.id = orm.id
         return entity
 
+    def save_many(self, entities: List[DomainSavingGoal]) -> List[DomainSavingGoal]:
+        rows = [
+            {
+                "user_id": e.user_id,
+                "name": e.name,
+                "target_amount": e.target_amount,
+                "target_date": e.target_date,
+                "remarks": e.remarks,
+            }
+            for e in entities
+        ]
+        ids = bulk_insert(SavingGoalORM, rows)
+        for entity, new_id in zip(entities, ids):
+            entity.id = new_id
+        return entities
+
     def get_by_id(self, goal_id: int) -> Optional[DomainSavingGoal]:
         orm = SavingGoalORM.query.filter_by(id=goal_id).first()
         if orm is None:
             return None
-        goal = DomainSavingGoal(
+        goal = DomainSavingGoal.from_row(
             user_id=orm.user_id,
             name=orm.name,
             target_amount=orm.target_amount,
@@ -32,14 +58,16 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
             remarks=orm.remarks,
             id=orm.id,
         )
-        goal.current_amount = getattr(orm, 'current_amount', 0.0)
+        goal.current_amount = getattr(orm, 'current_amount', Money())
         return goal
 
     def get_by_id_and_user_id(self, goal_id: int, user_id: int) -> Optional[DomainSavingGoal]:
-        orm = SavingGoalORM.query.filter_by(id=goal_id, user_id=user_id).first()
+        orm = db.session.execute(
+            _GET_BY_ID_AND_USER_ID, {"goal_id": goal_id, "user_id": user_id}
+        ).scalars().first()
         if orm is None:
             return None
-        goal = DomainSavingGoal(
+        goal = DomainSavingGoal.from_row(
             user_id=orm.user_id,
             name=orm.name,
             target_amount=orm.target_amount,
@@ -47,14 +75,14 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
             remarks=orm.remarks,
             id=orm.id,
         )
-        goal.current_amount = getattr(orm, 'current_amount', 0.0)
+        goal.current_amount = getattr(orm, 'current_amount', Money())
         return goal
 
     def get_all_by_user_id(self, user_id: int) -> List[DomainSavingGoal]:
         orms = SavingGoalORM.query.filter_by(user_id=user_id).all()
         goals = []
         for o in orms:
-            g = DomainSavingGoal(
+            g = DomainSavingGoal.from_row(
                 user_id=o.user_id,
                 name=o.name,
                 target_amount=o.target_amount,
@@ -62,16 +90,30 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
                 remarks=o.remarks,
                 id=o.id,
             )
-            g.current_amount = getattr(o, 'current_amount', 0.0)
+            g.current_amount = getattr(o, 'current_amount', Money())
             goals.append(g)
         return goals
 
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[DomainSavingGoal]:
+        orms = SavingGoalORM.query.filter_by(user_id=user_id).yield_per(chunk_size)
+        for o in orms:
+            g = DomainSavingGoal.from_row(
+                user_id=o.user_id,
+                name=o.name,
+                target_amount=o.target_amount,
+                target_date=o.target_date,
+                remarks=o.remarks,
+                id=o.id,
+            )
+            g.current_amount = getattr(o, 'current_amount', Money())
+            yield g
+
     def get_active_by_user_id(self, user_id: int) -> List[DomainSavingGoal]:
         orms = SavingGoalORM.query.filter_by(user_id=user_id).all()
         # active = not completed
         goals = []
         for o in orms:
-            g = DomainSavingGoal(
+            g = DomainSavingGoal.from_row(
                 user_id=o.user_id,
                 name=o.name,
                 target_amount=o.target_amount,
@@ -79,7 +121,7 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
                 remarks=o.remarks,
                 id=o.id,
             )
-            g.current_amount = getattr(o, 'current_amount', 0.0)
+            g.current_amount = getattr(o, 'current_amount', Money())
             if not g.is_completed():
                 goals.append(g)
         return goals
@@ -109,7 +151,7 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
         orms = SavingGoalORM.query.all()
         goals = []
         for o in orms:
-            g = DomainSavingGoal(
+            g = DomainSavingGoal.from_row(
                 user_id=o.user_id,
                 name=o.name,
                 target_amount=o.target_amount,
@@ -117,6 +159,20 @@ class SavingGoalRepositoryImpl(SavingGoalRepository):
                 remarks=o.remarks,
                 id=o.id,
             )
-            g.current_amount = getattr(o, 'current_amount', 0.0)
+            g.current_amount = getattr(o, 'current_amount', Money())
             goals.append(g)
         return goals
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DomainSavingGoal]:
+        orms = SavingGoalORM.query.yield_per(chunk_size)
+        for o in orms:
+            g = DomainSavingGoal.from_row(
+                user_id=o.user_id,
+                name=o.name,
+                target_amount=o.target_amount,
+                target_date=o.target_date,
+                remarks=o.remarks,
+                id=o.id,
+            )
+            g.current_amount = getattr(o, 'current_amount', Money())
+            yield g
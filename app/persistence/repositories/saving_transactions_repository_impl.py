@@ -1,8 +1,16 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from app.repositories.saving_transactions_repository import SavingTransactionsRepository
 from app.model.m_SavingTransactions import SavingTransactions as SavingTransactionsORM
 from app.ext import db
-from sqlalchemy import func
+from app.domain.money import Money
+from sqlalchemy import func, bindparam, select
+
+# Hot lookup built once; SQLAlchemy reuses its compiled form on every call
+_GET_BY_ID_AND_USER_ID = (
+    select(SavingTransactionsORM)
+    .where(SavingTransactionsORM.id == bindparam("entity_id"), SavingTransactionsORM.user_id == bindparam("user_id"))
+    .limit(1)
+)
 
 
 class SavingTransactionsRepositoryImpl(SavingTransactionsRepository):
@@ -13,11 +21,26 @@ class SavingTransactionsRepositoryImpl(SavingTransactionsRepository):
         db.session.flush()
         return entity
 
+    def save_many(self, entities: List[SavingTransactionsORM]) -> List[SavingTransactionsORM]:
+        # The ORM flush batches these into multi-row INSERT .. RETURNING
+        # where the dialect supports it
+        db.session.add_all(entities)
+        db.session.flush()
+        return entities
+
     def get_by_id(self, entity_id: int) -> Optional[SavingTransactionsORM]:
         return SavingTransactionsORM.query.filter_by(id=entity_id).first()
 
     def get_by_id_and_userid(self, entity_id: int, user_id: int) -> Optional[SavingTransactionsORM]:
-        return SavingTransactionsORM.query.filter_by(id=entity_id, user_id=user_id).first()
+        return db.session.execute(
+            _GET_BY_ID_AND_USER_ID, {"entity_id": entity_id, "user_id": user_id}
+        ).scalars().first()
+
+    def get_by_expense_id(self, expense_id: int) -> Optional[SavingTransactionsORM]:
+        return SavingTransactionsORM.query.filter_by(expense_id=expense_id).first()
+
+    def get_by_income_id(self, income_id: int) -> Optional[SavingTransactionsORM]:
+        return SavingTransactionsORM.query.filter_by(income_id=income_id).first()
 
     def get_all(self) -> List[SavingTransactionsORM]:
         return SavingTransactionsORM.query.all()
@@ -25,6 +48,12 @@ class SavingTransactionsRepositoryImpl(SavingTransactionsRepository):
     def get_all_by_user(self, user_id: int) -> List[SavingTransactionsORM]:
         return SavingTransactionsORM.query.filter_by(user_id=user_id).all()
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[SavingTransactionsORM]:
+        return iter(SavingTransactionsORM.query.yield_per(chunk_size))
+
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[SavingTransactionsORM]:
+        return iter(SavingTransactionsORM.query.filter_by(user_id=user_id).yield_per(chunk_size))
+
     def get_all_by_user_and_type(self, user_id: int, txt_type: str) -> List[SavingTransactionsORM]:
         return SavingTransactionsORM.query.filter_by(user_id=user_id, txt_type=txt_type).all()
 
@@ -42,11 +71,11 @@ class SavingTransactionsRepositoryImpl(SavingTransactionsRepository):
     def create(self, **kwargs) -> SavingTransactionsORM:
         return SavingTransactionsORM(**kwargs)
 
-    def calculate_total_deposits_by_user(self, user_id: int) -> float:
+    def calculate_total_deposits_by_user(self, user_id: int) -> Money:
         """Calculate total deposits (income) for a user's saving transactions."""
         from app.model.m_Income import Income
         
-        total = (
+        total = Money.from_cents(
             db.session.query(func.coalesce(func.sum(Income.amount), 0))
             .join(
                 SavingTransactionsORM,
@@ -56,4 +85,4 @@ class SavingTransactionsRepositoryImpl(SavingTransactionsRepository):
             .filter(SavingTransactionsORM.txt_type == "deposit")
             .scalar()
         )
-        return float(total)
+        return total
@@ -1,27 +1,74 @@
 from app.repositories.user_repository import UserRepository
 from app.model.m_Users import Users as UserORM
 from app.ext import db
+from app.persistence.sharding import ShardRouter
+from app.persistence.query_cache import mark_all_written, mark_written
+from app.persistence.user_cache import forget_user
 from app.domain.entities import User as DomainUser
+from app.domain.money import Money
 from app.repositories.exceptions import EntityNotFoundError
-from typing import Optional
+from typing import Optional, List, Iterator
+from app.model.m_Expenses import Expenses as ExpenseORM
+from app.model.m_Income import Income as IncomeORM
+from app.model.m_ExpensesArchive import ExpensesArchive as ExpenseArchiveORM
+from app.model.m_IncomeArchive import IncomeArchive as IncomeArchiveORM
+from app.model.m_SavingTransactions import SavingTransactions as SavingTransactionsORM
+from sqlalchemy import bindparam, func, insert, select, update
+
+# Hot lookups built once; SQLAlchemy reuses their compiled form on every call
+_GET_BY_EMAIL = select(UserORM).where(UserORM.email == bindparam("email")).limit(1)
+_GET_BY_ID = select(UserORM).where(UserORM.id == bindparam("user_id")).limit(1)
+_GET_CURRENT_VALUE = select(UserORM.current_value).where(UserORM.id == bindparam("user_id"))
+
+# current_value is only ever changed relative to itself, never read-modify-written
+_ADJUST_CURRENT_VALUE = (
+    update(UserORM)
+    .where(UserORM.id == bindparam("user_id"))
+    .values(current_value=UserORM.current_value + bindparam("delta"))
+    .execution_options(synchronize_session=False)
+)
+
+# Stateless; used to keep the shard directory in step with the users table
+_shard_router = ShardRouter()
 
 
 class UserRepositoryImpl(UserRepository):
     def save(self, entity: DomainUser) -> DomainUser:
         orm = UserORM(
+            # Allocated by the shard directory (UnitOfWork.route_new_user)
+            id=entity.id,
             firstname=entity.firstname,
             lastname=entity.lastname,
             email=entity.email,
             password_hash=entity.password_hash,
-            current_value=getattr(entity, 'current_value', 0.0)
+            current_value=getattr(entity, 'current_value', Money())
         )
         db.session.add(orm)
         db.session.flush()
         entity.id = orm.id
         return entity
 
+    def save_many(self, entities: List[DomainUser]) -> List[DomainUser]:
+        # Ids come from the shard directory, like UnitOfWork.route_new_user;
+        # each user's row is then inserted on the shard they were placed on
+        rows_by_shard = {}
+        for e in entities:
+            e.id, shard = _shard_router.register(e.email)
+            rows_by_shard.setdefault(shard, []).append({
+                "id": e.id,
+                "firstname": e.firstname,
+                "lastname": e.lastname,
+                "email": e.email,
+                "password_hash": e.password_hash,
+                "current_value": getattr(e, 'current_value', Money()),
+            })
+        for shard, rows in rows_by_shard.items():
+            with _shard_router.use(shard):
+                db.session.execute(insert(UserORM), rows)
+        return entities
+
     def get_by_email(self, email: str) -> Optional[DomainUser]:
-        orm = UserORM.query.filter_by(email=email).first()
+        orm = db.session.execute(_GET_BY_EMAIL, {"email": email}).scalars().first()
         if orm is None:
             return None
         return DomainUser(
@@ -33,7 +80,7 @@ class UserRepositoryImpl(UserRepository):
         )
 
     def get_by_id(self, user_id: int) -> Optional[DomainUser]:
-        orm = UserORM.query.filter_by(id=user_id).first()
+        orm = db.session.execute(_GET_BY_ID, {"user_id": user_id}).scalars().first()
         if orm is None:
             return None
         return DomainUser(
@@ -52,10 +99,51 @@ class UserRepositoryImpl(UserRepository):
         orm.lastname = entity.lastname
         if entity.password_hash:
             orm.password_hash = entity.password_hash
-        orm.current_value = getattr(entity, 'current_value', orm.current_value)
+        # current_value is maintained by adjust_current_value(); writing the
+        # entity's copy back would clobber concurrent adjustments
         db.session.flush()
+        forget_user(entity.id)
         return entity
 
+    def get_current_value(self, user_id: int) -> Money:
+        value = db.session.execute(_GET_CURRENT_VALUE, {"user_id": user_id}).scalar()
+        return Money.from_cents(value)
+
+    def adjust_current_value(self, user_id: int, delta: Money) -> None:
+        if delta:
+            db.session.execute(_ADJUST_CURRENT_VALUE, {"user_id": user_id, "delta": delta})
+            mark_written(user_id)
+
+    def reconcile_current_value(self, user_id: Optional[int] = None) -> int:
+        def total(orm_cls):
+            return (
+                select(func.coalesce(func.sum(orm_cls.amount), 0))
+                .where(orm_cls.user_id == UserORM.id)
+                .scalar_subquery()
+            )
+
+        # Archived rows still count towards the balance
+        incomes = total(IncomeORM) + total(IncomeArchiveORM)
+        expenses = total(ExpenseORM) + total(ExpenseArchiveORM)
+        # Same definition as SavingTransactionsRepository.calculate_total_deposits_by_user
+        deposits = (
+            select(func.coalesce(func.sum(IncomeORM.amount), 0))
+            .join(SavingTransactionsORM, SavingTransactionsORM.income_id == IncomeORM.id)
+            .where(SavingTransactionsORM.user_id == UserORM.id, SavingTransactionsORM.txt_type == "deposit")
+            .scalar_subquery()
+        )
+        stmt = (
+            update(UserORM)
+            .values(current_value=incomes - expenses - deposits)
+            .execution_options(synchronize_session=False)
+        )
+        if user_id is not None:
+            stmt = stmt.where(UserORM.id == user_id)
+            mark_written(user_id)
+        else:
+            mark_all_written()
+        return db.session.execute(stmt).rowcount
+
     def create(self, **kwargs) -> DomainUser:
         return DomainUser(**kwargs)
 
@@ -64,6 +152,8 @@ class UserRepositoryImpl(UserRepository):
         if orm is None:
             return False
         db.session.delete(orm)
+        _shard_router.unregister(entity_id)
+        forget_user(entity_id)
         return True
 
     def get_all(self):
@@ -78,3 +168,14 @@ class UserRepositoryImpl(UserRepository):
             )
             for o in orms
         ]
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[DomainUser]:
+        orms = UserORM.query.yield_per(chunk_size)
+        for o in orms:
+            yield DomainUser(
+                firstname=o.firstname,
+                lastname=o.lastname,
+                email=o.email,
+                password_hash=o.password_hash,
+                id=o.id,
+            )
@@ -0,0 +1,230 @@
+"""Session storage - Where the logged-in user's session lives between requests
+
+SESSION_TYPE picks the backend:
+
+- ``cookie``: Flask's own signed cookie. No storage and no queries at all;
+  logging out clears the cookie but cannot revoke a copy taken before.
+- ``cachelib``: Flask-Session over a cachelib FileSystemCache under
+  SESSION_FILE_DIR, shared by the workers of one host. Entries expire on
+  their own.
+- ``sqlalchemy``: Flask-Session's ``sessions`` table, msgpack-encoded by
+  msgspec. SESSION_DATABASE_URI moves the table off the database serving
+  the financial queries.
+
+The sessions table is read with a single SELECT and written with a single
+upsert, only when the session changed or its stored expiry is more than
+SESSION_REFRESH_INTERVAL seconds old. Expired rows are deleted in chunks by
+a background thread every SESSION_PURGE_INTERVAL seconds (or by
+``flask session_cleanup``), not while serving a request.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from cachelib import FileSystemCache
+from flask import g
+from flask_session import Session
+from flask_session.sqlalchemy import SqlAlchemySessionInterface
+from sqlalchemy import Index, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.ext import db
+
+SESSION_TYPES = ("cookie", "cachelib", "sqlalchemy")
+
+
+def _utcnow() -> datetime:
+    # The sessions table stores naive UTC datetimes
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class SqlAlchemySessionStore(SqlAlchemySessionInterface):
+    """
+    Flask-Session's SQLAlchemy backend with fewer round trips: one SELECT
+    per request, one upsert per write, no expiry refresh on every request
+    and no deletes in the request path.
+    """
+
+    def __init__(self, app, refresh_interval: int, purge_chunk_size: int, **kwargs):
+        super().__init__(app, **kwargs)
+        self.refresh_interval = timedelta(seconds=refresh_interval)
+        self.purge_chunk_size = purge_chunk_size
+
+    def _engine(self):
+        # Statements run on their own connection, outside the request's
+        # db.session transaction, which they neither hold open nor commit
+        return self.client.session.get_bind(mapper=self.sql_session_model)
+
+    def _retrieve_session_data(self, store_id: str) -> Optional[dict]:
+        table = self.sql_session_model.__table__
+        with self._engine().connect() as connection:
+            row = connection.execute(
+                select(table.c.data, table.c.expiry).where(table.c.session_id == store_id)
+            ).first()
+        # Expired rows are left to the purge
+        if row is None or row.expiry is None or row.expiry <= _utcnow():
+            return None
+        g.stored_session_expiry = row.expiry
+        return self.serializer.decode(row.data)
+
+    def should_set_storage(self, app, session) -> bool:
+        if session.modified:
+            return True
+        if not app.config["SESSION_REFRESH_EACH_REQUEST"]:
+            return False
+        # Slide the expiry (and the cookie's) at most once per refresh interval
+        stored = g.get("stored_session_expiry")
+        if stored is None:
+            return True
+        return stored - _utcnow() <= app.permanent_session_lifetime - self.refresh_interval
+
+    def _upsert_session(self, session_lifetime: timedelta, session, store_id: str) -> None:
+        table = self.sql_session_model.__table__
+        row = {
+            "session_id": store_id,
+            "data": self.serializer.encode(session),
+            "expiry": _utcnow() + session_lifetime,
+        }
+        engine = self._engine()
+        dialect = engine.dialect.name
+        if dialect == "mysql":
+            stmt = mysql_insert(table).values(**row)
+            stmt = stmt.on_duplicate_key_update(data=stmt.inserted.data, expiry=stmt.inserted.expiry)
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(table).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.session_id],
+                set_={"data": stmt.excluded.data, "expiry": stmt.excluded.expiry},
+            )
+        else:
+            return super()._upsert_session(session_lifetime, session, store_id)
+        with engine.begin() as connection:
+            connection.execute(stmt)
+
+    def _delete_session(self, store_id: str) -> None:
+        table = self.sql_session_model.__table__
+        with self._engine().begin() as connection:
+            connection.execute(table.delete().where(table.c.session_id == store_id))
+
+    def _delete_expired_sessions(self) -> None:
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired sessions, ``purge_chunk_size`` rows per transaction.
+
+        Returns:
+            Number of sessions deleted
+        """
+        table = self.sql_session_model.__table__
+        engine = self._engine()
+        total = 0
+        while True:
+            with engine.begin() as connection:
+                ids = connection.execute(
+                    select(table.c.id).where(table.c.expiry <= _utcnow()).limit(self.purge_chunk_size)
+                ).scalars().all()
+                if ids:
+                    connection.execute(table.delete().where(table.c.id.in_(ids)))
+            total += len(ids)
+            if len(ids) < self.purge_chunk_size:
+                return total
+
+
+class SessionPurger:
+    """
+    Daemon thread running ``store.purge_expired()`` every ``interval``
+    seconds. Started on the first request rather than at app creation, so
+    CLI runs never start it and pre-forking servers start one per worker.
+    """
+
+    def __init__(self, app, store: SqlAlchemySessionStore, interval: int):
+        self.app = app
+        self.store = store
+        self.interval = interval
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="session-purge", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self.app.app_context():
+                try:
+                    deleted = self.store.purge_expired()
+                except Exception:
+                    self.app.logger.exception("Purging expired sessions failed")
+                    continue
+            if deleted:
+                self.app.logger.info("Purged %d expired sessions", deleted)
+
+
+def _init_sqlalchemy_sessions(app, common: dict) -> None:
+    config = app.config
+    store = SqlAlchemySessionStore(
+        app,
+        refresh_interval=config.get("SESSION_REFRESH_INTERVAL", 300),
+        purge_chunk_size=config.get("SESSION_PURGE_CHUNK_SIZE", 1000),
+        client=db,
+        table=config.get("SESSION_SQLALCHEMY_TABLE", "sessions"),
+        bind_key=config.get("SESSION_SQLALCHEMY_BIND_KEY"),
+        cleanup_n_requests=config.get("SESSION_CLEANUP_N_REQUESTS"),
+        **common,
+    )
+    model = store.sql_session_model
+    # Server-side sessions are looked up before the user is known, so their
+    # table stays off the shards (on the primary or its own bind)
+    table = model.__table__
+    table.info['global'] = True
+    # The purge filters on expiry; the table is created by Flask-Session, not
+    # by a migration, so the index is added the same way
+    expiry_index = Index(f"ix_{table.name}_expiry", table.c.expiry)
+    with app.app_context():
+        expiry_index.create(bind=db.session.get_bind(mapper=model), checkfirst=True)
+    app.session_interface = store
+
+    interval = config.get("SESSION_PURGE_INTERVAL", 3600)
+    if interval > 0:
+        purger = SessionPurger(app, store, interval)
+        app.before_request(purger.start)
+
+
+def init_sessions(app) -> None:
+    """Install the session backend selected by SESSION_TYPE"""
+    config = app.config
+    session_type = (config.get("SESSION_TYPE") or "sqlalchemy").lower()
+    if session_type == "filesystem":
+        # Flask-Session's own filesystem backend is deprecated in favour of cachelib
+        session_type = "cachelib"
+    if session_type not in SESSION_TYPES:
+        raise ValueError(f"Unknown SESSION_TYPE {session_type!r}, expected one of {SESSION_TYPES}")
+    if session_type == "cookie":
+        # Flask's default SecureCookieSessionInterface, signed with SECRET_KEY
+        return
+
+    common = {
+        "key_prefix": config.get("SESSION_KEY_PREFIX", "session:"),
+        "use_signer": config.get("SESSION_USE_SIGNER", False),
+        "permanent": config.get("SESSION_PERMANENT", True),
+        "serialization_format": config.get("SESSION_SERIALIZATION_FORMAT", "msgpack"),
+    }
+    if session_type == "sqlalchemy":
+        _init_sqlalchemy_sessions(app, common)
+        return
+
+    if config.get("SESSION_CACHELIB") is None:
+        config["SESSION_CACHELIB"] = FileSystemCache(
+            config["SESSION_FILE_DIR"],
+            threshold=config.get("SESSION_FILE_THRESHOLD", 10000),
+            default_timeout=0,
+            mode=0o600,
+        )
+    config["SESSION_TYPE"] = "cachelib"
+    Session(app)
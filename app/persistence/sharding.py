@@ -0,0 +1,177 @@
+"""User-id sharding - Maps each user to the database holding their rows
+
+Every table except the global ones (the ``user_shards`` directory and the
+session table) is scoped by user, so a user's rows can all live on one of
+the binds listed in SHARD_BINDS. The directory on the primary database
+records which one, and also hands out user ids so they stay unique across
+shards.
+
+A directory row without a shard means the user lives on the primary
+database, which is where every user of an unsharded deployment (or one
+that predates sharding) lives.
+"""
+from contextlib import contextmanager
+from typing import Dict, Generator, List, Optional, Tuple
+from flask import current_app
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from app.ext import db
+from app.persistence.archive import forget_archived_through
+from app.model.m_UserShards import UserShards as UserShardsORM
+
+_GET_SHARD_BY_USER_ID = select(UserShardsORM.shard).where(UserShardsORM.user_id == bindparam("user_id"))
+_GET_SHARD_BY_EMAIL = select(UserShardsORM.shard).where(UserShardsORM.email == bindparam("email"))
+
+# Per-user tables in copy order (parents first): (source table, target
+# table, {column: table whose new ids it references}). Archived rows go
+# back to the hot table on the target, since archive ids are not
+# allocated by the archive table itself; the next archive run moves them
+# out again.
+_COPY_PLAN = [
+    ("users", "users", {}),
+    ("admin", "admin", {}),
+    ("categories", "categories", {}),
+    ("debts", "debts", {}),
+    ("saving_goals", "saving_goals", {}),
+    ("income", "income", {"category_id": "categories"}),
+    ("income_archive", "income", {"category_id": "categories"}),
+    ("expenses", "expenses", {"category_id": "categories"}),
+    ("expenses_archive", "expenses", {"category_id": "categories"}),
+    ("debt_payments", "debt_payments", {"debt_id": "debts", "income_id": "income", "expense_id": "expenses"}),
+    ("saving_transactions", "saving_transactions", {"goal_id": "saving_goals", "income_id": "income", "expense_id": "expenses"}),
+    ("monthly_rollups", "monthly_rollups", {"category_id": "categories"}),
+]
+
+
+def _owned_by(table, user_id: int):
+    """WHERE clause selecting a user's rows (their own row for ``users``)"""
+    owner = table.c.id if table.name == "users" else table.c.user_id
+    return owner == user_id
+
+
+def shard_binds() -> List[str]:
+    """Bind keys of the configured shards (empty when sharding is off)"""
+    return list(current_app.config.get("SHARD_BINDS", []))
+
+
+def current_shard() -> Optional[str]:
+    """Shard the current session routes to, or None for the primary"""
+    return db.session.info.get("shard")
+
+
+class ShardRouter:
+    """
+    Resolves users to shards through the directory and points the
+    request's session at the right one.
+    """
+
+    def databases(self) -> List[Optional[str]]:
+        """Every database that can hold user rows: the primary (None), then the shards"""
+        return [None] + shard_binds()
+
+    def shard_for_user(self, user_id: int) -> Optional[str]:
+        """Shard holding a user's rows (None for the primary or unknown users)"""
+        return db.session.execute(_GET_SHARD_BY_USER_ID, {"user_id": user_id}).scalar()
+
+    def shard_for_email(self, email: str) -> Optional[str]:
+        """Shard holding the rows of the user with this email"""
+        return db.session.execute(_GET_SHARD_BY_EMAIL, {"email": email}).scalar()
+
+    def register(self, email: str) -> Tuple[int, Optional[str]]:
+        """
+        Allocate a user id and place the new user on the shard with the
+        fewest users (the primary when sharding is off).
+
+        Returns:
+            Tuple of (user_id, shard)
+        """
+        shard = None
+        binds = shard_binds()
+        if binds:
+            counts = dict(
+                db.session.execute(
+                    select(UserShardsORM.shard, func.count())
+                    .where(UserShardsORM.shard.in_(binds))
+                    .group_by(UserShardsORM.shard)
+                ).all()
+            )
+            shard = min(binds, key=lambda bind: counts.get(bind, 0))
+        result = db.session.execute(insert(UserShardsORM).values(email=email, shard=shard))
+        return result.inserted_primary_key[0], shard
+
+    def unregister(self, user_id: int) -> None:
+        """Drop a deleted user's directory row, freeing their email"""
+        db.session.execute(delete(UserShardsORM).where(UserShardsORM.user_id == user_id))
+
+    def route(self, shard: Optional[str]) -> None:
+        """Send the session's per-user statements to ``shard``"""
+        info = db.session.info
+        if info.get("shard") != shard:
+            # Ids are only unique within a shard, so objects loaded from the
+            # previous one must not be mistaken for rows of the new one
+            db.session.expunge_all()
+            info.pop("identity_map", None)
+            forget_archived_through()
+        info["shard"] = shard
+
+    @contextmanager
+    def use(self, shard: Optional[str]) -> Generator:
+        """Route to ``shard`` for the duration of the block"""
+        previous = current_shard()
+        self.route(shard)
+        try:
+            yield
+        finally:
+            self.route(previous)
+
+    def move_user(self, user_id: int, target: Optional[str]) -> int:
+        """
+        Copy every row of a user to ``target``, repoint the directory, then
+        delete the rows from the old database.
+
+        Ids other than the user id are reassigned by the target database,
+        and references between the copied rows are rewritten to match. The
+        user should not be writing while the move runs.
+
+        Args:
+            user_id: User to move
+            target: Destination bind key, or None for the primary
+
+        Returns:
+            Number of rows copied (0 if the user already lives on target)
+        """
+        source = self.shard_for_user(user_id)
+        if source == target:
+            return 0
+
+        tables = db.metadata.tables
+        new_ids: Dict[str, Dict[int, int]] = {}
+        copied = 0
+        with db.engines[source].connect() as src, db.engines[target].begin() as dst:
+            for source_name, target_name, references in _COPY_PLAN:
+                table, target_table = tables[source_name], tables[target_name]
+                ids = new_ids.setdefault(target_name, {})
+                for row in src.execute(select(table).where(_owned_by(table, user_id))).mappings():
+                    values = dict(row)
+                    for column, parent in references.items():
+                        if values[column] is not None:
+                            values[column] = new_ids[parent][values[column]]
+                    if source_name == "users":
+                        dst.execute(insert(target_table).values(values))
+                    else:
+                        old_id = values.pop("id")
+                        result = dst.execute(insert(target_table).values(values))
+                        ids[old_id] = result.inserted_primary_key[0]
+                    copied += 1
+
+        db.session.execute(
+            update(UserShardsORM).where(UserShardsORM.user_id == user_id).values(shard=target)
+        )
+        db.session.commit()
+
+        # Children first; SQLite does not cascade without PRAGMA foreign_keys
+        with db.engines[source].begin() as src:
+            for source_name, _, _ in reversed(_COPY_PLAN):
+                table = tables[source_name]
+                src.execute(delete(table).where(_owned_by(table, user_id)))
+        forget_archived_through()
+        return copied
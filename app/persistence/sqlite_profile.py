@@ -0,0 +1,31 @@
+"""Embedded SQLite profile - Connection PRAGMAs for single-node deployments
+
+Only on-disk SQLite engines are touched; in-memory databases (tests) and
+other backends are left alone.
+"""
+from typing import Dict
+from sqlalchemy import event
+
+
+def is_sqlite_file(engine) -> bool:
+    """True for an engine backed by an on-disk SQLite database"""
+    url = engine.url
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def apply_pragmas(engine, pragmas: Dict[str, object]) -> None:
+    """
+    Run ``PRAGMA name = value`` on every new connection of a SQLite file
+    engine. Pass ``engine.sync_engine`` for an AsyncEngine.
+    """
+    if not pragmas or not is_sqlite_file(engine):
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
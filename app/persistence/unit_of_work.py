@@ -1,7 +1,9 @@
 """Unit of Work Pattern - Manages database transactions"""
+import time
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, List, Optional
+from flask import current_app, has_request_context, session as flask_session
 from app.ext import db
 from app.repositories import (
     UserRepository,
@@ -12,8 +14,27 @@ from app.repositories import (
     SavingGoalRepository,
     DebtPaymentsRepository,
     SavingTransactionsRepository,
+    MonthlyRollupRepository,
+    DashboardRepository,
 )
 from app.repositories.exceptions import RepositoryOperationError
+from app.persistence.archive import forget_archived_through
+from app.persistence.identity_map import IdentityMap, current_identity_map
+from app.persistence.query_cache import discard_writes, publish_writes
+from app.persistence.sharding import ShardRouter
+
+
+def has_replica() -> bool:
+    """True when a replica is configured for the primary or any shard"""
+    binds = current_app.config.get("SQLALCHEMY_BINDS", {})
+    return "replica" in binds or bool(current_app.config.get("SHARD_REPLICA_BINDS"))
+
+
+def is_pinned_to_primary() -> bool:
+    """True when this request, or the same user's recent commit, needs primary reads"""
+    if db.session.info.get("pinned_to_primary"):
+        return True
+    return has_request_context() and flask_session.get("primary_until", 0) > time.time()
 
 
 class UnitOfWork(ABC):
@@ -38,6 +59,8 @@ class UnitOfWork(ABC):
     saving_goals: SavingGoalRepository
     debt_payments: DebtPaymentsRepository
     saving_transactions: SavingTransactionsRepository
+    monthly_rollups: MonthlyRollupRepository
+    dashboard: DashboardRepository
     
     @abstractmethod
     def commit(self) -> None:
@@ -68,6 +91,96 @@ class UnitOfWork(ABC):
         """
         pass
 
+    
+    @abstractmethod
+    @contextmanager
+    def batch(self) -> Generator:
+        """
+        Context manager for bulk writes (imports, backfills).
+        
+        Behaves like transaction() but is tuned for many inserts: use the
+        repositories' save_many() inside it and everything is committed
+        once at the end. save_many() does not touch the monthly rollups, so
+        rebuild them for the affected user before leaving the block.
+        
+        Example:
+            with unit_of_work.batch():
+                unit_of_work.expenses.save_many(expenses)
+                unit_of_work.incomes.save_many(incomes)
+                unit_of_work.monthly_rollups.rebuild(user_id)
+        
+        Yields:
+            Self (for access to repositories)
+        """
+        pass
+    
+    @abstractmethod
+    @contextmanager
+    def read_only(self) -> Generator:
+        """
+        Context manager for read-only work (dashboards, list pages, GET APIs).
+        
+        Queries inside it may be served by a read replica. Never write
+        inside it.
+        
+        Example:
+            with unit_of_work.read_only():
+                expenses = unit_of_work.expenses.get_all_by_user_id(user_id, profile="summary")
+        
+        Yields:
+            Self (for access to repositories)
+        """
+        pass
+    
+    @abstractmethod
+    def route_to_user(self, user_id: Optional[int] = None, email: Optional[str] = None) -> Optional[str]:
+        """
+        Send every following repository call to the database holding this
+        user's rows. Called once per request for the logged-in user.
+        
+        Args:
+            user_id: User ID
+            email: User email (when the id is not known yet, e.g. login)
+        
+        Returns:
+            Shard bind key, or None for the primary database
+        """
+        pass
+    
+    @abstractmethod
+    def route_new_user(self, user) -> Optional[str]:
+        """
+        Allocate an id for a user being registered, pick their shard and
+        route to it. Call inside the transaction that saves the user.
+        
+        Args:
+            user: Unsaved user entity; its id is set
+        
+        Returns:
+            Shard bind key, or None for the primary database
+        """
+        pass
+    
+    @abstractmethod
+    def databases(self) -> List[Optional[str]]:
+        """Every database that can hold user rows (None is the primary)"""
+        pass
+    
+    @abstractmethod
+    @contextmanager
+    def on_shard(self, shard: Optional[str]) -> Generator:
+        """
+        Context manager for maintenance work that walks every database.
+        
+        Example:
+            for shard in unit_of_work.databases():
+                with unit_of_work.on_shard(shard), unit_of_work.transaction():
+                    unit_of_work.monthly_rollups.rebuild()
+        
+        Yields:
+            Self (for access to repositories)
+        """
+        pass
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
     """
@@ -86,6 +199,9 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         saving_goal_repo: SavingGoalRepository,
         debt_payments_repo: DebtPaymentsRepository,
         saving_transactions_repo: SavingTransactionsRepository,
+        monthly_rollup_repo: MonthlyRollupRepository,
+        dashboard_repo: DashboardRepository,
+        shard_router: Optional[ShardRouter] = None,
     ):
         """
         Initialize Unit of Work with repository implementations.
@@ -97,6 +213,7 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
             income_repo: IncomeRepository implementation
             expense_repo: ExpenseRepository implementation
             saving_goal_repo: SavingGoalRepository implementation
+            shard_router: Maps users to shards (defaults to a ShardRouter)
         """
         self.users = user_repo
         self.debts = debt_repo
@@ -106,18 +223,32 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         self.saving_goals = saving_goal_repo
         self.debt_payments = debt_payments_repo
         self.saving_transactions = saving_transactions_repo
+        self.monthly_rollups = monthly_rollup_repo
+        self.dashboard = dashboard_repo
+        self.shard_router = shard_router or ShardRouter()
     
     def commit(self) -> None:
         """Commit changes to database"""
         try:
             db.session.commit()
         except Exception as e:
-            db.session.rollback()
+            self.rollback()
             raise RepositoryOperationError(f"Failed to commit transaction: {str(e)}")
+        # Cached reads of every user written here are now out of date
+        publish_writes()
+        self._pin_to_primary()
     
     def rollback(self) -> None:
-        """Rollback changes"""
+        """Rollback changes and drop entities cached for this request"""
         db.session.rollback()
+        current_identity_map().clear()
+        forget_archived_through()
+        discard_writes()
+    
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Identity map scoped to the current request's session"""
+        return current_identity_map()
     
     @contextmanager
     def transaction(self) -> Generator:
@@ -134,6 +265,87 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
             self.rollback()
             raise RepositoryOperationError(f"Transaction failed: {str(e)}")
 
+    
+    @contextmanager
+    def batch(self) -> Generator:
+        """
+        Context manager for atomic bulk writes.
+        
+        Autoflush is disabled for the duration so pending objects are not
+        flushed before every query issued between save_many() calls.
+        
+        Yields:
+            Self for repository access
+        """
+        try:
+            with db.session.no_autoflush:
+                yield self
+            self.commit()
+        except Exception as e:
+            self.rollback()
+            raise RepositoryOperationError(f"Batch failed: {str(e)}")
+
+    
+    @contextmanager
+    def read_only(self) -> Generator:
+        """
+        Context manager that routes SELECTs to the replica bind, if one is
+        configured and the caller has not committed recently.
+        
+        Yields:
+            Self for repository access
+        """
+        info = db.session.info
+        previous = info.get("use_replica", False)
+        info["use_replica"] = has_replica() and not is_pinned_to_primary()
+        try:
+            yield self
+        finally:
+            info["use_replica"] = previous
+    
+    def route_to_user(self, user_id: Optional[int] = None, email: Optional[str] = None) -> Optional[str]:
+        """Look the user up in the shard directory and route to their shard"""
+        router = self.shard_router
+        if len(router.databases()) == 1:
+            # Not sharded: everyone lives on the primary
+            return None
+        shard = router.shard_for_user(user_id) if user_id is not None else router.shard_for_email(email)
+        router.route(shard)
+        return shard
+    
+    def route_new_user(self, user) -> Optional[str]:
+        """Register the user in the shard directory and route to their shard"""
+        user.id, shard = self.shard_router.register(user.email)
+        self.shard_router.route(shard)
+        return shard
+    
+    def databases(self) -> List[Optional[str]]:
+        """The primary (None) followed by the configured shards"""
+        return self.shard_router.databases()
+    
+    @contextmanager
+    def on_shard(self, shard: Optional[str]) -> Generator:
+        """
+        Context manager that routes to one shard and restores the previous
+        routing afterwards.
+        
+        Yields:
+            Self for repository access
+        """
+        with self.shard_router.use(shard):
+            yield self
+    
+    def _pin_to_primary(self) -> None:
+        """
+        Give read-your-writes: after a commit, this request and (for a short
+        window) the same user's following requests read from the primary
+        while the replica catches up.
+        """
+        if not has_replica():
+            return
+        db.session.info["pinned_to_primary"] = True
+        if has_request_context():
+            flask_session["primary_until"] = time.time() + current_app.config["REPLICA_STICKY_SECONDS"]
 
 class TransactionScope:
     """
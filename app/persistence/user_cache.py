@@ -0,0 +1,45 @@
+"""Authenticated-user cache - Short-lived, in-process copies of User entities
+
+get_current_user() resolves the logged-in user once per request into
+flask.g; this cache lets most requests skip the users query altogether.
+Entries expire after USER_CACHE_TIMEOUT seconds. UserRepositoryImpl.update()
+and delete() drop a user's entry, but only in the worker that made the
+change: other workers keep serving their copy until it expires.
+
+current_value is not kept fresh here. Read balances through
+UserRepository.get_current_value() or the dashboard summary.
+"""
+from typing import Optional
+from flask import current_app, has_app_context
+from app.domain.entities import User
+from app.persistence.query_cache import LRUCache
+
+
+def init_user_cache(app) -> None:
+    timeout = app.config.get("USER_CACHE_TIMEOUT", 60)
+    app.extensions["user_cache"] = (
+        LRUCache(threshold=app.config.get("USER_CACHE_THRESHOLD", 1000), default_timeout=timeout)
+        if timeout > 0 else None
+    )
+
+
+def _user_cache() -> Optional[LRUCache]:
+    return current_app.extensions.get("user_cache") if has_app_context() else None
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    """Cached copy of the user, or None"""
+    cache = _user_cache()
+    return cache.get(str(user_id)) if cache is not None else None
+
+
+def cache_user(user: User) -> None:
+    cache = _user_cache()
+    if cache is not None and user.id is not None:
+        cache.set(str(user.id), user)
+
+
+def forget_user(user_id: int) -> None:
+    cache = _user_cache()
+    if cache is not None:
+        cache.delete(str(user_id))
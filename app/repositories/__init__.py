@@ -9,6 +9,26 @@ from app.repositories.expense_repository import ExpenseRepository
 from app.repositories.saving_goal_repository import SavingGoalRepository
 from app.repositories.debt_payments_repository import DebtPaymentsRepository
 from app.repositories.saving_transactions_repository import SavingTransactionsRepository
+from app.repositories.monthly_rollup_repository import MonthlyRollupRepository
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.async_repositories import (
+    AsyncUserRepository,
+    AsyncCategoryRepository,
+    AsyncIncomeRepository,
+    AsyncExpenseRepository,
+    AsyncMonthlyRollupRepository,
+    AsyncDashboardRepository,
+)
+from app.repositories.read_models import (
+    ExpenseListItem,
+    IncomeListItem,
+    ExpenseSummary,
+    IncomeSummary,
+    MonthlyRollup,
+    CategoryTotal,
+    CategoryUsage,
+    DashboardSummary,
+)
 from app.repositories.exceptions import (
     RepositoryError,
     EntityNotFoundError,
@@ -26,6 +46,22 @@ __all__ = [
     "SavingGoalRepository",
     "DebtPaymentsRepository",
     "SavingTransactionsRepository",
+    "MonthlyRollupRepository",
+    "DashboardRepository",
+    "AsyncUserRepository",
+    "AsyncCategoryRepository",
+    "AsyncIncomeRepository",
+    "AsyncExpenseRepository",
+    "AsyncMonthlyRollupRepository",
+    "AsyncDashboardRepository",
+    "ExpenseListItem",
+    "IncomeListItem",
+    "ExpenseSummary",
+    "IncomeSummary",
+    "MonthlyRollup",
+    "CategoryTotal",
+    "CategoryUsage",
+    "DashboardSummary",
     "RepositoryError",
     "EntityNotFoundError",
     "EntityAlreadyExistsError",
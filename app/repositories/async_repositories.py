@@ -0,0 +1,103 @@
+"""Async Repository Interfaces - Read-side contracts for async views
+
+These mirror the synchronous repository methods that the async dashboard
+and JSON API views need. Writes stay on the synchronous repositories and
+UnitOfWork.transaction().
+"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from app.domain.entities import User, Category, Income, Expense
+from app.repositories.read_models import DashboardSummary, MonthlyRollup
+
+
+class AsyncUserRepository(ABC):
+    """Async read access to User entities"""
+    
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """
+        Retrieve user by email.
+        
+        Args:
+            email: User's email address
+        
+        Returns:
+            User or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Retrieve user by ID"""
+        pass
+
+
+class AsyncCategoryRepository(ABC):
+    """Async read access to Category entities"""
+    
+    @abstractmethod
+    async def get_by_id(self, category_id: int) -> Optional[Category]:
+        """Retrieve category by ID (callers must check ownership)"""
+        pass
+
+
+class AsyncIncomeRepository(ABC):
+    """Async read access to Income entities"""
+    
+    @abstractmethod
+    async def get_by_id(self, income_id: int) -> Optional[Income]:
+        """Retrieve income by ID (callers must check ownership)"""
+        pass
+
+
+class AsyncExpenseRepository(ABC):
+    """Async read access to Expense entities"""
+    
+    @abstractmethod
+    async def get_by_id(self, expense_id: int) -> Optional[Expense]:
+        """Retrieve expense by ID (callers must check ownership)"""
+        pass
+
+
+class AsyncMonthlyRollupRepository(ABC):
+    """Async read access to the monthly_rollups summary table"""
+    
+    @abstractmethod
+    async def get_by_user_id(
+        self,
+        user_id: int,
+        kind: Optional[str] = None,
+        since: Optional[date] = None,
+    ) -> List[MonthlyRollup]:
+        """
+        Retrieve a user's rollup rows, oldest month first.
+        
+        Args:
+            user_id: User ID
+            kind: Restrict to "income" or "expense", or None for both
+            since: Only months on or after this date's month, or None for all
+        
+        Returns:
+            List of MonthlyRollup rows
+        """
+        pass
+
+
+class AsyncDashboardRepository(ABC):
+    """Async read access to the dashboard figures"""
+    
+    @abstractmethod
+    async def get_summary(self, user_id: int, today: date, top_n: int = 5) -> Optional[DashboardSummary]:
+        """
+        Compute every dashboard figure for a user in a single query.
+        
+        Args:
+            user_id: User ID
+            today: Reference date for the month-to-date figures
+            top_n: Number of top spending categories to return
+        
+        Returns:
+            DashboardSummary, or None if the user does not exist
+        """
+        pass
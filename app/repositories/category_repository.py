@@ -1,8 +1,10 @@
 """Category Repository Interface"""
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict
 from app.domain.entities import Category
 from app.repositories.repository import Repository
+from app.repositories.loading import FULL
+from app.repositories.read_models import CategoryUsage
 
 
 class CategoryRepository(Repository[Category]):
@@ -46,12 +48,33 @@ class CategoryRepository(Repository[Category]):
         pass
     
     @abstractmethod
-    def get_all_by_user_id(self, user_id: int) -> List[Category]:
+    def get_or_create(self, user_id: int, category_type: str, name: str) -> Category:
+        """
+        Return the user's category with this type and name, creating it if
+        it does not exist, in a single upsert statement. Safe against
+        concurrent callers creating the same category.
+        
+        Args:
+            user_id: User ID (owner)
+            category_type: "income" or "expense"
+            name: Category name
+        
+        Returns:
+            Category at the summary loading profile (description not loaded)
+        
+        Raises:
+            InvalidCategoryError: If the type or name violates domain rules
+        """
+        pass
+    
+    @abstractmethod
+    def get_all_by_user_id(self, user_id: int, profile: str = FULL) -> List[Category]:
         """
         Retrieve all categories for a user.
         
         Args:
             user_id: User ID
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
         
         Returns:
             List of user's categories
@@ -59,13 +82,33 @@ class CategoryRepository(Repository[Category]):
         pass
     
     @abstractmethod
-    def get_all_by_user_and_type(self, user_id: int, category_type: str) -> List[Category]:
+    def iter_all_by_user_id(
+        self, user_id: int, chunk_size: int = 1000, profile: str = FULL
+    ) -> Iterator[Category]:
+        """
+        Stream all categories for a user in bounded memory.
+        
+        Args:
+            user_id: User ID
+            chunk_size: Number of rows fetched per round trip
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
+        
+        Yields:
+            User's categories, one at a time
+        """
+        pass
+    
+    @abstractmethod
+    def get_all_by_user_and_type(
+        self, user_id: int, category_type: str, profile: str = FULL
+    ) -> List[Category]:
         """
         Retrieve categories by user and type.
         
         Args:
             user_id: User ID
             category_type: "income" or "expense"
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
         
         Returns:
             List of matching categories
@@ -98,3 +141,19 @@ class CategoryRepository(Repository[Category]):
             True if used in income/expense records
         """
         pass
+    
+    @abstractmethod
+    def usage_stats_by_user(self, user_id: int) -> Dict[int, CategoryUsage]:
+        """
+        Transaction count, total and last-used date for every category of
+        a user, over hot and archived income and expenses, in one grouped
+        query.
+        
+        Args:
+            user_id: User ID (owner)
+        
+        Returns:
+            Dict keyed by category ID; unused categories have a zero count
+            and last_used None
+        """
+        pass
@@ -0,0 +1,30 @@
+"""Dashboard Repository Interface"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional
+from app.repositories.read_models import DashboardSummary
+
+
+class DashboardRepository(ABC):
+    """
+    Read-only repository for the dashboard figures.
+    
+    Aggregates across several tables, so it lives outside the per-entity
+    repositories.
+    """
+    
+    @abstractmethod
+    def get_summary(self, user_id: int, today: date, top_n: int = 5) -> Optional[DashboardSummary]:
+        """
+        Compute every dashboard figure for a user in a single query.
+        
+        Args:
+            user_id: User ID
+            today: Reference date for the month-to-date figures
+            top_n: Number of top spending categories to return
+        
+        Returns:
+            DashboardSummary (top_categories covers the month of today,
+            highest spend first), or None if the user does not exist
+        """
+        pass
@@ -1,7 +1,8 @@
 """Debt Repository Interface"""
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from app.domain.entities import Debt
+from app.domain.money import Money
 from app.repositories.repository import Repository
 
 
@@ -44,6 +45,20 @@ class DebtRepository(Repository[Debt]):
         """
         pass
     
+    @abstractmethod
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[Debt]:
+        """
+        Stream all debts for a user in bounded memory.
+        
+        Args:
+            user_id: User ID
+            chunk_size: Number of rows fetched per round trip
+        
+        Yields:
+            User's debts, one at a time
+        """
+        pass
+    
     @abstractmethod
     def get_active_by_user_id(self, user_id: int) -> List[Debt]:
         """
@@ -58,7 +73,7 @@ class DebtRepository(Repository[Debt]):
         pass
     
     @abstractmethod
-    def calculate_total_principal_by_user_id(self, user_id: int) -> float:
+    def calculate_total_principal_by_user_id(self, user_id: int) -> Money:
         """
         Calculate sum of all active debt principals for a user.
         
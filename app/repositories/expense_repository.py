@@ -1,8 +1,12 @@
 """Expense Repository Interface"""
 from abc import abstractmethod
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Optional, List, Iterator, Tuple
 from app.domain.entities import Expense
+from app.domain.money import Money
 from app.repositories.repository import Repository
+from app.repositories.loading import FULL
+from app.repositories.read_models import ExpenseListItem, ExpenseSummary
 
 
 class ExpenseRepository(Repository[Expense]):
@@ -32,12 +36,13 @@ class ExpenseRepository(Repository[Expense]):
         pass
     
     @abstractmethod
-    def get_all_by_user_id(self, user_id: int) -> List[Expense]:
+    def get_all_by_user_id(self, user_id: int, profile: str = FULL) -> List[Expense]:
         """
         Retrieve all expense records for a user.
         
         Args:
             user_id: User ID
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
         
         Returns:
             List of user's expense records
@@ -45,7 +50,65 @@ class ExpenseRepository(Repository[Expense]):
         pass
     
     @abstractmethod
-    def calculate_total_by_user_id(self, user_id: int) -> float:
+    def iter_all_by_user_id(
+        self, user_id: int, chunk_size: int = 1000, profile: str = FULL
+    ) -> Iterator[Expense]:
+        """
+        Stream all expense records for a user in bounded memory.
+        
+        Args:
+            user_id: User ID
+            chunk_size: Number of rows fetched per round trip
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
+        
+        Yields:
+            User's expense records, one at a time
+        """
+        pass
+    
+    @abstractmethod
+    def get_list_page_by_user_id(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[ExpenseListItem], Optional[Tuple[datetime, int]]]:
+        """
+        Retrieve one page of a user's expense list rows, newest first, using
+        keyset pagination on (expense_date, id).
+        
+        Only the columns shown on the list page are selected, together with
+        the category name, in a single query.
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of rows in the page
+            after: (expense_date, id) key of the last row of the previous
+                page, or None for the first page
+        
+        Returns:
+            Tuple of (rows, next_after). next_after is the key to pass for
+            the following page, or None if this is the last page.
+        """
+        pass
+    
+    @abstractmethod
+    def get_summaries_by_user_id(self, user_id: int) -> List[ExpenseSummary]:
+        """
+        Retrieve id, category, amount and date of every expense record for a
+        user, without hydrating full entities.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of ExpenseSummary rows (usable wherever TransactionAnalyzer
+            expects expense entities)
+        """
+        pass
+    
+    @abstractmethod
+    def calculate_total_by_user_id(self, user_id: int) -> Money:
         """
         Calculate total expenses for a user.
         
@@ -58,14 +121,35 @@ class ExpenseRepository(Repository[Expense]):
         pass
     
     @abstractmethod
-    def get_by_category_id(self, category_id: int) -> List[Expense]:
+    def get_by_category_id(self, category_id: int, profile: str = FULL) -> List[Expense]:
         """
-        Retrieve all expense records in a category.
+        Retrieve the expense records in a category that are still in the hot
+        table. Archived records are not included.
         
         Args:
             category_id: Category ID
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
         
         Returns:
             List of expense records
         """
         pass
+    
+    @abstractmethod
+    def archive_before(self, cutoff: date, chunk_size: int = 1000) -> int:
+        """
+        Move one chunk of expense records dated before cutoff into the
+        archive table. Records referenced by a debt payment or saving
+        transaction stay in the hot table.
+        
+        Per-user reads keep returning archived records; they only query the
+        archive for users who have archived rows (get_by_category_id does not).
+        
+        Args:
+            cutoff: Records with expense_date strictly before this are moved
+            chunk_size: Maximum number of records moved by this call
+        
+        Returns:
+            Number of records moved (fewer than chunk_size once done)
+        """
+        pass
@@ -1,8 +1,12 @@
 """Income Repository Interface"""
 from abc import abstractmethod
-from typing import Optional, List
+from datetime import date
+from typing import Optional, List, Iterator, Tuple
 from app.domain.entities import Income
+from app.domain.money import Money
 from app.repositories.repository import Repository
+from app.repositories.loading import FULL
+from app.repositories.read_models import IncomeListItem, IncomeSummary
 
 
 class IncomeRepository(Repository[Income]):
@@ -32,12 +36,13 @@ class IncomeRepository(Repository[Income]):
         pass
     
     @abstractmethod
-    def get_all_by_user_id(self, user_id: int) -> List[Income]:
+    def get_all_by_user_id(self, user_id: int, profile: str = FULL) -> List[Income]:
         """
         Retrieve all income records for a user.
         
         Args:
             user_id: User ID
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
         
         Returns:
             List of user's income records
@@ -45,7 +50,65 @@ class IncomeRepository(Repository[Income]):
         pass
     
     @abstractmethod
-    def calculate_total_by_user_id(self, user_id: int) -> float:
+    def iter_all_by_user_id(
+        self, user_id: int, chunk_size: int = 1000, profile: str = FULL
+    ) -> Iterator[Income]:
+        """
+        Stream all income records for a user in bounded memory.
+        
+        Args:
+            user_id: User ID
+            chunk_size: Number of rows fetched per round trip
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
+        
+        Yields:
+            User's income records, one at a time
+        """
+        pass
+    
+    @abstractmethod
+    def get_list_page_by_user_id(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None,
+    ) -> Tuple[List[IncomeListItem], Optional[Tuple[date, int]]]:
+        """
+        Retrieve one page of a user's income list rows, newest first, using
+        keyset pagination on (received_date, id).
+        
+        Only the columns shown on the list page are selected, together with
+        the category name, in a single query.
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of rows in the page
+            after: (received_date, id) key of the last row of the previous
+                page, or None for the first page
+        
+        Returns:
+            Tuple of (rows, next_after). next_after is the key to pass for
+            the following page, or None if this is the last page.
+        """
+        pass
+    
+    @abstractmethod
+    def get_summaries_by_user_id(self, user_id: int) -> List[IncomeSummary]:
+        """
+        Retrieve id, category, amount and date of every income record for a
+        user, without hydrating full entities.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of IncomeSummary rows (usable wherever TransactionAnalyzer
+            expects income entities)
+        """
+        pass
+    
+    @abstractmethod
+    def calculate_total_by_user_id(self, user_id: int) -> Money:
         """
         Calculate total income for a user.
         
@@ -58,14 +121,35 @@ class IncomeRepository(Repository[Income]):
         pass
     
     @abstractmethod
-    def get_by_category_id(self, category_id: int) -> List[Income]:
+    def get_by_category_id(self, category_id: int, profile: str = FULL) -> List[Income]:
         """
-        Retrieve all income records in a category.
+        Retrieve the income records in a category that are still in the hot
+        table. Archived records are not included.
         
         Args:
             category_id: Category ID
+            profile: Loading profile: summary, list or full (see app.repositories.loading)
         
         Returns:
             List of income records
         """
         pass
+    
+    @abstractmethod
+    def archive_before(self, cutoff: date, chunk_size: int = 1000) -> int:
+        """
+        Move one chunk of income records dated before cutoff into the
+        archive table. Records referenced by a debt payment or saving
+        transaction stay in the hot table.
+        
+        Per-user reads keep returning archived records; they only query the
+        archive for users who have archived rows (get_by_category_id does not).
+        
+        Args:
+            cutoff: Records with received_date strictly before this are moved
+            chunk_size: Maximum number of records moved by this call
+        
+        Returns:
+            Number of records moved (fewer than chunk_size once done)
+        """
+        pass
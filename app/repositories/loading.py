@@ -0,0 +1,19 @@
+"""Loading Profiles - How many columns a repository read hydrates
+
+Entity-returning list methods take a ``profile`` naming the narrowest set
+of columns the caller needs:
+
+- ``summary``: ids, owner, amount/date or type/name; enough for totals,
+  charts and pickers
+- ``list``: everything except long free text (remarks, descriptions)
+- ``full``: every column (the default)
+
+Columns left out by ``summary`` and ``list`` come back as None on the
+entity. Treat such entities as read-only and never pass them to update().
+"""
+
+SUMMARY = "summary"
+LIST = "list"
+FULL = "full"
+
+PROFILES = (SUMMARY, LIST, FULL)
@@ -0,0 +1,86 @@
+"""Monthly Rollup Repository Interface"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, List, Optional
+from app.domain.money import Money
+from app.repositories.read_models import MonthlyRollup
+
+
+class MonthlyRollupRepository(ABC):
+    """
+    Repository interface for the monthly_rollups summary table.
+    
+    Holds one row per (user, month, kind, category) with the running sum
+    and count of the matching income or expense records. Write use cases
+    keep it current by applying deltas inside their own transaction.
+    """
+    
+    @abstractmethod
+    def apply_delta(
+        self,
+        user_id: int,
+        kind: str,
+        on_date: date,
+        category_id: int,
+        amount_delta: Money,
+        count_delta: int,
+    ) -> None:
+        """
+        Add a delta to the rollup bucket of a transaction, creating the
+        bucket if it does not exist yet.
+        
+        Args:
+            user_id: User ID (owner)
+            kind: "income" or "expense"
+            on_date: Date of the transaction (any day of the month)
+            category_id: Category ID
+            amount_delta: Amount to add to the bucket sum (negative to remove)
+            count_delta: Number to add to the bucket count (negative to remove)
+        """
+        pass
+    
+    @abstractmethod
+    def get_by_user_id(
+        self,
+        user_id: int,
+        kind: Optional[str] = None,
+        since: Optional[date] = None,
+    ) -> List[MonthlyRollup]:
+        """
+        Retrieve a user's rollup rows, oldest month first.
+        
+        Args:
+            user_id: User ID
+            kind: Restrict to "income" or "expense", or None for both
+            since: Only months on or after this date's month, or None for all
+        
+        Returns:
+            List of MonthlyRollup rows
+        """
+        pass
+    
+    @abstractmethod
+    def get_totals_by_user_id(self, user_id: int) -> Dict[str, Money]:
+        """
+        Sum every rollup bucket of a user per kind.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Dictionary: {"income": total, "expense": total}
+        """
+        pass
+    
+    @abstractmethod
+    def rebuild(self, user_id: Optional[int] = None) -> int:
+        """
+        Recompute rollup rows from the raw income and expense tables.
+        
+        Args:
+            user_id: Only rebuild this user's rows, or None for every user
+        
+        Returns:
+            Number of rollup rows written
+        """
+        pass
@@ -0,0 +1,88 @@
+"""Read Models - Lightweight row types returned by projection queries
+
+These are plain tuples built from a column-level select(). They skip ORM
+instrumentation and domain validation, so use them only for read-only
+paths (list pages, dashboards, analytics), never for updates.
+"""
+from datetime import date, datetime
+from typing import List, NamedTuple, Optional
+from app.domain.money import Money
+
+
+class ExpenseListItem(NamedTuple):
+    """One row of the expense list page"""
+    id: int
+    category_id: int
+    category_name: Optional[str]
+    name: str
+    payee: str
+    amount: Money
+    expense_date: datetime
+    payment_method: Optional[str]
+    remarks: Optional[str]
+    created_at: Optional[datetime]
+
+
+class IncomeListItem(NamedTuple):
+    """One row of the income list page"""
+    id: int
+    category_id: int
+    category_name: Optional[str]
+    name: str
+    source: str
+    amount: Money
+    received_date: date
+    payment_method: Optional[str]
+    remarks: Optional[str]
+    created_at: Optional[datetime]
+
+
+class ExpenseSummary(NamedTuple):
+    """Minimal expense row for totals and charts (duck-types Expense)"""
+    id: int
+    category_id: int
+    amount: Money
+    expense_date: date
+
+
+class IncomeSummary(NamedTuple):
+    """Minimal income row for totals and charts (duck-types Income)"""
+    id: int
+    category_id: int
+    amount: Money
+    received_date: date
+
+
+class MonthlyRollup(NamedTuple):
+    """Pre-aggregated total of one user's income or expenses for a category in a month"""
+    month: date
+    kind: str
+    category_id: int
+    total: Money
+    count: int
+
+
+class CategoryTotal(NamedTuple):
+    """Amount spent in one category"""
+    category_id: int
+    name: str
+    total: Money
+
+
+class CategoryUsage(NamedTuple):
+    """How much one category is used across a user's income and expenses"""
+    category_id: int
+    count: int
+    total: Money
+    last_used: Optional[date]
+
+
+class DashboardSummary(NamedTuple):
+    """Every figure shown on a user's dashboard"""
+    total_income: Money
+    total_expense: Money
+    total_saving_deposits: Money
+    active_debt_principal: Money
+    month_to_date_expense: Money
+    current_value: Money
+    top_categories: List[CategoryTotal]
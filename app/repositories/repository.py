@@ -1,6 +1,6 @@
 """Base Repository Interface - All repositories implement this contract"""
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic
+from typing import Iterator, List, Optional, TypeVar, Generic
 
 T = TypeVar('T')  # Generic type for entity
 
@@ -32,6 +32,22 @@ class Repository(ABC, Generic[T]):
         """
         pass
     
+    @abstractmethod
+    def save_many(self, entities: List[T]) -> List[T]:
+        """
+        Save many new entities using batched multi-row INSERTs.
+        
+        Args:
+            entities: Domain entities to persist
+        
+        Returns:
+            Saved entities (with IDs assigned), in input order
+        
+        Raises:
+            RepositoryError: If save fails
+        """
+        pass
+    
     @abstractmethod
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """
@@ -102,3 +118,19 @@ class Repository(ABC, Generic[T]):
             List of all entities
         """
         pass
+    
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[T]:
+        """
+        Stream all entities in bounded memory.
+        
+        Rows are fetched through a server-side cursor in chunks and
+        mapped to entities lazily, one at a time.
+        
+        Args:
+            chunk_size: Number of rows fetched per round trip
+        
+        Yields:
+            Entities, one at a time
+        """
+        pass
@@ -1,6 +1,6 @@
 """SavingGoal Repository Interface"""
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 from app.domain.entities import SavingGoal
 from app.repositories.repository import Repository
 
@@ -44,6 +44,20 @@ class SavingGoalRepository(Repository[SavingGoal]):
         """
         pass
     
+    @abstractmethod
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[SavingGoal]:
+        """
+        Stream all saving goals for a user in bounded memory.
+        
+        Args:
+            user_id: User ID
+            chunk_size: Number of rows fetched per round trip
+        
+        Yields:
+            User's saving goals, one at a time
+        """
+        pass
+    
     @abstractmethod
     def get_active_by_user_id(self, user_id: int) -> List[SavingGoal]:
         """
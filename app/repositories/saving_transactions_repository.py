@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 
 class SavingTransactionsRepository(ABC):
@@ -9,6 +9,10 @@ class SavingTransactionsRepository(ABC):
     def save(self, entity) -> object:
         pass
 
+    @abstractmethod
+    def save_many(self, entities: List[object]) -> List[object]:
+        pass
+
     @abstractmethod
     def get_by_id(self, entity_id: int) -> Optional[object]:
         pass
@@ -17,6 +21,14 @@ class SavingTransactionsRepository(ABC):
     def get_by_id_and_userid(self, entity_id: int, user_id: int) -> Optional[object]:
         pass
 
+    @abstractmethod
+    def get_by_expense_id(self, expense_id: int) -> Optional[object]:
+        pass
+
+    @abstractmethod
+    def get_by_income_id(self, income_id: int) -> Optional[object]:
+        pass
+
     @abstractmethod
     def get_all(self) -> List[object]:
         pass
@@ -25,6 +37,14 @@ class SavingTransactionsRepository(ABC):
     def get_all_by_user(self, user_id: int) -> List[object]:
         pass
 
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[object]:
+        pass
+
+    @abstractmethod
+    def iter_all_by_user_id(self, user_id: int, chunk_size: int = 1000) -> Iterator[object]:
+        pass
+
     @abstractmethod
     def get_all_by_user_and_type(self, user_id: int, txt_type: str) -> List[object]:
         pass
@@ -2,6 +2,7 @@
 from abc import abstractmethod
 from typing import Optional
 from app.domain.entities import User
+from app.domain.money import Money
 from app.repositories.repository import Repository
 
 
@@ -29,3 +30,45 @@ class UserRepository(Repository[User]):
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Retrieve user by ID"""
         pass
+    
+    @abstractmethod
+    def get_current_value(self, user_id: int) -> Money:
+        """
+        Read a user's running balance (income - expenses - saving deposits).
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Stored current_value, or 0.0 if the user does not exist
+        """
+        pass
+    
+    @abstractmethod
+    def adjust_current_value(self, user_id: int, delta: Money) -> None:
+        """
+        Atomically add a delta to a user's running balance.
+        
+        Issues a single UPDATE ... SET current_value = current_value + delta
+        so concurrent writers never overwrite each other. Call it inside the
+        same transaction as the write that caused the change.
+        
+        Args:
+            user_id: User ID
+            delta: Amount to add (negative to subtract)
+        """
+        pass
+    
+    @abstractmethod
+    def reconcile_current_value(self, user_id: Optional[int] = None) -> int:
+        """
+        Recompute running balances from the raw income, expense and saving
+        transaction rows.
+        
+        Args:
+            user_id: Only reconcile this user, or None for every user
+        
+        Returns:
+            Number of users updated
+        """
+        pass
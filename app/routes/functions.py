@@ -1,23 +1,86 @@
-from flask import redirect, session, url_for
+import inspect
+from flask import g, redirect, session, url_for
 from functools import wraps
-from app.service import UOW
+from app.service import UOW, ASYNC_UOW
+from app.persistence.user_cache import cache_user, get_cached_user
 from app.utils.exceptions.ServiceError import ServiceError
 
+def is_logged_in():
+    # Sessions created before the user id was stored only carry the email
+    return 'user_id' in session or 'user_email' in session
+
 def require_user_session(f):
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def async_wrapper(*args, **kwargs):
+            if not is_logged_in():
+                return redirect(url_for('users.index'))
+            return await f(*args, **kwargs)
+        return async_wrapper
+
     @wraps(f)
     def wrapper(*args, **kwargs):
-        if 'user_email' not in session:
+        if not is_logged_in():
             return redirect(url_for('users.index'))
         return f(*args, **kwargs) 
     return wrapper
 
+def route_to_user_shard():
+    """before_request hook: send the logged-in user's queries to their shard"""
+    if 'user_id' in session:
+        UOW.route_to_user(user_id=session['user_id'])
+    elif 'user_email' in session:
+        UOW.route_to_user(email=session['user_email'])
+
+def use_read_replica(f):
+    """Serve a read-only view (dashboard, list pages, GET APIs) from the replica"""
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        with UOW.read_only():
+            return f(*args, **kwargs)
+    return wrapper
+
+def _remember_user(user, loaded: bool):
+    """
+    Keep the resolved user for the rest of the request (g). Only a user just
+    loaded from the database goes into the cache, so a hit never extends the
+    entry's lifetime past USER_CACHE_TIMEOUT.
+    """
+    if not user:
+        raise ServiceError('User not found')
+    if session.get('user_id') != user.id:
+        session['user_id'] = user.id
+    if loaded:
+        cache_user(user)
+    g.current_user = user
+    return user
+
 def get_current_user():
-    x = session.get('user_email')
-    if 'user_email' in session:
-        # Use UserRepository from UoW to fetch user by email
-        user = UOW.users.get_by_email(session.get('user_email'))
-        if not user:
-            raise ServiceError('User not found')
-        return user
+    if 'current_user' in g:
+        return g.current_user
+    user_id = session.get('user_id')
+    if user_id is not None:
+        user = get_cached_user(user_id)
+        if user is not None:
+            return _remember_user(user, loaded=False)
+        user = UOW.users.get_by_id(user_id)
+    elif 'user_email' in session:
+        user = UOW.users.get_by_email(session['user_email'])
+    else:
+        raise ServiceError('No user in session')
+    return _remember_user(user, loaded=True)
+
+async def get_current_user_async():
+    if 'current_user' in g:
+        return g.current_user
+    user_id = session.get('user_id')
+    if user_id is not None:
+        user = get_cached_user(user_id)
+        if user is not None:
+            return _remember_user(user, loaded=False)
+        user = await ASYNC_UOW.users.get_by_id(user_id)
+    elif 'user_email' in session:
+        user = await ASYNC_UOW.users.get_by_email(session['user_email'])
     else:
-        raise ServiceError('No user in session')
\ No newline at end of file
+        raise ServiceError('No user in session')
+    return _remember_user(user, loaded=True)
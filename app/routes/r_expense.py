@@ -1,14 +1,17 @@
+import asyncio
 from flask import Blueprint, render_template, redirect, session, url_for, request, jsonify
 from functools import wraps
 from app.use_cases.expense.create_expense import CreateExpenseUseCase
 from app.use_cases.expense.get_user_expense import GetUserExpenseUseCase
 from app.use_cases.expense.edit_expense import EditExpenseUseCase
+from app.use_cases.expense.delete_expense import DeleteExpenseUseCase
 from app.use_cases.category.create_category import CreateCategoryUseCase
+from app.utils.exceptions.PolicyError import PolicyError
 from app.utils.exceptions.ServiceError import ServiceError
-from app.routes.functions import require_user_session, get_current_user
+from app.routes.functions import require_user_session, get_current_user, get_current_user_async, use_read_replica
 #from app.use_cases.expense.get_user_expense import GetUserexpenseUseCase
 #from app.use_cases.expense.create_expense import CreateexpenseUseCase
-from app.service import UOW
+from app.service import UOW, ASYNC_UOW
 
 expense = Blueprint(
     'expense',
@@ -53,11 +56,13 @@ def update_expense_category_route(category_id: int):
 
 @require_user_session
 @expense.route('/api/expense/categories/<int:category_id>', methods=['GET'])
-def get_expense_category_api(category_id: int):
-    user = get_current_user()
-    category = UOW.categories.get_by_id_and_user_id(category_id, user.id)
+async def get_expense_category_api(category_id: int):
+    # Independent lookups run concurrently; ownership is checked afterwards
+    user, category = await asyncio.gather(
+        get_current_user_async(), ASYNC_UOW.categories.get_by_id(category_id)
+    )
 
-    if category is None or category.type != "expense":
+    if category is None or category.user_id != user.id or category.type != "expense":
         return jsonify({"error": "Category not found"}), 404
 
     return jsonify({
@@ -84,11 +89,13 @@ def insert_expense_route():
 
 @require_user_session
 @expense.route('/api/expense/<int:expense_id>', methods=['GET'])
-def get_expense_api(expense_id: int):
-    user = get_current_user()
-    expense_record = UOW.expenses.get_by_id_and_user_id(expense_id, user.id)
+async def get_expense_api(expense_id: int):
+    # Independent lookups run concurrently; ownership is checked afterwards
+    user, expense_record = await asyncio.gather(
+        get_current_user_async(), ASYNC_UOW.expenses.get_by_id(expense_id)
+    )
 
-    if expense_record is None:
+    if expense_record is None or expense_record.user_id != user.id:
         return jsonify({"error": "Expense not found"}), 404
 
     return jsonify({
@@ -117,13 +124,31 @@ def update_expense_route(expense_id: int):
         return redirect(url_for('expense.expense_page', error_message=str(e)))
 
 
+@require_user_session
+@expense.route('/delete_expense/<int:expense_id>', methods=['POST'])
+def delete_expense_route(expense_id: int):
+    user = get_current_user()
+
+    try:
+        use_case = DeleteExpenseUseCase(UOW)
+        use_case.execute(expense_id, user.id)
+        return redirect(url_for('expense.expense_page'))
+    except Exception as e:
+        return redirect(url_for('expense.expense_page', error_message=str(e)))
+
+
 @require_user_session
 @expense.route('/expense', methods=['GET'])
+@use_read_replica
 def expense_page():
     user = get_current_user()
     error_message = request.args.get("error_message")
+    cursor = request.args.get("cursor")
     use_case = GetUserExpenseUseCase(UOW)
-    all_expense = use_case.execute(user.id)
+    try:
+        expense_page_data = use_case.execute(user.id, cursor=cursor)
+    except PolicyError as e:
+        return redirect(url_for('expense.expense_page', error_message=str(e)))
     
     from app.use_cases.category.get_user_categories import GetUserCategoriesUseCase
     cat_use_case = GetUserCategoriesUseCase(UOW)
@@ -131,6 +156,8 @@ def expense_page():
 
     return render_template("auth/pages/expense.html", 
                          user=user, 
-                         expense=all_expense,
+                         expense=expense_page_data["records"],
+                         next_cursor=expense_page_data["next_cursor"],
+                         is_first_page=cursor is None,
                          user_categories=user_categories,
                          error_message=error_message)# Pass to template
\ No newline at end of file
@@ -1,14 +1,16 @@
+import asyncio
 from flask import Blueprint, render_template, redirect, session, url_for, request, jsonify
 from functools import wraps
 from app.use_cases.category.create_category import CreateCategoryUseCase
 from app.domain.policies.p_CategoryPolicy import CategoryPolicy
 from app.utils.exceptions.PolicyError import PolicyError
 from app.utils.exceptions.ServiceError import ServiceError
-from app.routes.functions import require_user_session, get_current_user
+from app.routes.functions import require_user_session, get_current_user, get_current_user_async, use_read_replica
 from app.use_cases.income.get_user_income import GetUserIncomeUseCase
 from app.use_cases.income.create_income import CreateIncomeUseCase
 from app.use_cases.income.edit_income import EditIncomeUseCase
-from app.service import UOW
+from app.use_cases.income.delete_income import DeleteIncomeUseCase
+from app.service import UOW, ASYNC_UOW
 
 income = Blueprint(
     'income',
@@ -51,11 +53,13 @@ def update_income_category_route(category_id: int):
 
 @require_user_session
 @income.route('/api/income/categories/<int:category_id>', methods=['GET'])
-def get_income_category_api(category_id: int):
-    user = get_current_user()
-    category = UOW.categories.get_by_id_and_user_id(category_id, user.id)
+async def get_income_category_api(category_id: int):
+    # Independent lookups run concurrently; ownership is checked afterwards
+    user, category = await asyncio.gather(
+        get_current_user_async(), ASYNC_UOW.categories.get_by_id(category_id)
+    )
 
-    if category is None or category.type != "income":
+    if category is None or category.user_id != user.id or category.type != "income":
         return jsonify({"error": "Category not found"}), 404
 
     return jsonify({
@@ -85,11 +89,13 @@ def insert_income_route():
 
 @require_user_session
 @income.route('/api/income/<int:income_id>', methods=['GET'])
-def get_income_api(income_id: int):
-    user = get_current_user()
-    income_record = UOW.incomes.get_by_id_and_user_id(income_id, user.id)
+async def get_income_api(income_id: int):
+    # Independent lookups run concurrently; ownership is checked afterwards
+    user, income_record = await asyncio.gather(
+        get_current_user_async(), ASYNC_UOW.incomes.get_by_id(income_id)
+    )
 
-    if income_record is None:
+    if income_record is None or income_record.user_id != user.id:
         return jsonify({"error": "Income not found"}), 404
 
     return jsonify({
@@ -116,14 +122,32 @@ def update_income_route(income_id: int):
         return redirect(url_for('income.income_page'))
     except Exception as e:
         return redirect(url_for('income.income_page', error_message=str(e)))
+
+
+@require_user_session
+@income.route('/delete_income/<int:income_id>', methods=['POST'])
+def delete_income_route(income_id: int):
+    user = get_current_user()
+
+    try:
+        use_case = DeleteIncomeUseCase(UOW)
+        use_case.execute(income_id, user.id)
+        return redirect(url_for('income.income_page'))
+    except Exception as e:
+        return redirect(url_for('income.income_page', error_message=str(e)))
     
 @require_user_session
 @income.route('/income', methods=['GET'])
+@use_read_replica
 def income_page():
     user = get_current_user()
     error_message = request.args.get("error_message")
+    cursor = request.args.get("cursor")
     use_case = GetUserIncomeUseCase(UOW)
-    all_income = use_case.execute(user.id)
+    try:
+        income_page_data = use_case.execute(user.id, cursor=cursor)
+    except PolicyError as e:
+        return redirect(url_for('income.income_page', error_message=str(e)))
     
     # ADD THIS: Get user's income categories for the modal dropdown
     from app.use_cases.category.get_user_categories import GetUserCategoriesUseCase
@@ -132,6 +156,8 @@ def income_page():
 
     return render_template("auth/pages/income.html", 
                          user=user, 
-                         all_income=all_income,
+                         all_income=income_page_data["records"],
+                         next_cursor=income_page_data["next_cursor"],
+                         is_first_page=cursor is None,
                          user_categories=user_categories,
                          error_message=error_message)# Pass to template
\ No newline at end of file
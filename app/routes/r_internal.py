@@ -0,0 +1,44 @@
+import hmac
+import os
+from flask import Blueprint, abort, current_app, jsonify, request
+from app.ext import db
+from app.persistence.async_unit_of_work import async_engines_by_bind
+from app.persistence.pool_metrics import pool_snapshot
+from app.persistence.query_cache import current_query_cache
+
+internal = Blueprint(
+    'internal',
+    __name__,
+    url_prefix='/internal'
+)
+
+
+def _authorized():
+    token = current_app.config.get('INTERNAL_STATS_TOKEN')
+    supplied = request.headers.get('X-Internal-Token', '')
+    return bool(token) and hmac.compare_digest(supplied, token)
+
+
+@internal.route('/pool-stats', methods=['GET'])
+def pool_stats():
+    # Hidden unless INTERNAL_STATS_TOKEN is set and sent as X-Internal-Token
+    if not _authorized():
+        abort(404)
+    return jsonify({
+        "pid": os.getpid(),
+        "engines": pool_snapshot(db.engines),
+        # Pools of the asyncio engines serving the async views
+        "async_engines": pool_snapshot(async_engines_by_bind()),
+    })
+
+
+@internal.route('/cache-stats', methods=['GET'])
+def cache_stats():
+    # Same guard as /pool-stats; counters are per worker process
+    if not _authorized():
+        abort(404)
+    cache = current_query_cache()
+    return jsonify({
+        "pid": os.getpid(),
+        "query_cache": cache.stats() if cache is not None else None,
+    })
@@ -1,10 +1,11 @@
 from flask import Blueprint, render_template, redirect, session, url_for, request
 from functools import wraps
 from app.utils.exceptions.ServiceError import ServiceError
-from app.routes.functions import require_user_session, get_current_user
-from app.service import UOW
+from app.routes.functions import require_user_session, get_current_user, get_current_user_async
+from app.service import UOW, ASYNC_UOW
 from app.use_cases.create_debt_payment import CreateDebtPaymentUseCase
-from app.use_cases.dashboard_reporting import DashboardReportingUseCase
+from app.use_cases.create_saving_transaction import CreateSavingTransactionUseCase
+from app.use_cases.dashboard_reporting import AsyncDashboardReportingUseCase
 from app.use_cases.create_user import CreateUserUseCase
 from app.use_cases.check_login import CheckLoginUseCase
 users = Blueprint(
@@ -33,6 +34,7 @@ def login():
             args['password']
         )
         session['user_email'] = user.email
+        session['user_id'] = user.id
         return redirect(url_for('users.dashboard'))
     except Exception as e:
         return redirect(url_for('users.login', error_message=str(e)))
@@ -40,13 +42,13 @@ def login():
 import datetime
 @users.route('/dashboard')
 @require_user_session
-def dashboard():
-    user = get_current_user()
+async def dashboard():
+    user = await get_current_user_async()
     user_id = int(user.id)
     
-    # Use new DashboardReportingUseCase with repositories
-    reporting_use_case = DashboardReportingUseCase(UOW)
-    dashboard_data = reporting_use_case.execute(user_id)
+    # Async use case fans its independent queries out concurrently
+    reporting_use_case = AsyncDashboardReportingUseCase(ASYNC_UOW)
+    dashboard_data = await reporting_use_case.execute(user_id)
     
     return render_template('auth/pages/dashboard.html', 
                            user=user,
@@ -69,7 +71,7 @@ def create_debt_payment():
 
     expense_data = {
         "user_id": int(user.id),
-        "amount": float(args.get('amount')),
+        "amount": args.get('amount'),
         "expense_date": args.get('expense_date'),
         "payment_method": args.get('payment_method'),
         "remarks": args.get('remarks', ""),
@@ -82,10 +84,33 @@ def create_debt_payment():
     except Exception as e:
         return redirect(url_for('users.dashboard', error_message=str(e)))
 
+@users.route('/saving_transaction', methods=['POST'])
+@require_user_session
+def create_saving_transaction():
+    user = get_current_user()
+    args = request.form
+    saving_data = {
+        "user_id": int(user.id),
+        "goal_id": args.get('goal_id'),
+        "txt_type": args.get('txt_type'),
+    }
+    # A deposit is funded by an income record, a withdrawal by an expense
+    for key in ("income_id", "expense_id"):
+        if args.get(key):
+            saving_data[key] = args.get(key)
+
+    use_case = CreateSavingTransactionUseCase(UOW)
+    try:
+        use_case.execute(saving_data)
+        return redirect(url_for('users.dashboard'))
+    except Exception as e:
+        return redirect(url_for('users.dashboard', error_message=str(e)))
+
 @users.route('/logout')
 @require_user_session
 def logout():
-    session.pop('user_email')
+    session.pop('user_email', None)
+    session.pop('user_id', None)
     return redirect(url_for('users.index'))
 
 @users.route('/registration', methods=['POST', 'GET'])
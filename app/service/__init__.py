@@ -2,13 +2,16 @@ from werkzeug.security import check_password_hash, generate_password_hash
 from app.ext import db
 
 # Repository-backed Unit of Work (pre-wired)
-from app.persistence import create_unit_of_work
+from app.persistence import create_unit_of_work, create_async_unit_of_work
 
 # Create a default unit of work instance (can be injected into use-cases)
 UOW = create_unit_of_work()
+# Async counterpart for `async def` views (read-only)
+ASYNC_UOW = create_async_unit_of_work()
 
 __all__ = [
 	"check_password_hash",
 	"generate_password_hash",
 	"UOW",
+	"ASYNC_UOW",
 ]
\ No newline at end of file
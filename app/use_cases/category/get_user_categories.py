@@ -1,31 +1,42 @@
+from app.repositories.loading import FULL
+
+
 class GetUserCategoriesUseCase:
     def __init__(self, unit_of_work):
         self.uow = unit_of_work
 
-    def execute(self, user_id: int, category_type: str = None):
+    def execute(self, user_id: int, category_type: str = None, profile: str = FULL):
         """
         Fetch all categories for a user.
         
         Args:
             user_id: The user's ID
             category_type: Optional filter - "income", "expense", "debt", etc.
+            profile: Loading profile; "summary" skips descriptions for
+                pickers that only show names
         
         Returns:
-            List of dicts with id and name for each category
+            List of dicts with id, name and usage (transaction count, total
+            and last-used date) for each category
         """
-        categories = self.uow.categories.get_all_by_user_id(user_id)
-        
-        # Filter by type if provided
+        # Filter by type in the query when one is given
         if category_type:
-            categories = [c for c in categories if c.type == category_type]
+            categories = self.uow.categories.get_all_by_user_and_type(user_id, category_type, profile=profile)
+        else:
+            categories = self.uow.categories.get_all_by_user_id(user_id, profile=profile)
+        usage_stats = self.uow.categories.usage_stats_by_user(user_id)
         
         result = []
         for category in categories:
+            usage = usage_stats.get(category.id)
             result.append({
                 "id": category.id,
                 "name": category.name,
                 "description": category.description,
-                "category_type": category.type
+                "category_type": category.type,
+                "usage_count": usage.count if usage else 0,
+                "usage_total": usage.total if usage else None,
+                "last_used": usage.last_used if usage else None,
             })
         
         return result
@@ -24,7 +24,8 @@ class CheckLoginUseCase:
         Raises:
             Exception: If email not found or password incorrect
         """
-        # Get user by email using repository
+        # Get user by email using repository, on the shard that holds them
+        self.uow.route_to_user(email=email)
         user_orm = self.uow.users.get_by_email(email)
         
         # Validate with policy
@@ -1,7 +1,6 @@
 from app.domain.policies.p_TransactionPolicy import TransactionPolicy
 from app.domain.policies.p_CategoryPolicy import CategoryPolicy
 from app.domain.policies.p_FinancialCalculations import FinancialCalculationsPolicy
-from app.domain.entities.category import Category
 from app.domain.entities.expense import Expense
 from app.model.m_DebtPayments import DebtPayments as DebtPaymentsORM
 from datetime import datetime
@@ -28,20 +27,13 @@ class CreateDebtPaymentUseCase:
             debt = uow.debts.get_by_id_and_user_id(debt_id, user_id)
             self.fin_policy.is_debt_present(debt)
 
-            # Category handling
+            # Category handling: one upsert finds or creates the lender's category
             generated_category_string = f"Debt payment to {debt.lender}"
-            category = uow.categories.get_by_name_and_user_id(generated_category_string, user_id)
+            category = uow.categories.get_or_create(user_id, "expense", generated_category_string)
+            expense_data["category_id"] = category.id
 
-            if category is None:
-                # create domain category and persist
-                new_cat = Category(user_id=user_id, type="expense", name=generated_category_string)
-                saved_category = uow.categories.save(new_cat)
-                expense_data["category_id"] = saved_category.id
-            else:
-                expense_data["category_id"] = category.id
-
-                expense_data["name"] = f"Debt payment - {debt.lender}"
-                expense_data["payee"] = expense_data["name"]
+            expense_data["name"] = f"Debt payment - {debt.lender}"
+            expense_data["payee"] = expense_data["name"]
 
             cleaned_expense = self.tx_policy.validate_insert_expense(expense_data)
 
@@ -58,6 +50,11 @@ class CreateDebtPaymentUseCase:
             )
 
             saved_expense = uow.expenses.save(exp_entity)
+            uow.monthly_rollups.apply_delta(
+                saved_expense.user_id, "expense", saved_expense.expense_date,
+                saved_expense.category_id, saved_expense.amount, 1
+            )
+            uow.users.adjust_current_value(user_id, -saved_expense.amount)
 
             # create debt payment ORM and persist (using ORM class to match existing DB model)
             dp_payload = {
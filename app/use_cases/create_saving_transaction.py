@@ -0,0 +1,37 @@
+from app.domain.policies.p_TransactionPolicy import TransactionPolicy
+from app.utils.exceptions import PolicyError
+
+
+class CreateSavingTransactionUseCase:
+    """Records a saving transaction and keeps the user's balance in sync
+
+    Deposits funded by an income count against the running balance
+    (income - expenses - saving deposits), like the dashboard total.
+    """
+
+    def __init__(self, unit_of_work):
+        self.uow = unit_of_work
+        self.tx_policy = TransactionPolicy()
+
+    def execute(self, saving_data: dict):
+        clean = self.tx_policy.validate_insert_saving_transaction(saving_data)
+        user_id = clean["user_id"]
+
+        if self.uow.saving_goals.get_by_id_and_user_id(clean["goal_id"], user_id) is None:
+            raise PolicyError("Saving goal not found")
+
+        income = None
+        if clean.get("income_id") is not None:
+            income = self.uow.incomes.get_by_id_and_user_id(clean["income_id"], user_id)
+            if income is None:
+                raise PolicyError("Income not found")
+        if clean.get("expense_id") is not None:
+            if self.uow.expenses.get_by_id_and_user_id(clean["expense_id"], user_id) is None:
+                raise PolicyError("Expense not found")
+
+        with self.uow.transaction():
+            saved = self.uow.saving_transactions.save(self.uow.saving_transactions.create(**clean))
+            if income is not None and clean["txt_type"] == "deposit":
+                self.uow.users.adjust_current_value(user_id, -income.amount)
+
+        return saved
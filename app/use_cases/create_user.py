@@ -39,6 +39,8 @@ class CreateUserUseCase:
         # Save within transaction
         try:
             with self.uow.transaction():
+                # The shard directory hands out the id and picks the shard
+                self.uow.route_new_user(new_user)
                 saved_user = self.uow.users.save(new_user)
             return saved_user
         except IntegrityError as e:
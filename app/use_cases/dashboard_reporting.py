@@ -1,10 +1,22 @@
 """Dashboard Reporting Use Case - Orchestrates dashboard data aggregation using UOW and domain services."""
-from sqlalchemy import func
-from app.model.m_Income import Income
-from app.model.m_Expenses import Expenses
-from app.model.m_SavingTransactions import SavingTransactions
-from app.ext import db
-from app.domain.services.net_worth_calculator import NetWorthCalculator
+import asyncio
+from datetime import date
+from app.domain.services import TransactionAnalyzer
+
+
+def _summary_to_dict(summary) -> dict:
+    if summary is None:
+        raise Exception("User not found")
+
+    return {
+        "total_income": summary.total_income,
+        "total_expense": summary.total_expense,
+        "total_saving_deposits": summary.total_saving_deposits,
+        "user_total_value": summary.current_value,
+        "active_debt_principal": summary.active_debt_principal,
+        "month_to_date_expense": summary.month_to_date_expense,
+        "top_categories": [c._asdict() for c in summary.top_categories],
+    }
 
 class DashboardReportingUseCase:
     """Aggregates dashboard metrics using repositories and domain services."""
@@ -18,32 +30,44 @@ class DashboardReportingUseCase:
         
         Returns:
             dict with keys:
-                - total_income: float
-                - total_expense: float
-                - total_saving_deposits: float
-                - user_total_value: float (income - expense - saving_deposits)
+                - total_income: Money
+                - total_expense: Money
+                - total_saving_deposits: Money
+                - user_total_value: Money (income - expense - saving_deposits)
+                - active_debt_principal: Money
+                - month_to_date_expense: Money
+                - top_categories: list of {category_id, name, total} dicts
+                  (this month's highest spend first)
+        """
+        # Every figure comes from one statement over pre-aggregated data
+        return _summary_to_dict(self.uow.dashboard.get_summary(user_id, date.today()))
+
+
+class AsyncDashboardReportingUseCase:
+    """Async variant for `async def` views; runs its independent queries concurrently."""
+
+    TREND_MONTHS = 6
+
+    def __init__(self, async_unit_of_work):
+        self.uow = async_unit_of_work
+
+    async def execute(self, user_id: int) -> dict:
         """
-        # Get all incomes for user and sum
-        incomes = self.uow.incomes.get_all_by_user_id(user_id)
-        total_income = sum(inc.amount for inc in incomes) if incomes else 0.0
-
-        # Get all expenses for user and sum
-        expenses = self.uow.expenses.get_all_by_user_id(user_id)
-        total_expense = sum(exp.amount for exp in expenses) if expenses else 0.0
-
-        # Get total saving deposits (via raw query like legacy code)
-        total_saving_deposits = self.uow.saving_transactions.calculate_total_deposits_by_user(user_id)
-
-        # Calculate net value
-        user_total_value = NetWorthCalculator.calculate_net_value(
-            total_income=total_income,
-            total_expense=total_expense,
-            total_saving_deposits=total_saving_deposits
+        Calculate all dashboard metrics for a user.
+        
+        Returns:
+            Same dict as DashboardReportingUseCase.execute(), plus
+                - spending_trend: list of (month_label, total_spent) for the
+                  last TREND_MONTHS months
+        """
+        today = date.today()
+        year, month = divmod(today.year * 12 + today.month - 1 - self.TREND_MONTHS, 12)
+
+        summary, rollups = await asyncio.gather(
+            self.uow.dashboard.get_summary(user_id, today),
+            self.uow.monthly_rollups.get_by_user_id(user_id, kind="expense", since=date(year, month + 1, 1)),
         )
 
-        return {
-            "total_income": float(total_income),
-            "total_expense": float(total_expense),
-            "total_saving_deposits": float(total_saving_deposits),
-            "user_total_value": float(user_total_value),
-        }
+        data = _summary_to_dict(summary)
+        data["spending_trend"] = TransactionAnalyzer.get_spending_trend_from_rollups(rollups, self.TREND_MONTHS)
+        return data
@@ -16,5 +16,9 @@ class CreateExpenseUseCase:
 
         with self.uow.transaction():
             saved = self.uow.expenses.save(expense)
+            self.uow.monthly_rollups.apply_delta(
+                saved.user_id, "expense", saved.expense_date, saved.category_id, saved.amount, 1
+            )
+            self.uow.users.adjust_current_value(saved.user_id, -saved.amount)
 
         return saved
\ No newline at end of file
@@ -0,0 +1,22 @@
+from app.domain.policies.p_TransactionPolicy import TransactionPolicy
+
+
+class DeleteExpenseUseCase:
+    def __init__(self, unit_of_work):
+        self.uow = unit_of_work
+        self.tx_policy = TransactionPolicy()
+
+    def execute(self, expense_id: int, user_id: int):
+        expense = self.uow.expenses.get_by_id_and_user_id(expense_id, user_id)
+        debt_payment = self.uow.debt_payments.get_by_expense_id(expense_id) if expense else None
+        saving_transaction = self.uow.saving_transactions.get_by_expense_id(expense_id) if expense else None
+        self.tx_policy.validate_expense_deletion(expense, debt_payment, saving_transaction)
+
+        with self.uow.transaction():
+            self.uow.expenses.delete(expense.id)
+            self.uow.monthly_rollups.apply_delta(
+                expense.user_id, "expense", expense.expense_date, expense.category_id, -expense.amount, -1
+            )
+            self.uow.users.adjust_current_value(expense.user_id, expense.amount)
+
+        return True
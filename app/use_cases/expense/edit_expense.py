@@ -9,6 +9,7 @@ class EditExpenseUseCase:
     def execute(self, expense_id: int, user_id: int, expense_data: dict):
         expense = self.uow.expenses.get_by_id_and_user_id(expense_id, user_id)
         clean_data = self.tx_policy.validate_expense_editing(expense_data, expense)
+        previous = (expense.expense_date, expense.category_id, expense.amount)
 
         if "category_id" in clean_data:
             category = self.uow.categories.get_by_id_and_user_id(clean_data["category_id"], user_id)
@@ -29,5 +30,20 @@ class EditExpenseUseCase:
 
         with self.uow.transaction():
             updated_expense = self.uow.expenses.update(expense)
+            self._move_rollup(updated_expense, *previous)
+            self.uow.users.adjust_current_value(user_id, previous[2] - updated_expense.amount)
 
         return updated_expense
+
+    def _move_rollup(self, expense, old_date, old_category_id, old_amount):
+        rollups = self.uow.monthly_rollups
+        same_bucket = (
+            old_category_id == expense.category_id
+            and (old_date.year, old_date.month) == (expense.expense_date.year, expense.expense_date.month)
+        )
+        if same_bucket:
+            if expense.amount != old_amount:
+                rollups.apply_delta(expense.user_id, "expense", old_date, old_category_id, expense.amount - old_amount, 0)
+            return
+        rollups.apply_delta(expense.user_id, "expense", old_date, old_category_id, -old_amount, -1)
+        rollups.apply_delta(expense.user_id, "expense", expense.expense_date, expense.category_id, expense.amount, 1)
@@ -1,29 +1,63 @@
-from app.model.m_Expenses import Expenses as ExpenseORM
+from datetime import datetime
+from app.utils.exceptions.PolicyError import PolicyError
+
 
 class GetUserExpenseUseCase:
+    PAGE_SIZE = 50
+
     def __init__(self, unit_of_work):
         self.uow = unit_of_work
 
-    def execute(self, user_id: int):
-        # Step 1: Get all expense for user
-        expense_records = self.uow.expenses.get_all_by_user_id(user_id)
+    def execute(self, user_id: int, cursor: str = None, limit: int = PAGE_SIZE):
+        """
+        Fetch one page of a user's expenses, newest first.
         
-        # Step 2: Enrich with category names
+        Args:
+            user_id: The user's ID
+            cursor: Opaque cursor from a previous page (None for first page)
+            limit: Page size
+        
+        Returns:
+            dict with keys:
+                - records: list of expense dicts for the page
+                - next_cursor: cursor for the next page, or None
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+
+        # Single projection query: list columns + category name
+        expense_rows, next_after = self.uow.expenses.get_list_page_by_user_id(
+            user_id, limit, after
+        )
+
         result = []
-        for expense in expense_records:
-            category = self.uow.categories.get_by_id(expense.category_id)
-            # Get ORM object to access created_at (domain entity doesn't track it)
-            orm = ExpenseORM.query.filter_by(id=expense.id).first()
+        for row in expense_rows:
+            expense_date = row.expense_date
             result.append({
-                "id": expense.id,
-                "name": (orm.name if orm and orm.name else ""),
-                "payee": expense.payee,
-                "amount": expense.amount,
-                "category_name": category.name if category else "Unknown",
-                "expense_date": expense.expense_date,
-                "payment_method": expense.payment_method,
-                "remarks": expense.remarks,
-                "created_at": orm.created_at if orm else None
+                "id": row.id,
+                "name": row.name,
+                "payee": row.payee,
+                "amount": row.amount,
+                "category_name": row.category_name or "Unknown",
+                "expense_date": expense_date.date() if isinstance(expense_date, datetime) else expense_date,
+                "payment_method": row.payment_method,
+                "remarks": row.remarks or "",
+                "created_at": row.created_at
             })
         
-        return result
\ No newline at end of file
+        return {
+            "records": result,
+            "next_cursor": self._encode_cursor(next_after) if next_after else None,
+        }
+
+    @staticmethod
+    def _encode_cursor(after) -> str:
+        expense_date, expense_id = after
+        return f"{expense_date.isoformat()}_{expense_id}"
+
+    @staticmethod
+    def _decode_cursor(cursor: str):
+        try:
+            raw_date, raw_id = cursor.rsplit("_", 1)
+            return datetime.fromisoformat(raw_date), int(raw_id)
+        except (TypeError, ValueError):
+            raise PolicyError("Invalid page cursor")
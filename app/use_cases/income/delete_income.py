@@ -0,0 +1,22 @@
+from app.domain.policies.p_TransactionPolicy import TransactionPolicy
+
+
+class DeleteIncomeUseCase:
+    def __init__(self, unit_of_work):
+        self.uow = unit_of_work
+        self.tx_policy = TransactionPolicy()
+
+    def execute(self, income_id: int, user_id: int):
+        income = self.uow.incomes.get_by_id_and_user_id(income_id, user_id)
+        debt_payment = self.uow.debt_payments.get_by_income_id(income_id) if income else None
+        saving_transaction = self.uow.saving_transactions.get_by_income_id(income_id) if income else None
+        self.tx_policy.validate_income_deletion(income, debt_payment, saving_transaction)
+
+        with self.uow.transaction():
+            self.uow.incomes.delete(income.id)
+            self.uow.monthly_rollups.apply_delta(
+                income.user_id, "income", income.received_date, income.category_id, -income.amount, -1
+            )
+            self.uow.users.adjust_current_value(income.user_id, -income.amount)
+
+        return True
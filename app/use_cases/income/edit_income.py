@@ -9,6 +9,7 @@ class EditIncomeUseCase:
     def execute(self, income_id: int, user_id: int, income_data: dict):
         income = self.uow.incomes.get_by_id_and_user_id(income_id, user_id)
         clean_data = self.tx_policy.validate_income_editing(income_data, income)
+        previous = (income.received_date, income.category_id, income.amount)
 
         if "category_id" in clean_data:
             category = self.uow.categories.get_by_id_and_user_id(clean_data["category_id"], user_id)
@@ -29,5 +30,28 @@ class EditIncomeUseCase:
 
         with self.uow.transaction():
             updated_income = self.uow.incomes.update(income)
+            self._move_rollup(updated_income, *previous)
+            amount_delta = updated_income.amount - previous[2]
+            if amount_delta and not self._is_saving_deposit(income_id):
+                self.uow.users.adjust_current_value(user_id, amount_delta)
 
         return updated_income
+
+    def _move_rollup(self, income, old_date, old_category_id, old_amount):
+        rollups = self.uow.monthly_rollups
+        same_bucket = (
+            old_category_id == income.category_id
+            and (old_date.year, old_date.month) == (income.received_date.year, income.received_date.month)
+        )
+        if same_bucket:
+            if income.amount != old_amount:
+                rollups.apply_delta(income.user_id, "income", old_date, old_category_id, income.amount - old_amount, 0)
+            return
+        rollups.apply_delta(income.user_id, "income", old_date, old_category_id, -old_amount, -1)
+        rollups.apply_delta(income.user_id, "income", income.received_date, income.category_id, income.amount, 1)
+
+    def _is_saving_deposit(self, income_id):
+        # An income deposited into savings is offset by the deposit, so
+        # changing its amount leaves the balance unchanged
+        saving_transaction = self.uow.saving_transactions.get_by_income_id(income_id)
+        return saving_transaction is not None and saving_transaction.txt_type == "deposit"
@@ -1,29 +1,62 @@
-from app.model.m_Income import Income as IncomeORM
+from datetime import date
+from app.utils.exceptions.PolicyError import PolicyError
+
 
 class GetUserIncomeUseCase:
+    PAGE_SIZE = 50
+
     def __init__(self, unit_of_work):
         self.uow = unit_of_work
 
-    def execute(self, user_id: int):
-        # Step 1: Get all income for user
-        income_records = self.uow.incomes.get_all_by_user_id(user_id)
+    def execute(self, user_id: int, cursor: str = None, limit: int = PAGE_SIZE):
+        """
+        Fetch one page of a user's income, newest first.
         
-        # Step 2: Enrich with category names
+        Args:
+            user_id: The user's ID
+            cursor: Opaque cursor from a previous page (None for first page)
+            limit: Page size
+        
+        Returns:
+            dict with keys:
+                - records: list of income dicts for the page
+                - next_cursor: cursor for the next page, or None
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+
+        # Single projection query: list columns + category name
+        income_rows, next_after = self.uow.incomes.get_list_page_by_user_id(
+            user_id, limit, after
+        )
+
         result = []
-        for income in income_records:
-            category = self.uow.categories.get_by_id(income.category_id)
-            # Get ORM object to access created_at (domain entity doesn't track it)
-            orm = IncomeORM.query.filter_by(id=income.id).first()
+        for row in income_rows:
             result.append({
-                "id": income.id,
-                "name": (orm.name if orm and orm.name else ""),
-                "source": income.source,
-                "amount": income.amount,
-                "category_name": category.name if category else "Unknown",
-                "received_date": income.received_date,
-                "payment_method": income.payment_method,
-                "remarks": income.remarks,
-                "created_at": orm.created_at if orm else None
+                "id": row.id,
+                "name": row.name,
+                "source": row.source,
+                "amount": row.amount,
+                "category_name": row.category_name or "Unknown",
+                "received_date": row.received_date,
+                "payment_method": row.payment_method,
+                "remarks": row.remarks or "",
+                "created_at": row.created_at
             })
         
-        return result
\ No newline at end of file
+        return {
+            "records": result,
+            "next_cursor": self._encode_cursor(next_after) if next_after else None,
+        }
+
+    @staticmethod
+    def _encode_cursor(after) -> str:
+        received_date, income_id = after
+        return f"{received_date.isoformat()}_{income_id}"
+
+    @staticmethod
+    def _decode_cursor(cursor: str):
+        try:
+            raw_date, raw_id = cursor.rsplit("_", 1)
+            return date.fromisoformat(raw_date), int(raw_id)
+        except (TypeError, ValueError):
+            raise PolicyError("Invalid page cursor")
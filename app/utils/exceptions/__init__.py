@@ -1 +1,8 @@
-#
\ No newline at end of file
+#
+from app.utils.exceptions.PolicyError import PolicyError
+from app.utils.exceptions.ServiceError import ServiceError
+
+__all__ = [
+    "PolicyError",
+    "ServiceError",
+]
@@ -0,0 +1,55 @@
+"""add per-user composite indexes
+
+Revision ID: a1c3e5f70901
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c3e5f70901'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (table, index name, columns) — every repository query filters on user_id
+# plus one of these columns
+INDEXES = [
+    ('expenses', 'ix_expenses_user_id_expense_date', ['user_id', 'expense_date']),
+    ('income', 'ix_income_user_id_received_date', ['user_id', 'received_date']),
+    ('categories', 'ix_categories_user_id_type', ['user_id', 'type']),
+    ('categories', 'ix_categories_user_id_name', ['user_id', 'name']),
+    ('debts', 'ix_debts_user_id_status', ['user_id', 'status']),
+    ('saving_transactions', 'ix_saving_transactions_user_id_txt_type', ['user_id', 'txt_type']),
+]
+
+
+def _existing_indexes(table):
+    inspector = sa.inspect(op.get_bind())
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def upgrade():
+    # Tables may already carry the indexes when they were created by
+    # db.create_all() from the current models
+    for table, name, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    is_mysql = op.get_bind().dialect.name == 'mysql'
+    for table, name, columns in reversed(INDEXES):
+        existing = _existing_indexes(table)
+        if name not in existing:
+            continue
+        # InnoDB drops the implicit user_id foreign key index once a composite
+        # index can back the constraint, so restore one before dropping ours
+        fk_index = f'ix_{table}_user_id'
+        if is_mysql and fk_index not in existing:
+            op.create_index(fk_index, table, ['user_id'])
+        op.drop_index(name, table_name=table)
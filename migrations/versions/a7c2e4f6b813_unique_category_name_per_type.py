@@ -0,0 +1,77 @@
+"""unique category name per user and type
+
+Revision ID: a7c2e4f6b813
+Revises: f3b8d0e2a461
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c2e4f6b813'
+down_revision = 'f3b8d0e2a461'
+branch_labels = None
+depends_on = None
+
+
+CONSTRAINT = 'uq_categories_user_id_type_name'
+NAME_LENGTH = 32
+
+
+def _type_column():
+    # SQLite batch mode rebuilds the table and does not reflect the unnamed
+    # CHECK behind the type enum; restate the column so it is recreated
+    return sa.Column('type', sa.Enum('income', 'expense', create_constraint=True), nullable=False)
+
+
+def _has_constraint():
+    inspector = sa.inspect(op.get_bind())
+    return any(uq['name'] == CONSTRAINT for uq in inspector.get_unique_constraints('categories'))
+
+
+def _rename_duplicates():
+    """
+    Suffix every duplicate after the oldest one with its id ("Food #42"),
+    so no transaction has to be moved to another category
+    """
+    bind = op.get_bind()
+    t = sa.table('categories', sa.column('id'), sa.column('user_id'), sa.column('type'), sa.column('name'))
+    keep = (
+        sa.select(sa.func.min(t.c.id))
+        .group_by(t.c.user_id, t.c.type, t.c.name)
+        .having(sa.func.count() > 1)
+    )
+    groups = bind.execute(
+        sa.select(t.c.user_id, t.c.type, t.c.name).where(t.c.id.in_(keep))
+    ).all()
+    for user_id, category_type, name in groups:
+        rows = bind.execute(
+            sa.select(t.c.id)
+            .where(t.c.user_id == user_id, t.c.type == category_type, t.c.name == name)
+            .order_by(t.c.id)
+            .offset(1)
+        ).scalars().all()
+        for row_id in rows:
+            suffix = f' #{row_id}'
+            bind.execute(
+                sa.update(t).where(t.c.id == row_id).values(name=name[:NAME_LENGTH - len(suffix)] + suffix)
+            )
+
+
+def upgrade():
+    # Already there when the table was created by db.create_all() from the
+    # current models
+    if _has_constraint():
+        return
+    _rename_duplicates()
+    with op.batch_alter_table('categories', reflect_args=[_type_column()]) as batch:
+        batch.create_unique_constraint(CONSTRAINT, ['user_id', 'type', 'name'])
+
+
+def downgrade():
+    if not _has_constraint():
+        return
+    with op.batch_alter_table('categories', reflect_args=[_type_column()]) as batch:
+        batch.drop_constraint(CONSTRAINT, type_='unique')
@@ -0,0 +1,87 @@
+"""never reuse income/expense ids on sqlite
+
+Revision ID: b2d4f6a8c019
+Revises: a7c2e4f6b813
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d4f6a8c019'
+down_revision = 'a7c2e4f6b813'
+branch_labels = None
+depends_on = None
+
+
+# (hot table, archive table)
+TABLES = [
+    ('expenses', 'expenses_archive'),
+    ('income', 'income_archive'),
+]
+PAYMENT_METHODS = ('cash', 'gcash', 'bank', 'card', 'other')
+
+
+def _payment_method_column():
+    # Batch mode does not reflect the unnamed CHECK behind the enum; restate it
+    return sa.Column('payment_method', sa.Enum(*PAYMENT_METHODS, create_constraint=True), nullable=True)
+
+
+def _has_autoincrement(table):
+    sql = op.get_bind().execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': table}
+    ).scalar()
+    return 'AUTOINCREMENT' in (sql or '').upper()
+
+
+def _max_id(table):
+    t = sa.table(table, sa.column('id'))
+    return op.get_bind().execute(sa.select(sa.func.max(t.c.id))).scalar() or 0
+
+
+def _set_sequence(table, value):
+    """Make the next id handed out for ``table`` larger than ``value``"""
+    bind = op.get_bind()
+    updated = bind.execute(
+        sa.text("UPDATE sqlite_sequence SET seq = :seq WHERE name = :name AND seq < :seq"),
+        {'name': table, 'seq': value},
+    ).rowcount
+    exists = bind.execute(
+        sa.text("SELECT 1 FROM sqlite_sequence WHERE name = :name"), {'name': table}
+    ).scalar()
+    if not updated and not exists:
+        bind.execute(sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"), {'name': table, 'seq': value})
+
+
+def upgrade():
+    # MySQL's AUTO_INCREMENT already never goes back below an id it handed
+    # out (8.0+); SQLite reuses the highest rowid once it has been archived
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, archive in TABLES:
+        if not _has_autoincrement(table):
+            with op.batch_alter_table(
+                table,
+                recreate='always',
+                reflect_args=[_payment_method_column()],
+                table_kwargs={'sqlite_autoincrement': True},
+            ):
+                pass
+        # Ids already moved to the archive must not come back either
+        _set_sequence(table, max(_max_id(table), _max_id(archive)))
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, _ in TABLES:
+        if _has_autoincrement(table):
+            with op.batch_alter_table(
+                table,
+                recreate='always',
+                reflect_args=[_payment_method_column()],
+                table_kwargs={'sqlite_autoincrement': False},
+            ):
+                pass
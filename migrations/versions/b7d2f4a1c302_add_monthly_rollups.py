@@ -0,0 +1,114 @@
+"""add monthly rollups
+
+Revision ID: b7d2f4a1c302
+Revises: a1c3e5f70901
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f4a1c302'
+down_revision = 'a1c3e5f70901'
+branch_labels = None
+depends_on = None
+
+
+# (kind, source table, date column) aggregated into the rollups
+SOURCES = [
+    ('income', 'income', 'received_date'),
+    ('expense', 'expenses', 'expense_date'),
+]
+
+
+def _total_in_cents(bind):
+    """
+    True when monthly_rollups.total is already the BIGINT cents column: the
+    table was created by db.create_all() from the current models, and the
+    money migration (f3b8d0e2a461) will leave it alone
+    """
+    for column in sa.inspect(bind).get_columns('monthly_rollups'):
+        if column['name'] == 'total':
+            return isinstance(column['type'], sa.Integer)
+    return False
+
+
+def _to_cents(value):
+    # Same rounding as the money migration: shortest decimal form, half up
+    return int((Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _backfill(bind, rollups):
+    now = datetime.now()
+    # The source amounts are still float pesos at this revision
+    to_total = _to_cents if _total_in_cents(bind) else float
+    rows = []
+    for kind, table_name, date_name in SOURCES:
+        source = sa.table(
+            table_name,
+            sa.column('id'), sa.column('user_id'), sa.column('category_id'),
+            sa.column('amount'), sa.column(date_name),
+        )
+        year = sa.extract('year', source.c[date_name])
+        month = sa.extract('month', source.c[date_name])
+        stmt = sa.select(
+            source.c.user_id,
+            year.label('year'),
+            month.label('month'),
+            source.c.category_id,
+            sa.func.sum(source.c.amount).label('total'),
+            sa.func.count(source.c.id).label('count'),
+        ).group_by(source.c.user_id, year, month, source.c.category_id)
+        for r in bind.execute(stmt):
+            rows.append({
+                'user_id': r.user_id,
+                'month': date(int(r.year), int(r.month), 1),
+                'kind': kind,
+                'category_id': r.category_id,
+                'total': to_total(r.total),
+                'count': r.count,
+                'updated_at': now,
+            })
+    if rows:
+        op.bulk_insert(rollups, rows)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    # The table may already exist when it was created by db.create_all()
+    if 'monthly_rollups' not in inspector.get_table_names():
+        op.create_table(
+            'monthly_rollups',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('month', sa.Date(), nullable=False),
+            sa.Column('kind', sa.Enum('income', 'expense'), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=False),
+            sa.Column('total', sa.Float(), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id', 'month', 'kind', 'category_id', name='uq_monthly_rollups_user_month_kind_category'),
+        )
+
+    rollups = sa.table(
+        'monthly_rollups',
+        sa.column('user_id'), sa.column('month'), sa.column('kind'),
+        sa.column('category_id'), sa.column('total'), sa.column('count'),
+        sa.column('updated_at'),
+    )
+    if bind.execute(sa.select(sa.func.count()).select_from(rollups)).scalar() == 0:
+        _backfill(bind, rollups)
+
+
+def downgrade():
+    op.drop_table('monthly_rollups')
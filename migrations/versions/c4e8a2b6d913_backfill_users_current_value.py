@@ -0,0 +1,48 @@
+"""backfill users current_value
+
+Revision ID: c4e8a2b6d913
+Revises: b7d2f4a1c302
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a2b6d913'
+down_revision = 'b7d2f4a1c302'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # current_value was never maintained before this revision; seed it with
+    # income - expenses - saving deposits so the running deltas start right
+    users = sa.table('users', sa.column('id'), sa.column('current_value'))
+    income = sa.table('income', sa.column('id'), sa.column('user_id'), sa.column('amount'))
+    expenses = sa.table('expenses', sa.column('user_id'), sa.column('amount'))
+    saving = sa.table('saving_transactions', sa.column('user_id'), sa.column('income_id'), sa.column('txt_type'))
+
+    total_income = (
+        sa.select(sa.func.coalesce(sa.func.sum(income.c.amount), 0))
+        .where(income.c.user_id == users.c.id)
+        .scalar_subquery()
+    )
+    total_expense = (
+        sa.select(sa.func.coalesce(sa.func.sum(expenses.c.amount), 0))
+        .where(expenses.c.user_id == users.c.id)
+        .scalar_subquery()
+    )
+    total_deposits = (
+        sa.select(sa.func.coalesce(sa.func.sum(income.c.amount), 0))
+        .select_from(income.join(saving, saving.c.income_id == income.c.id))
+        .where(saving.c.user_id == users.c.id, saving.c.txt_type == 'deposit')
+        .scalar_subquery()
+    )
+    op.execute(users.update().values(current_value=total_income - total_expense - total_deposits))
+
+
+def downgrade():
+    # Data-only revision; the previous (stale) values cannot be restored
+    pass
@@ -0,0 +1,67 @@
+"""add transaction archive tables
+
+Revision ID: d91f3c7a2e40
+Revises: c4e8a2b6d913
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91f3c7a2e40'
+down_revision = 'c4e8a2b6d913'
+branch_labels = None
+depends_on = None
+
+
+PAYMENT_METHODS = ('cash', 'gcash', 'bank', 'card', 'other')
+
+
+def _create_archive(name, counterpart_column, date_column, index_name):
+    # Ids are copied from the hot table, so no auto increment
+    op.create_table(
+        name,
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=80), nullable=False),
+        counterpart_column,
+        sa.Column('amount', sa.Float(), nullable=False),
+        date_column,
+        sa.Column('payment_method', sa.Enum(*PAYMENT_METHODS), nullable=True),
+        sa.Column('remarks', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(index_name, name, ['user_id', date_column.name])
+
+
+def upgrade():
+    # The tables may already exist when they were created by db.create_all()
+    existing = sa.inspect(op.get_bind()).get_table_names()
+    if 'expenses_archive' not in existing:
+        _create_archive(
+            'expenses_archive',
+            sa.Column('payee', sa.String(length=32), nullable=False),
+            sa.Column('expense_date', sa.DateTime(), nullable=True),
+            'ix_expenses_archive_user_id_expense_date',
+        )
+    if 'income_archive' not in existing:
+        _create_archive(
+            'income_archive',
+            sa.Column('source', sa.String(length=55), nullable=False),
+            sa.Column('received_date', sa.Date(), nullable=True),
+            'ix_income_archive_user_id_received_date',
+        )
+
+
+def downgrade():
+    # Put archived rows back into the hot tables before dropping the archive
+    for hot, archive in (('income', 'income_archive'), ('expenses', 'expenses_archive')):
+        columns = ', '.join(c['name'] for c in sa.inspect(op.get_bind()).get_columns(archive))
+        op.execute(f'INSERT INTO {hot} ({columns}) SELECT {columns} FROM {archive}')
+        op.drop_table(archive)
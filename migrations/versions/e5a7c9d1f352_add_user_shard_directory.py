@@ -0,0 +1,48 @@
+"""add user shard directory
+
+Revision ID: e5a7c9d1f352
+Revises: d91f3c7a2e40
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a7c9d1f352'
+down_revision = 'd91f3c7a2e40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.info.get('shard'):
+        # The directory lives on the primary only
+        return
+
+    # The table may already exist when it was created by db.create_all()
+    if 'user_shards' not in sa.inspect(bind).get_table_names():
+        op.create_table(
+            'user_shards',
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('email', sa.String(length=100), nullable=False),
+            sa.Column('shard', sa.String(length=32), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('user_id'),
+            sa.UniqueConstraint('email'),
+        )
+
+    # Existing users live on the primary (shard NULL); registering them keeps
+    # the directory's ids ahead of theirs
+    op.execute(
+        'INSERT INTO user_shards (user_id, email) '
+        'SELECT id, email FROM users WHERE id NOT IN (SELECT user_id FROM user_shards)'
+    )
+
+
+def downgrade():
+    if op.get_bind().info.get('shard'):
+        return
+    op.drop_table('user_shards')
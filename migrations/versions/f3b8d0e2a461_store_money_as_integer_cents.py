@@ -0,0 +1,117 @@
+"""store money as integer cents
+
+Revision ID: f3b8d0e2a461
+Revises: e5a7c9d1f352
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d0e2a461'
+down_revision = 'e5a7c9d1f352'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) of every amount column
+MONEY_COLUMNS = [
+    ('users', 'current_value'),
+    ('debts', 'principal'),
+    ('saving_goals', 'target_amount'),
+    ('income', 'amount'),
+    ('income_archive', 'amount'),
+    ('expenses', 'amount'),
+    ('expenses_archive', 'amount'),
+    ('monthly_rollups', 'total'),
+]
+
+CHUNK_SIZE = 5000
+
+
+def _to_cents(value):
+    # Same rounding as Money.of(): the float's shortest decimal form, half up
+    return int((Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _column_type(table, column):
+    for c in sa.inspect(op.get_bind()).get_columns(table):
+        if c['name'] == column:
+            return c['type']
+    return None
+
+
+def _id_chunks(table):
+    """(low, high) id ranges covering the table, CHUNK_SIZE ids at a time"""
+    t = sa.table(table, sa.column('id'))
+    low, high = op.get_bind().execute(sa.select(sa.func.min(t.c.id), sa.func.max(t.c.id))).one()
+    if low is None:
+        return
+    for start in range(low, high + 1, CHUNK_SIZE):
+        yield start, start + CHUNK_SIZE
+
+
+def _backfill_cents(table, column, where):
+    """Write column * 100 into the cents column for the rows matching ``where``"""
+    bind = op.get_bind()
+    t = sa.table(table, sa.column('id'), sa.column(column), sa.column(f'{column}_cents'))
+    rows = bind.execute(sa.select(t.c.id, t.c[column]).where(where(t))).all()
+    if rows:
+        bind.execute(
+            sa.update(t).where(t.c.id == sa.bindparam('row_id')).values({f'{column}_cents': sa.bindparam('cents')}),
+            [{'row_id': row_id, 'cents': _to_cents(value)} for row_id, value in rows],
+        )
+
+
+def _swap(table, column, new_column, new_type):
+    with op.batch_alter_table(table) as batch:
+        batch.drop_column(column)
+        batch.alter_column(new_column, new_column_name=column, existing_type=new_type, nullable=False)
+
+
+def upgrade():
+    pending = []
+    for table, column in MONEY_COLUMNS:
+        # Already BIGINT when the table was created by db.create_all() from
+        # the current models
+        if isinstance(_column_type(table, column), sa.Numeric):
+            pending.append((table, column))
+            op.add_column(table, sa.Column(f'{column}_cents', sa.BigInteger(), nullable=True))
+
+    # Online backfill: one short transaction per id range, so the old code
+    # can keep writing while it runs
+    with op.get_context().autocommit_block():
+        for table, column in pending:
+            for low, high in _id_chunks(table):
+                _backfill_cents(table, column, lambda t: sa.and_(t.c.id >= low, t.c.id < high))
+
+    # Catch up on rows inserted or changed since their chunk was copied,
+    # then swap the columns
+    for table, column in pending:
+        _backfill_cents(
+            table,
+            column,
+            lambda t: sa.or_(
+                t.c[f'{column}_cents'].is_(None),
+                sa.func.abs(t.c[column] * 100 - t.c[f'{column}_cents']) > 0.5,
+            ),
+        )
+        _swap(table, column, f'{column}_cents', sa.BigInteger())
+
+
+def downgrade():
+    for table, column in reversed(MONEY_COLUMNS):
+        if isinstance(_column_type(table, column), sa.Numeric):
+            continue
+        op.add_column(table, sa.Column(f'{column}_float', sa.Float(), nullable=True))
+        t = sa.table(table, sa.column('id'), sa.column(column), sa.column(f'{column}_float'))
+        for low, high in _id_chunks(table):
+            op.execute(
+                sa.update(t)
+                .where(t.c.id >= low, t.c.id < high)
+                .values({f'{column}_float': t.c[column] / 100.0})
+            )
+        _swap(table, column, f'{column}_float', sa.Float())
@@ -0,0 +1,109 @@
+"""Shared fixtures: the app on a throwaway SQLite file and a SQL statement counter
+
+ApplicationConfig reads the environment at import time, so the test
+settings are put in place before the app package is imported.
+"""
+import os
+import re
+import tempfile
+import uuid
+import pytest
+
+TEST_DIR = tempfile.mkdtemp(prefix="finance-tests-")
+os.environ.update({
+    "DATABASE_URI": f"sqlite:///{TEST_DIR}/app.db",
+    "SECRET_KEY": "test",
+    "SESSION_TYPE": "sqlalchemy",
+    "SESSION_PERMANENT": "false",
+    "SESSION_USE_SIGNER": "false",
+    "PERMANENT_SESSION_LIFETIME": "1",
+    "SESSION_PURGE_INTERVAL": "0",
+    # Count the queries the code sends, not what a warm cache saves
+    "QUERY_CACHE_TYPE": "null",
+    "QUERY_CACHE_DIR": f"{TEST_DIR}/query-cache",
+})
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from app import create_app  # noqa: E402
+
+PASSWORD = "password1"
+_SESSION_TABLE = re.compile(r"\bsessions\b")
+
+
+class StatementCounter:
+    """Every statement sent to any engine (sync or async) while active"""
+
+    def __init__(self):
+        self.statements = []
+        self.parameters = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    def clear(self):
+        self.statements.clear()
+        self.parameters.clear()
+
+    @property
+    def queries(self):
+        """Statements other than the session backend's own"""
+        return [s for s in self.statements if not _SESSION_TABLE.search(s)]
+
+
+@pytest.fixture(scope="session")
+def app():
+    return create_app()
+
+
+@pytest.fixture
+def statements():
+    counter = StatementCounter()
+    # Listening on the Engine class also covers the async engines' sync_engine
+    event.listen(Engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(Engine, "before_cursor_execute", counter)
+
+
+@pytest.fixture
+def client(app):
+    """A test client logged in as a new user with one expense and one income category"""
+    client = app.test_client()
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    client.post("/registration", data={
+        "firstname": "Test", "lastname": "User", "email": email,
+        "password": PASSWORD, "password2": PASSWORD,
+    })
+    client.post("/login", data={"email": email, "password": PASSWORD})
+    client.post("/insert_expense_category", data={"name": "Food"})
+    client.post("/insert_income_category", data={"name": "Salary"})
+    with client.session_transaction() as session:
+        client.user_id = session["user_id"]
+    client.email = email
+    return client
+
+
+def category_id(client, app, category_type):
+    from app.service import UOW
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        return UOW.categories.get_all_by_user_and_type(client.user_id, category_type)[0].id
+
+
+def add_expenses(client, app, count, amount="12.50"):
+    cid = category_id(client, app, "expense")
+    for i in range(count):
+        client.post("/insert_expense", data={
+            "category_id": cid, "name": f"Lunch {i}", "payee": "Cafe", "amount": amount,
+            "expense_date": f"2026-01-{i % 28 + 1:02d}", "payment_method": "cash",
+        })
+
+
+def add_incomes(client, app, count, amount="100"):
+    cid = category_id(client, app, "income")
+    for i in range(count):
+        client.post("/insert_income", data={
+            "category_id": cid, "name": f"Pay {i}", "source": "Boss", "amount": amount,
+            "received_date": f"2026-02-{i % 28 + 1:02d}", "payment_method": "bank",
+        })
@@ -0,0 +1,122 @@
+-- Schema created by db.create_all() at the baseline commit (SQLite)
+
+CREATE TABLE users (
+	id INTEGER NOT NULL, 
+	firstname VARCHAR(32) NOT NULL, 
+	lastname VARCHAR(32) NOT NULL, 
+	email VARCHAR(100) NOT NULL, 
+	password_hash VARCHAR(255) NOT NULL, 
+	current_value FLOAT NOT NULL, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id), 
+	UNIQUE (email)
+);
+
+CREATE TABLE debts (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	lender VARCHAR(150) NOT NULL, 
+	principal FLOAT NOT NULL, 
+	name VARCHAR(30) NOT NULL, 
+	interest_rate FLOAT NOT NULL, 
+	start_date DATE, 
+	due_date DATE, 
+	status VARCHAR(6), 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+
+CREATE TABLE categories (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	type VARCHAR(7) NOT NULL, 
+	name VARCHAR(32) NOT NULL, 
+	description VARCHAR(255), 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+
+CREATE TABLE saving_goals (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	name VARCHAR(120) NOT NULL, 
+	target_amount FLOAT NOT NULL, 
+	target_date DATE NOT NULL, 
+	created_at DATETIME, 
+	remarks VARCHAR(255), 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE, 
+	UNIQUE (name)
+);
+
+CREATE TABLE admin (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	date_created DATETIME, 
+	PRIMARY KEY (id), 
+	UNIQUE (user_id), 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE
+);
+
+CREATE TABLE income (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	category_id INTEGER NOT NULL, 
+	name VARCHAR(80) NOT NULL, 
+	source VARCHAR(55) NOT NULL, 
+	amount FLOAT NOT NULL, 
+	received_date DATE, 
+	payment_method VARCHAR(5), 
+	remarks VARCHAR(255), 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE, 
+	FOREIGN KEY(category_id) REFERENCES categories (id) ON DELETE CASCADE
+);
+
+CREATE TABLE expenses (
+	id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	category_id INTEGER NOT NULL, 
+	name VARCHAR(80) NOT NULL, 
+	payee VARCHAR(32) NOT NULL, 
+	amount FLOAT NOT NULL, 
+	expense_date DATETIME, 
+	payment_method VARCHAR(5), 
+	remarks VARCHAR(255), 
+	created_at DATETIME, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE, 
+	FOREIGN KEY(category_id) REFERENCES categories (id) ON DELETE CASCADE
+);
+
+CREATE TABLE debt_payments (
+	id INTEGER NOT NULL, 
+	debt_id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	income_id INTEGER, 
+	expense_id INTEGER, 
+	pymt_type VARCHAR(8) NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(debt_id) REFERENCES debts (id) ON DELETE CASCADE, 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE, 
+	FOREIGN KEY(income_id) REFERENCES income (id) ON DELETE CASCADE, 
+	FOREIGN KEY(expense_id) REFERENCES expenses (id) ON DELETE CASCADE
+);
+
+CREATE TABLE saving_transactions (
+	id INTEGER NOT NULL, 
+	goal_id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	txt_type VARCHAR(8) NOT NULL, 
+	income_id INTEGER, 
+	expense_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(goal_id) REFERENCES saving_goals (id) ON DELETE CASCADE, 
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE, 
+	FOREIGN KEY(income_id) REFERENCES income (id) ON DELETE CASCADE, 
+	FOREIGN KEY(expense_id) REFERENCES expenses (id) ON DELETE CASCADE
+);
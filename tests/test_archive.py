@@ -0,0 +1,34 @@
+"""Reads only reach into the archive tables when a user has archived rows"""
+from datetime import date
+from app.service import UOW
+from conftest import add_expenses
+
+
+def _boundary_lookups(statements):
+    return [s for s in statements.queries if "max(expenses_archive.expense_date)" in s]
+
+
+def test_archive_boundary_is_read_once_per_session(app, client, statements):
+    add_expenses(client, app, 3)
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        statements.clear()
+        UOW.expenses.get_all_by_user_id(client.user_id)
+        UOW.expenses.get_summaries_by_user_id(client.user_id)
+        UOW.expenses.calculate_total_by_user_id(client.user_id)
+        assert len(_boundary_lookups(statements)) == 1
+        # Only the hot table is read for a user with nothing archived
+        assert not [s for s in statements.queries if "FROM expenses_archive" in s and "max(" not in s]
+
+
+def test_archiving_forgets_the_boundary(app, client, statements):
+    add_expenses(client, app, 3)
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        assert len(UOW.expenses.get_all_by_user_id(client.user_id)) == 3
+        with UOW.transaction():
+            while UOW.expenses.archive_before(date(2100, 1, 1)):
+                pass
+        statements.clear()
+        assert len(UOW.expenses.get_all_by_user_id(client.user_id)) == 3
+        assert len(_boundary_lookups(statements)) == 1
@@ -0,0 +1,91 @@
+"""Monthly rollups and the running balance follow every write path"""
+from datetime import date
+from app.domain.entities import SavingGoal
+from app.domain.money import Money
+from app.service import UOW
+from conftest import add_expenses, add_incomes
+
+
+def _totals(app, user_id):
+    with app.test_request_context():
+        UOW.route_to_user(user_id=user_id)
+        return UOW.monthly_rollups.get_totals_by_user_id(user_id), UOW.users.get_current_value(user_id)
+
+
+def _first_id(app, user_id, repository):
+    with app.test_request_context():
+        UOW.route_to_user(user_id=user_id)
+        return getattr(UOW, repository).get_all_by_user_id(user_id)[0].id
+
+
+def test_deleting_an_expense_reverses_rollup_and_balance(app, client):
+    add_incomes(client, app, 1, amount="100")
+    add_expenses(client, app, 2, amount="12.50")
+    rollups, balance = _totals(app, client.user_id)
+    assert rollups["expense"] == Money.of("25.00")
+    assert balance == Money.of("75.00")
+
+    response = client.post(f"/delete_expense/{_first_id(app, client.user_id, 'expenses')}")
+    assert response.status_code == 302
+    assert "error_message" not in response.location
+
+    rollups, balance = _totals(app, client.user_id)
+    assert rollups["expense"] == Money.of("12.50")
+    assert balance == Money.of("87.50")
+
+
+def test_deleting_an_income_reverses_rollup_and_balance(app, client):
+    add_incomes(client, app, 2, amount="100")
+    add_expenses(client, app, 1, amount="12.50")
+
+    response = client.post(f"/delete_income/{_first_id(app, client.user_id, 'incomes')}")
+    assert response.status_code == 302
+    assert "error_message" not in response.location
+
+    rollups, balance = _totals(app, client.user_id)
+    assert rollups["income"] == Money.of("100.00")
+    assert balance == Money.of("87.50")
+
+
+def test_saving_deposit_counts_against_the_balance(app, client):
+    add_incomes(client, app, 2, amount="100")
+    income_id = _first_id(app, client.user_id, "incomes")
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        with UOW.transaction():
+            goal = UOW.saving_goals.save(SavingGoal(
+                user_id=client.user_id, name="Emergency fund",
+                target_amount=Money.of("1000"), target_date=date(2027, 1, 1),
+            ))
+
+    response = client.post("/saving_transaction", data={
+        "goal_id": goal.id, "txt_type": "deposit", "income_id": income_id,
+    })
+    assert response.status_code == 302
+    assert "error_message" not in response.location
+
+    _, balance = _totals(app, client.user_id)
+    assert balance == Money.of("100.00")
+    # The running balance matches a full recount
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        with UOW.transaction():
+            UOW.users.reconcile_current_value(client.user_id)
+    _, reconciled = _totals(app, client.user_id)
+    assert reconciled == balance
+
+
+def test_deleting_another_users_expense_is_refused(app, client):
+    add_expenses(client, app, 1)
+    expense_id = _first_id(app, client.user_id, "expenses")
+    other = app.test_client()
+    other.post("/registration", data={
+        "firstname": "Other", "lastname": "User", "email": f"other-{client.email}",
+        "password": "password1", "password2": "password1",
+    })
+    other.post("/login", data={"email": f"other-{client.email}", "password": "password1"})
+
+    response = other.post(f"/delete_expense/{expense_id}")
+    assert "error_message" in response.location
+    rollups, _ = _totals(app, client.user_id)
+    assert rollups["expense"] == Money.of("12.50")
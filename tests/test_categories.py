@@ -0,0 +1,18 @@
+"""Category writes inside a unit of work"""
+import pytest
+from app.domain.entities import Category
+from app.repositories.exceptions import EntityAlreadyExistsError
+from app.service import UOW
+
+
+def test_duplicate_category_leaves_the_unit_of_work_usable(app, client):
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        with UOW.transaction():
+            with pytest.raises(EntityAlreadyExistsError):
+                UOW.categories.save(Category(user_id=client.user_id, type="expense", name="Food"))
+            saved = UOW.categories.save(Category(user_id=client.user_id, type="expense", name="Rent"))
+
+        names = [c.name for c in UOW.categories.get_all_by_user_and_type(client.user_id, "expense")]
+        assert saved.id is not None
+        assert sorted(names) == ["Food", "Rent"]
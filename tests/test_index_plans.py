@@ -0,0 +1,35 @@
+"""The per-user composite indexes back the repository queries that filter on them"""
+import pytest
+from app.ext import db
+from app.service import UOW
+
+# (repository call, index the planner must pick)
+CASES = [
+    (lambda uow, uid: uow.expenses.get_list_page_by_user_id(uid, 20), "ix_expenses_user_id_expense_date"),
+    (lambda uow, uid: uow.incomes.get_list_page_by_user_id(uid, 20), "ix_income_user_id_received_date"),
+    (lambda uow, uid: uow.categories.get_all_by_user_and_type(uid, "expense"), "(user_id=? AND type=?)"),
+    (lambda uow, uid: uow.categories.get_by_name_and_user_id("Food", uid), "ix_categories_user_id_name"),
+    (lambda uow, uid: uow.debts.get_active_by_user_id(uid), "ix_debts_user_id_status"),
+    (lambda uow, uid: uow.saving_transactions.get_all_by_user_and_type(uid, "deposit"), "ix_saving_transactions_user_id_txt_type"),
+]
+
+
+def _query_plan(statement, parameters):
+    connection = db.engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return " | ".join(row[-1] for row in cursor.fetchall())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("call, index", CASES)
+def test_repository_query_uses_composite_index(app, client, statements, call, index):
+    with app.test_request_context():
+        UOW.route_to_user(user_id=client.user_id)
+        statements.clear()
+        call(UOW, client.user_id)
+        assert statements.statements
+        plans = [_query_plan(s, p) for s, p in zip(statements.statements, statements.parameters)]
+    assert any(index in plan for plan in plans), plans
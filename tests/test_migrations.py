@@ -0,0 +1,106 @@
+"""Upgrading a database created by the baseline app (before any migration)"""
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_SCHEMA = Path(__file__).resolve().parent / "fixtures" / "baseline_schema.sql"
+
+
+def _baseline_database(path):
+    """A database created by the baseline app, holding one user's data"""
+    connection = sqlite3.connect(path)
+    connection.executescript(BASELINE_SCHEMA.read_text())
+    connection.executescript("""
+        INSERT INTO users (id, firstname, lastname, email, password_hash, current_value)
+            VALUES (1, 'Ann', 'Lee', 'ann@example.com', 'x', 0);
+        INSERT INTO categories (id, user_id, type, name) VALUES (1, 1, 'income', 'Salary');
+        INSERT INTO categories (id, user_id, type, name) VALUES (2, 1, 'expense', 'Food');
+        INSERT INTO income (user_id, category_id, name, source, amount, received_date, payment_method)
+            VALUES (1, 1, 'Pay', 'Boss', 1000.5, '2026-01-15', 'bank');
+        INSERT INTO expenses (user_id, category_id, name, payee, amount, expense_date, payment_method)
+            VALUES (1, 2, 'Lunch', 'Cafe', 10.25, '2026-01-03 00:00:00.000000', 'cash');
+        INSERT INTO expenses (user_id, category_id, name, payee, amount, expense_date, payment_method)
+            VALUES (1, 2, 'Dinner', 'Cafe', 20.5, '2026-01-04 00:00:00.000000', 'cash');
+    """)
+    connection.commit()
+    connection.close()
+
+
+def _upgrade(path, **env):
+    env = dict(os.environ, DATABASE_URI=f"sqlite:///{path}", FLASK_APP="run.py", **env)
+    result = subprocess.run(
+        [sys.executable, "-m", "flask", "db", "upgrade"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def upgraded_baseline(tmp_path):
+    """A baseline database with one user's data, after `flask db upgrade`"""
+    path = tmp_path / "baseline.db"
+    _baseline_database(path)
+    _upgrade(path)
+    connection = sqlite3.connect(path)
+    yield connection
+    connection.close()
+
+def test_upgrade_stores_amounts_in_cents(upgraded_baseline):
+    incomes = upgraded_baseline.execute("SELECT amount FROM income").fetchall()
+    expenses = upgraded_baseline.execute("SELECT amount FROM expenses ORDER BY id").fetchall()
+    assert incomes == [(100050,)]
+    assert expenses == [(1025,), (2050,)]
+
+
+def test_upgrade_backfills_rollups_in_cents(upgraded_baseline):
+    rollups = dict(upgraded_baseline.execute(
+        "SELECT kind, total FROM monthly_rollups WHERE user_id = 1"
+    ).fetchall())
+    assert rollups == {"income": 100050, "expense": 3075}
+
+
+def test_upgrade_backfills_balance_in_cents(upgraded_baseline):
+    balance, = upgraded_baseline.execute("SELECT current_value FROM users WHERE id = 1").fetchone()
+    assert balance == 100050 - 3075
+
+
+def test_upgrade_never_reuses_archived_ids(upgraded_baseline):
+    for table in ("expenses", "income"):
+        ddl, = upgraded_baseline.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        assert "AUTOINCREMENT" in ddl.upper()
+
+    # Archive the newest expense the way move_to_archive does, then insert
+    upgraded_baseline.executescript("""
+        INSERT INTO expenses_archive SELECT * FROM expenses WHERE id = 2;
+        DELETE FROM expenses WHERE id = 2;
+        INSERT INTO expenses (user_id, category_id, name, payee, amount, expense_date, payment_method)
+            VALUES (1, 2, 'Snack', 'Cafe', 300, '2026-01-05 00:00:00.000000', 'cash');
+    """)
+    new_id, = upgraded_baseline.execute("SELECT id FROM expenses WHERE name = 'Snack'").fetchone()
+    assert new_id == 3
+
+
+def test_upgrade_migrates_every_shard(tmp_path):
+    primary, shard = tmp_path / "primary.db", tmp_path / "shard.db"
+    _baseline_database(primary)
+    _baseline_database(shard)
+    _upgrade(primary, SHARD_DATABASE_URIS=f"sqlite:///{shard}")
+
+    connection = sqlite3.connect(shard)
+    try:
+        versions = connection.execute("SELECT version_num FROM alembic_version").fetchall()
+        expenses = connection.execute("SELECT amount FROM expenses ORDER BY id").fetchall()
+        tables = {name for name, in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    finally:
+        connection.close()
+    head, = sqlite3.connect(primary).execute("SELECT version_num FROM alembic_version").fetchone()
+    assert versions == [(head,)]
+    assert expenses == [(1025,), (2050,)]
+    # The directory stays on the primary
+    assert "user_shards" not in tables
@@ -0,0 +1,14 @@
+"""GET /internal/pool-stats covers the sync and the async engines"""
+
+
+def test_pool_stats_include_the_async_pools(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, "INTERNAL_STATS_TOKEN", "secret")
+    assert client.get("/dashboard").status_code == 200
+
+    response = client.get("/internal/pool-stats", headers={"X-Internal-Token": "secret"})
+    assert response.status_code == 200
+    stats = response.get_json()
+    assert stats["engines"]["primary"]["pool"] == "TimedQueuePool"
+    primary = stats["async_engines"]["primary"]
+    assert primary["pool"] == "TimedAsyncAdaptedQueuePool"
+    assert primary["checkouts"] > 0
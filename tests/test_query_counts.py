@@ -0,0 +1,74 @@
+"""Query counts of the hot request paths, independent of how many rows a user has"""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+from conftest import PASSWORD, add_expenses, add_incomes
+
+
+def _page_queries(client, statements, path):
+    statements.clear()
+    response = client.get(path)
+    assert response.status_code == 200
+    return len(statements.queries)
+
+
+@pytest.mark.parametrize("path", ["/expense", "/income"])
+def test_list_pages_cost_constant_queries(app, client, statements, path):
+    add_expenses(client, app, 3)
+    add_incomes(client, app, 3)
+    few = _page_queries(client, statements, path)
+
+    add_expenses(client, app, 40)
+    add_incomes(client, app, 40)
+    many = _page_queries(client, statements, path)
+
+    assert many == few
+    assert many <= 4
+
+
+def test_dashboard_costs_constant_queries(app, client, statements):
+    add_expenses(client, app, 3)
+    add_incomes(client, app, 3)
+    few = _page_queries(client, statements, "/dashboard")
+
+    add_expenses(client, app, 40)
+    add_incomes(client, app, 40)
+    many = _page_queries(client, statements, "/dashboard")
+
+    assert many == few
+    assert many <= 2
+
+
+def test_async_views_reuse_pooled_connections(app, client):
+    add_expenses(client, app, 3)
+    client.get("/dashboard")
+    connects = []
+
+    def count(*args):
+        connects.append(1)
+
+    event.listen(Pool, "connect", count)
+    try:
+        for _ in range(5):
+            assert client.get("/dashboard").status_code == 200
+    finally:
+        event.remove(Pool, "connect", count)
+    assert connects == []
+
+
+def test_login_costs_one_user_lookup(app, client, statements):
+    client.get("/logout")
+    statements.clear()
+    response = client.post("/login", data={"email": client.email, "password": PASSWORD})
+    assert response.status_code == 302
+    assert len(statements.queries) == 1
+    assert "users.email = ?" in statements.queries[0]
+
+
+def test_authenticated_requests_reuse_the_resolved_user(app, client, statements):
+    client.get("/expense")
+    statements.clear()
+    client.get("/expense")
+    client.get("/dashboard")
+    # The dashboard summary joins users for the balance; only full user rows count
+    assert not [q for q in statements.queries if q.startswith("SELECT users.id, users.firstname")]
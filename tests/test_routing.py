@@ -0,0 +1,52 @@
+"""Which database each statement goes to once shards and replicas are configured"""
+import pytest
+from sqlalchemy import select, update
+from app import create_app
+from app.config import ApplicationConfig
+from app.ext import db
+from app.model.m_Expenses import Expenses
+from app.model.m_UserShards import UserShards
+from app.service import UOW
+
+
+@pytest.fixture
+def sharded_app(tmp_path, monkeypatch):
+    """Two shards, only the first with a replica of its own, and a primary replica"""
+    def uri(name):
+        return f"sqlite:///{tmp_path / name}.db"
+
+    binds = {
+        "replica": uri("replica"),
+        "shard_0": uri("shard_0"),
+        "shard_1": uri("shard_1"),
+        "shard_0_replica": uri("shard_0_replica"),
+    }
+    monkeypatch.setattr(ApplicationConfig, "SQLALCHEMY_BINDS", binds)
+    monkeypatch.setattr(ApplicationConfig, "SHARD_BINDS", ["shard_0", "shard_1"])
+    monkeypatch.setattr(ApplicationConfig, "SHARD_REPLICA_BINDS", ["shard_0_replica"])
+    # The sessions table is already declared on db.metadata by the main app
+    monkeypatch.setattr(ApplicationConfig, "SESSION_TYPE", "cookie")
+    return create_app()
+
+
+def _engine_for(statement):
+    engine = db.session.get_bind(clause=statement)
+    return next(key for key, candidate in db.engines.items() if candidate is engine)
+
+
+def test_shard_reads_use_the_shards_own_replica(sharded_app):
+    with sharded_app.test_request_context():
+        UOW.shard_router.route("shard_0")
+        with UOW.read_only():
+            assert _engine_for(select(Expenses)) == "shard_0_replica"
+            # The directory lives on the primary, so its replica serves it
+            assert _engine_for(select(UserShards)) == "replica"
+            assert _engine_for(update(Expenses).values(name="x")) == "shard_0"
+        assert _engine_for(select(Expenses)) == "shard_0"
+
+
+def test_shard_without_replica_never_reads_the_primarys_replica(sharded_app):
+    with sharded_app.test_request_context():
+        UOW.shard_router.route("shard_1")
+        with UOW.read_only():
+            assert _engine_for(select(Expenses)) == "shard_1"
@@ -0,0 +1,39 @@
+"""The shard directory stays in step with the users table"""
+import uuid
+from app.domain.entities import User
+from app.ext import db
+from app.model.m_UserShards import UserShards
+from app.service import UOW
+
+
+def _new_user(email=None):
+    email = email or f"{uuid.uuid4().hex[:12]}@example.com"
+    return User(firstname="Bulk", lastname="User", email=email, password_hash="x")
+
+
+def test_save_many_allocates_ids_from_the_directory(app):
+    users = [_new_user(), _new_user()]
+    with app.test_request_context():
+        with UOW.transaction():
+            UOW.users.save_many(users)
+        directory = dict(
+            db.session.query(UserShards.email, UserShards.user_id)
+            .filter(UserShards.email.in_([u.email for u in users]))
+            .all()
+        )
+        assert directory == {u.email: u.id for u in users}
+        assert [UOW.users.get_by_id(u.id).email for u in users] == [u.email for u in users]
+
+
+def test_delete_removes_the_directory_row(app):
+    user = _new_user()
+    with app.test_request_context():
+        with UOW.transaction():
+            UOW.route_new_user(user)
+            UOW.users.save(user)
+        with UOW.transaction():
+            UOW.users.delete(user.id)
+        assert db.session.get(UserShards, user.id) is None
+        # The email can be registered again
+        with UOW.transaction():
+            UOW.route_new_user(_new_user(user.email))